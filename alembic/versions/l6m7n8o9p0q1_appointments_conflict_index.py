@@ -0,0 +1,32 @@
+"""appointments conflict index
+
+Revision ID: l6m7n8o9p0q1
+Revises: k5l6m7n8o9p0
+Create Date: 2026-07-02 00:00:00.000000
+
+Additive: composite index covering the provider-overlap predicate used by
+services.appointments (clinic_id, provider_id, status IN (...),
+start_time < end, end_time > start) so the EXISTS probe is an index
+range scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "l6m7n8o9p0q1"
+down_revision: Union[str, Sequence[str], None] = "k5l6m7n8o9p0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_appointments_clinic_provider_status_time",
+        "appointments",
+        ["clinic_id", "provider_id", "status", "start_time", "end_time"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_appointments_clinic_provider_status_time", table_name="appointments")
@@ -0,0 +1,53 @@
+"""patients phone_normalized
+
+Revision ID: m7n8o9p0q1r2
+Revises: l6m7n8o9p0q1
+Create Date: 2026-07-03 00:00:00.000000
+
+Additive: `patients.phone_normalized` holds the last 10 digits of `phone`
+(database.models.phone_match_key) so /api/patients/verify matches with an
+indexed equality instead of a leading-wildcard LIKE plus a Python re-check.
+The ORM keeps it in sync on every write; existing rows are backfilled here.
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "m7n8o9p0q1r2"
+down_revision: Union[str, Sequence[str], None] = "l6m7n8o9p0q1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("patients", sa.Column("phone_normalized", sa.String(), nullable=True))
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            "UPDATE patients "
+            "SET phone_normalized = NULLIF(RIGHT(regexp_replace(phone, '\\D', '', 'g'), 10), '') "
+            "WHERE phone IS NOT NULL"
+        )
+    else:
+        # SQLite has no regexp_replace; dev databases are small. Same rule
+        # as database.models.phone_match_key, inlined so the migration does
+        # not depend on the current model module.
+        rows = bind.execute(sa.text("SELECT id, phone FROM patients WHERE phone IS NOT NULL")).all()
+        for patient_id, phone in rows:
+            bind.execute(
+                sa.text("UPDATE patients SET phone_normalized = :key WHERE id = :id"),
+                {"key": re.sub(r"\D", "", phone)[-10:] or None, "id": patient_id},
+            )
+    op.create_index(
+        "ix_patients_clinic_phone_normalized",
+        "patients",
+        ["clinic_id", "phone_normalized"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_patients_clinic_phone_normalized", table_name="patients")
+    op.drop_column("patients", "phone_normalized")
@@ -0,0 +1,44 @@
+"""patients name trigram indexes
+
+Revision ID: n8o9p0q1r2s3
+Revises: m7n8o9p0q1r2
+Create Date: 2026-07-04 00:00:00.000000
+
+Additive, Postgres only: pg_trgm GIN indexes on patients.first_name and
+patients.last_name. GET /api/appointments?patient_name= filters with
+`first_name ILIKE '%x%' OR last_name ILIKE '%x%'`; a leading wildcard cannot
+use a B-tree, but a gin_trgm_ops index serves ILIKE directly, so the planner
+can bitmap-OR the two index scans instead of walking the whole table. The
+filter itself stays ILIKE (same substring semantics). SQLite dev databases
+are skipped; the indexes are not declared on the model for the same reason.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "n8o9p0q1r2s3"
+down_revision: Union[str, Sequence[str], None] = "m7n8o9p0q1r2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_patients_first_name_trgm "
+        "ON patients USING gin (first_name gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_patients_last_name_trgm "
+        "ON patients USING gin (last_name gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("DROP INDEX IF EXISTS ix_patients_last_name_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_patients_first_name_trgm")
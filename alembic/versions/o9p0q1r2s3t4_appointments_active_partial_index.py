@@ -0,0 +1,44 @@
+"""appointments active-status partial index
+
+Revision ID: o9p0q1r2s3t4
+Revises: n8o9p0q1r2s3
+Create Date: 2026-07-05 00:00:00.000000
+
+Additive, Postgres only: partial index on (clinic_id, provider_id,
+start_time, end_time) restricted to the active statuses
+(services.appointments.ACTIVE_STATUSES). The provider-overlap probes filter on
+exactly that status set, and psycopg2 inlines the IN values, so the planner
+can pick this index; it only holds live bookings, so it stays small and hot
+while cancelled/completed history grows. The status list here must match
+ACTIVE_STATUSES. SQLite dev databases keep using
+ix_appointments_clinic_provider_status_time.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "o9p0q1r2s3t4"
+down_revision: Union[str, Sequence[str], None] = "n8o9p0q1r2s3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.create_index(
+        "ix_appointments_active_provider_time",
+        "appointments",
+        ["clinic_id", "provider_id", "start_time", "end_time"],
+        postgresql_where=sa.text(
+            "status IN ('SCHEDULED', 'CONFIRMED', 'PENDING_SYNC', 'PENDING')"
+        ),
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_appointments_active_provider_time", table_name="appointments")
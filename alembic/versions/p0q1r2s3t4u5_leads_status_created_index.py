@@ -0,0 +1,31 @@
+"""leads status/created index
+
+Revision ID: p0q1r2s3t4u5
+Revises: o9p0q1r2s3t4
+Create Date: 2026-07-06 00:00:00.000000
+
+Additive: (clinic_id, status, created_at) on leads so GET /api/leads?status=
+reads its page straight off the index in created_at order instead of
+sorting every lead in that status.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "p0q1r2s3t4u5"
+down_revision: Union[str, Sequence[str], None] = "o9p0q1r2s3t4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_leads_clinic_status_created",
+        "leads",
+        ["clinic_id", "status", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_leads_clinic_status_created", table_name="leads")
@@ -110,6 +110,12 @@ def scan(db: Session = Depends(get_db)):
     skipped_too_late = 0
     provider_env = os.getenv("SMS_PROVIDER", "twilio")
 
+    # Each candidate commits its own reminder row. Keeping loaded objects
+    # unexpired across those commits lets appt.clinic / appt.provider resolve
+    # from the identity map after the first appointment of a clinic/provider,
+    # instead of re-SELECTing the same rows for every candidate.
+    db.expire_on_commit = False
+
     for appt in candidates:
         # Dedup: only one reminder per (appointment, channel).
         existing = (
@@ -6,11 +6,15 @@ Provides REST API endpoints for:
 - Database CRUD operations (patients, appointments, doctors, services)
 """
 
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from database.connection import init_db
 
@@ -18,6 +22,11 @@ from database.connection import init_db
 # import them from api.main; keep the names available here.
 from api.dependencies import get_db, get_clinic_id, get_clinic  # noqa: F401
 from api.dependencies.auth import init_firebase_admin
+from api.responses import (
+    ORJSONResponse,
+    contract_detail_validation_handler,
+    orjson_http_exception_handler,
+)
 from api.serializers import _busy_block_envelope, _to_appointment_detail  # noqa: F401
 
 import logging
@@ -32,15 +41,30 @@ from api.v1.appointments.schemas import (  # noqa: F401
 
 logger = logging.getLogger("dental-receptionist")
 
+# asyncio.to_thread offloads (calendar slot computation, reminder SMS sends)
+# run on the loop's default executor. Size it explicitly instead of relying on
+# the interpreter's min(32, cpu + 4), which varies with the Cloud Run CPU
+# allocation and can oversubscribe the Twilio client or the DB pool.
+_TO_THREAD_WORKERS = int(os.getenv("TO_THREAD_WORKERS", "16"))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for FastAPI app."""
-    try:
-        init_db()
-        logger.info("Database tables ready")
-    except Exception as e:
-        logger.warning("Database init failed: %s", e)
+    _executor = ThreadPoolExecutor(
+        max_workers=_TO_THREAD_WORKERS, thread_name_prefix="to-thread"
+    )
+    asyncio.get_running_loop().set_default_executor(_executor)
+    # Deployments whose schema is owned by alembic can set SKIP_DB_INIT=1 to
+    # drop the startup schema probe from cold-start latency.
+    if os.getenv("SKIP_DB_INIT") == "1":
+        logger.info("SKIP_DB_INIT=1 — skipping init_db")
+    else:
+        try:
+            init_db()
+            logger.info("Database tables ready")
+        except Exception as e:
+            logger.warning("Database init failed: %s", e)
     try:
         init_firebase_admin()
     except Exception as e:
@@ -67,14 +91,20 @@ async def lifespan(app: FastAPI):
             stop_reminder_scheduler()
         except Exception:
             pass
+    _executor.shutdown(wait=False)
 
 
 app = FastAPI(
     title="Dental Clinic Calendar API",
     description="API for calendar and database operations",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # orjson (see api/responses.py) renders every JSON body the routers
+    # return; explicit JSONResponse call sites opt out by construction.
+    default_response_class=ORJSONResponse,
 )
+app.add_exception_handler(StarletteHTTPException, orjson_http_exception_handler)
+app.add_exception_handler(RequestValidationError, contract_detail_validation_handler)
 
 # Observability middleware (request tracing, structured logging) - registered BEFORE CORS
 from api.middleware.observability import ObservabilityMiddleware
@@ -127,7 +157,9 @@ app.include_router(_v1_leads_router)
 from api.v1.patients.router import router as _v1_patients_router
 app.include_router(_v1_patients_router)
 from api.v1.appointments.router import router as _v1_appointments_router
+from api.v1.appointments.list_cache import register_list_cache_listeners
 app.include_router(_v1_appointments_router)
+register_list_cache_listeners()
 from api.v1.calendar.router import router as _v1_calendar_router
 app.include_router(_v1_calendar_router)
 from api.v1.calls.router import router as _v1_calls_router
@@ -8,6 +8,7 @@ from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 _log = logging.getLogger(__name__)
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_db
@@ -140,8 +141,9 @@ def list_calls(
     db: Session = Depends(get_db),
 ) -> Dict[str, Any]:
     clinic = db.query(Clinic).filter(Clinic.id == clinic_id).first()
-    base_q = db.query(CallLog).filter(CallLog.clinic_id == clinic_id)
-    total = base_q.count()
+    total = db.scalar(
+        select(func.count()).select_from(CallLog).where(CallLog.clinic_id == clinic_id)
+    )
     # Patient join is scoped to the same clinic_id so a cross-tenant FK
     # (data drift / migration error) cannot leak another clinic's caller
     # name into this response. Project CLAUDE.md requires every query to
@@ -14,6 +14,7 @@ import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_db
@@ -98,7 +99,11 @@ def list_patients(
         .filter_by(clinic_id=clinic_id)
         .order_by(Patient.last_contact_at.desc().nullslast())
     )
-    total = q.count()
+    # Direct SELECT count(*) ... WHERE; Query.count() would wrap the ordered
+    # query in a subquery.
+    total = db.scalar(
+        select(func.count()).select_from(Patient).where(Patient.clinic_id == clinic_id)
+    )
     items = [_serialize_patient(p) for p in q.limit(limit).offset(offset).all()]
     return {"items": items, "total": total, "next_cursor": None}
 
@@ -17,6 +17,7 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_db
+from api.v1.clinics.resolver import invalidate_did_cache
 from database.models import Clinic, ClinicRouting
 from database.v1_1.models import ClinicClosure
 
@@ -126,6 +127,7 @@ def put_routing(
         ))
 
     db.commit()
+    invalidate_did_cache()
     # Re-fetch and serialize for the response (round-trip).
     config = db.query(ClinicRouting).filter_by(clinic_id=clinic_id).first()
     closures = (
@@ -0,0 +1,82 @@
+"""Response classes shared by every router.
+
+ORJSONResponse renders through orjson (C, SIMD UTF-8) instead of the stdlib
+json module. It is installed as the app's default_response_class in
+api/main.py, and orjson_http_exception_handler renders HTTPException bodies
+the same way; other explicit JSONResponse call sites (middleware) are
+unaffected. contract_detail_validation_handler keeps the plain-string 422
+detail that some v1 endpoints promised before their fields were parsed by
+the request model.
+"""
+from typing import Any
+
+import orjson
+from fastapi.exception_handlers import request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.requests import Request
+from starlette.responses import Response
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson.
+
+    Defined locally rather than imported from fastapi.responses because
+    FastAPI marks its own ORJSONResponse as deprecated. OPT_NON_STR_KEYS
+    matches stdlib json's handling of int dict keys (e.g. weekday maps).
+    """
+
+    media_type = "application/json"
+    option = orjson.OPT_NON_STR_KEYS
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=self.option)
+
+
+async def orjson_http_exception_handler(
+    request: Request, exc: StarletteHTTPException
+) -> Response:
+    """FastAPI's default HTTPException handler, rendered with orjson.
+
+    Same envelope ({"detail": ...}), status and headers; the difference is
+    that details may carry datetimes (e.g. 409 conflict rows) without the
+    raiser pre-formatting them.
+    """
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse(
+        {"detail": exc.detail}, status_code=exc.status_code, headers=headers
+    )
+
+
+class ContractDetailError(ValueError):
+    """ValueError raised by a request-model validator whose message is the
+    endpoint's documented 422 ``detail`` string.
+
+    Validators stay plain pydantic (model_validate outside a request still
+    gets a ValidationError); contract_detail_validation_handler turns it
+    back into {"detail": "<message>"} at the HTTP boundary.
+    """
+
+
+async def contract_detail_validation_handler(
+    request: Request, exc: RequestValidationError
+) -> Response:
+    """422 with the string detail when every error is a ContractDetailError;
+    FastAPI's default error-list body otherwise."""
+    errors = exc.errors()
+    causes = [(err.get("ctx") or {}).get("error") for err in errors]
+    if causes and all(isinstance(c, ContractDetailError) for c in causes):
+        return ORJSONResponse({"detail": str(causes[0])}, status_code=422)
+    return await request_validation_exception_handler(request, exc)
+
+
+__all__ = [
+    "ContractDetailError",
+    "ORJSONResponse",
+    "contract_detail_validation_handler",
+    "orjson_http_exception_handler",
+]
@@ -51,14 +51,18 @@ def _to_appointment_detail(
     When ``clinic`` is provided, start_time/end_time are converted to the
     clinic's local timezone with the offset attached on the wire. Without
     it the raw (naive UTC) values are passed through — only safe for
-    internal callers that handle TZ themselves."""
+    internal callers that handle TZ themselves.
+
+    Every field comes straight off the ORM row with its mapped type, so the
+    model is built with model_construct (no validation pass); FastAPI still
+    checks it against the route's response_model on the way out."""
     provider_name = None
     if apt.provider:
         provider_name = " ".join(filter(None, [apt.provider.title, apt.provider.name])).strip() or apt.provider.name
     service_name = apt.service.name if apt.service else None
     start = to_clinic_local(apt.start_time, clinic) if clinic else apt.start_time
     end = to_clinic_local(apt.end_time, clinic) if clinic else apt.end_time
-    return AppointmentDetailResponse(
+    return AppointmentDetailResponse.model_construct(
         id=apt.id,
         patient_id=apt.patient_id,
         provider_id=apt.provider_id,
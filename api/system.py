@@ -3,6 +3,7 @@
 Not part of the v1 contract. /health is the Cloud Run health probe.
 """
 from fastapi import APIRouter, Depends
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_db
@@ -18,17 +19,19 @@ async def health_check():
 
 
 @router.get("/api/debug/db-info")
-async def debug_db_info(db: Session = Depends(get_db)):
+def debug_db_info(db: Session = Depends(get_db)):
     """
     Debug: which database we're connected to and provider count.
     Use this to verify Railway is hitting the same Supabase as the dashboard.
+
+    The URL comes from the request session's own bind, and the count query
+    is the connectivity check: one pooled connection, no separate ping.
     """
-    from database.connection import engine
-    url = engine.url
+    url = db.get_bind().url
     # Safe to expose: host and db name only (no password)
     db_host = url.host if hasattr(url, "host") else ("sqlite" if "sqlite" in str(url) else "unknown")
     db_name = url.database if hasattr(url, "database") else None
-    provider_count = db.query(Provider).count()
+    provider_count = db.scalar(select(func.count()).select_from(Provider))
     return {
         "database_host": db_host,
         "database_name": db_name,
@@ -0,0 +1,111 @@
+"""Short-lived per-process cache for GET /api/appointments results.
+
+Dashboards re-issue the same list query on every refresh while the data only
+changes on an appointment write. Entries are keyed by clinic + the full
+filter/paging tuple and live for _TTL_SECONDS.
+
+Invalidation is driven by SQLAlchemy session events rather than by each
+mutation handler, so every in-process writer (v1/v2 routers, holds, webhooks,
+cron) is covered: a flush that inserts/updates/deletes an Appointment, or an
+ORM-enabled bulk UPDATE/DELETE against it, marks the session, and the cache is
+cleared once that session commits. Cached rows also carry patient, provider
+and service names and clinic-local times (and pages are keyed by the name
+filters), so writes to those tables invalidate too. Other instances only
+see the write after the TTL, which bounds cross-instance staleness.
+
+A reader whose SELECT started before a writer committed must not re-cache
+the pre-commit rows after clear() ran: clear() bumps a generation counter,
+get() hands the caller the generation it saw, and put() drops the write if
+the generation has moved on since.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Hashable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as SASession
+
+from database.models import Appointment, Clinic, Patient, Provider, Service
+
+_TTL_SECONDS = 15
+_MAX_ENTRIES = 512
+_DIRTY_KEY = "appointments_list_cache_dirty"
+# Models whose rows feed a cached list item (see module docstring).
+_TRACKED = (Appointment, Patient, Provider, Service, Clinic)
+_TRACKED_MAPPERS = frozenset(model.__mapper__ for model in _TRACKED)
+
+_lock = threading.Lock()
+_cache: dict[Hashable, tuple[float, List[dict[str, Any]]]] = {}
+_generation = 0
+
+
+def get(key: Hashable) -> Tuple[Optional[List[dict[str, Any]]], int]:
+    """Return (cached items or None, current generation)."""
+    now = time.monotonic()
+    with _lock:
+        hit = _cache.get(key)
+        if hit is None:
+            return None, _generation
+        if now - hit[0] >= _TTL_SECONDS:
+            del _cache[key]
+            return None, _generation
+        return hit[1], _generation
+
+
+def put(key: Hashable, items: List[dict[str, Any]], generation: int) -> None:
+    """Cache items read under ``generation`` (as returned by get)."""
+    with _lock:
+        if generation != _generation:
+            return  # a write committed since the caller's read began
+        if len(_cache) >= _MAX_ENTRIES:
+            _cache.clear()
+        _cache[key] = (time.monotonic(), items)
+
+
+def clear() -> None:
+    global _generation
+    with _lock:
+        _generation += 1
+        _cache.clear()
+
+
+def _after_flush(session, flush_context) -> None:
+    for bucket in (session.new, session.dirty, session.deleted):
+        if any(isinstance(obj, _TRACKED) for obj in bucket):
+            session.info[_DIRTY_KEY] = True
+            return
+
+
+def _do_orm_execute(state) -> None:
+    if (state.is_update or state.is_delete) and state.bind_mapper in _TRACKED_MAPPERS:
+        state.session.info[_DIRTY_KEY] = True
+
+
+# after_commit / after_rollback also fire when a SAVEPOINT is released or
+# rolled back (e.g. the per-row begin_nested() fallback of the bulk delete).
+# Only the root transaction's outcome counts: clearing on a savepoint release
+# would let a reader re-cache pre-commit rows under the new generation, and a
+# rolled-back savepoint must not drop the flag earlier savepoints set.
+def _after_commit(session) -> None:
+    if session.in_nested_transaction():
+        return
+    if session.info.pop(_DIRTY_KEY, False):
+        clear()
+
+
+def _after_rollback(session) -> None:
+    if session.in_nested_transaction():
+        return
+    session.info.pop(_DIRTY_KEY, None)
+
+
+def register_list_cache_listeners() -> None:
+    """Attach the invalidation listeners. Call once at startup."""
+    if event.contains(SASession, "after_commit", _after_commit):
+        return
+    event.listen(SASession, "after_flush", _after_flush)
+    event.listen(SASession, "do_orm_execute", _do_orm_execute)
+    event.listen(SASession, "after_commit", _after_commit)
+    event.listen(SASession, "after_rollback", _after_rollback)
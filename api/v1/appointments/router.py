@@ -1,15 +1,22 @@
 """v1 appointments router — /api/appointments and nested actions."""
 import logging
-from datetime import datetime
-from typing import List, Optional
+from datetime import date as _date, datetime, timedelta
+from typing import Iterator, List, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session, joinedload
 
 from api.dependencies import get_authorized_clinic, get_db
+from api.responses import ORJSONResponse
 from api.serializers import _to_appointment_detail
+from api.v1.appointments import list_cache
+from api.v1.calendar.router import create_calendar_event
+from database.loading import list_options
 from database.models import (
-    Appointment, AppointmentStatus, Clinic, Patient, Provider, Service,
+    APPT_STATUS_MAP, Appointment, AppointmentStatus, Clinic, Patient, Provider, Service,
 )
 
 from api.v1.appointments.schemas import (
@@ -21,6 +28,7 @@ from api.v1.appointments.schemas import (
     AppointmentStatusUpdateRequest,
 )
 from services.appointments import check_conflicts_for_reschedule
+from services.tz_utils import to_clinic_local, to_storage_utc_clinic
 from services.notifications import (
     schedule_cancellation_notification,
     schedule_reschedule_notification,
@@ -31,8 +39,126 @@ logger = logging.getLogger("dental-receptionist")
 router = APIRouter(prefix="/api/appointments", tags=["appointments"])
 
 
+def _get_in_clinic(db: Session, model, pk, clinic: Clinic, *, options=None):
+    """Primary-key lookup scoped to the clinic; None if absent or foreign.
+
+    Session.get answers from the identity map when the row is already loaded
+    in this request (e.g. a provider pulled in by joinedload) instead of
+    issuing another SELECT. ``options`` (eager loads) apply only when it
+    does hit the database.
+    """
+    if pk is None:
+        return None
+    obj = db.get(model, pk, options=options)
+    if obj is None or obj.clinic_id != clinic.id:
+        return None
+    return obj
+
+
+_ONE_DAY = timedelta(days=1)
+
+
+def _midnight(day: _date) -> datetime:
+    return datetime(day.year, day.month, day.day)
+
+
+def _clinic_day_bounds(day: _date, clinic: Clinic) -> tuple[datetime, datetime]:
+    """Half-open [start, next_start) naive-UTC bounds of a clinic-local day.
+
+    Each bound is a local midnight converted on its own, so DST days come out
+    23 or 25 hours long; filter with ``>= start`` and ``< next_start`` (no
+    time.max microsecond edge).
+    """
+    return (
+        to_storage_utc_clinic(_midnight(day), clinic),
+        to_storage_utc_clinic(_midnight(day + _ONE_DAY), clinic),
+    )
+
+
+def _parse_ymd(value: str) -> _date:
+    """Parse a YYYY-MM-DD query value; ValueError if malformed.
+
+    date.fromisoformat is a C fast path; the length check keeps it to the
+    documented extended form (3.11 would also take 20260310 or 2026-W11-2).
+    """
+    if len(value) != 10:
+        raise ValueError(f"not YYYY-MM-DD: {value!r}")
+    return _date.fromisoformat(value)
+
+
+# Status strings from clients are case-insensitive enum values.
+_VALID_STATUSES = ", ".join(APPT_STATUS_MAP)
+
+
+# The list endpoint reads plain column rows (provider/service names joined in)
+# and builds the response dicts directly: no ORM entity or Pydantic model per
+# row. _appointment_list_item must produce the AppointmentDetailResponse shape.
+_APPOINTMENT_LIST_COLUMNS = (
+    Appointment.id,
+    Appointment.patient_id,
+    Appointment.provider_id,
+    Appointment.service_id,
+    Provider.title.label("provider_title"),
+    Provider.name.label("provider_name"),
+    Service.name.label("service_name"),
+    Appointment.start_time,
+    Appointment.end_time,
+    Appointment.reason_note,
+    Appointment.status,
+    Appointment.calendar_event_id,
+)
+
+
+def _appointment_list_item(row, clinic: Clinic) -> dict:
+    provider_name = row["provider_name"]
+    if provider_name is not None:
+        provider_name = " ".join(filter(None, [row["provider_title"], provider_name])).strip() or provider_name
+    return {
+        "id": row["id"],
+        "patient_id": row["patient_id"],
+        "provider_id": row["provider_id"],
+        "service_id": row["service_id"],
+        "provider_name": provider_name,
+        "service_name": row["service_name"],
+        "start_time": to_clinic_local(row["start_time"], clinic),
+        "end_time": to_clinic_local(row["end_time"], clinic),
+        "reason_note": row["reason_note"],
+        "status": row["status"].value,
+        "calendar_event_id": row["calendar_event_id"],
+    }
+
+
+_NDJSON = "application/x-ndjson"
+_NDJSON_BATCH = 500
+
+
+# List rows skip the Pydantic response model, so render zero-offset times the
+# way it does ("Z", not "+00:00") — e.g. UTC or Europe/London winter clinics.
+_ROW_DUMPS_OPTION = orjson.OPT_UTC_Z
+
+
+class _AppointmentRowsResponse(ORJSONResponse):
+    option = ORJSONResponse.option | _ROW_DUMPS_OPTION
+
+
+def _ndjson_lines(db: Session, stmt, clinic: Clinic) -> Iterator[bytes]:
+    """One JSON object per line, fetched yield_per rows at a time so memory
+    stays flat however many appointments match.
+
+    Runs on the request's get_db session after the handler has returned;
+    FastAPI >= 0.118 (the pinned floor) keeps yield dependencies open until
+    the streamed body is finished."""
+    result = db.execute(stmt.execution_options(yield_per=_NDJSON_BATCH)).mappings()
+    try:
+        for row in result:
+            yield orjson.dumps(_appointment_list_item(row, clinic), option=_ROW_DUMPS_OPTION) + b"\n"
+    finally:
+        result.close()
+
+
 @router.get("", response_model=List[AppointmentDetailResponse])
-async def list_appointments(
+def list_appointments(
+    request: Request,
     appointment_id: Optional[str] = Query(None, description="Filter by specific appointment ID"),
     patient_id: Optional[str] = Query(None, description="Filter by patient ID"),
     provider_id: Optional[int] = Query(None, description="Filter by provider ID"),
@@ -45,6 +171,8 @@ async def list_appointments(
     date: Optional[str] = Query(None, description="Filter appointments on a specific date (ISO format: YYYY-MM-DD)"),
     provider_name: Optional[str] = Query(None, description="Filter by provider name"),
     patient_name: Optional[str] = Query(None, description="Filter by patient name (searches first_name and last_name)"),
+    limit: int = Query(500, ge=1, le=1000, description="Page size"),
+    offset: int = Query(0, ge=0, description="Rows to skip (ordered by start_time, id)"),
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
@@ -62,120 +190,210 @@ async def list_appointments(
     - date: Appointments on a specific date
     - provider_name: Filter by provider name
     - patient_name: Filter by patient name (partial match)
+
+    Results are paged with limit/offset in (start_time, id) order. With
+    ``Accept: application/x-ndjson`` the whole filtered set is streamed
+    instead, one item per line in the same order (limit/offset ignored,
+    not cached) — for exports too large for a single page.
     """
-    query = (
-        db.query(Appointment)
-        .filter(Appointment.clinic_id == clinic.id)
-        .options(joinedload(Appointment.provider), joinedload(Appointment.service))
+    stmt = (
+        select(*_APPOINTMENT_LIST_COLUMNS)
+        .select_from(Appointment)
+        .outerjoin(Provider, Appointment.provider_id == Provider.id)
+        .outerjoin(Service, Appointment.service_id == Service.id)
+        .where(Appointment.clinic_id == clinic.id)
     )
 
     # Filter by appointment ID (returns single result if found)
     if appointment_id:
-        query = query.filter(Appointment.id == appointment_id)
+        stmt = stmt.where(Appointment.id == appointment_id)
 
     # Filter by patient ID
     if patient_id:
-        query = query.filter(Appointment.patient_id == patient_id)
+        stmt = stmt.where(Appointment.patient_id == patient_id)
 
     # Filter by provider ID
     if provider_id:
-        query = query.filter(Appointment.provider_id == provider_id)
+        stmt = stmt.where(Appointment.provider_id == provider_id)
 
     # Filter by service ID
     if service_id:
-        query = query.filter(Appointment.service_id == service_id)
+        stmt = stmt.where(Appointment.service_id == service_id)
 
     # Filter by status
     if status:
-        try:
-            status_enum = AppointmentStatus(status.upper())
-            query = query.filter(Appointment.status == status_enum)
-        except ValueError:
+        status_enum = APPT_STATUS_MAP.get(status.upper())
+        if status_enum is None:
             raise HTTPException(status_code=400, detail=f"Invalid status: {status}. Valid values: SCHEDULED, CANCELLED, COMPLETED, NO_SHOW, PENDING")
+        stmt = stmt.where(Appointment.status == status_enum)
 
-    # Filter by provider name (scoped to clinic)
+    # Filter by provider name (scoped to clinic). Both name filters are folded
+    # into the main statement — the provider as a scalar subquery (first match,
+    # as before), patients as a join — so there's no pre-fetch round-trip and
+    # no IN list sized by the number of matching patients.
     if provider_name:
-        provider = db.query(Provider).filter(
-            Provider.clinic_id == clinic.id, Provider.name.ilike(f"%{provider_name}%")
-        ).first()
-        if provider:
-            query = query.filter(Appointment.provider_id == provider.id)
-        else:
-            # Return empty list if provider not found
-            return []
+        first_provider_id = (
+            select(Provider.id)
+            .where(Provider.clinic_id == clinic.id, Provider.name.ilike(f"%{provider_name}%"))
+            .order_by(Provider.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        stmt = stmt.where(Appointment.provider_id == first_provider_id)
 
     # Filter by patient name (scoped to clinic)
     if patient_name:
-        patients = db.query(Patient).filter(
+        stmt = stmt.join(Patient, Appointment.patient_id == Patient.id).where(
             Patient.clinic_id == clinic.id,
-            (Patient.first_name.ilike(f"%{patient_name}%")) |
-            (Patient.last_name.ilike(f"%{patient_name}%"))
-        ).all()
-        if patients:
-            patient_ids = [p.id for p in patients]
-            query = query.filter(Appointment.patient_id.in_(patient_ids))
-        else:
-            # Return empty list if no patients found
-            return []
+            or_(
+                Patient.first_name.ilike(f"%{patient_name}%"),
+                Patient.last_name.ilike(f"%{patient_name}%"),
+            ),
+        )
 
     # Date range filtering
     if start_date:
         try:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
-            query = query.filter(Appointment.start_time >= datetime.combine(start_dt, datetime.min.time()))
+            start_dt = _parse_ymd(start_date)
+            stmt = stmt.where(Appointment.start_time >= _midnight(start_dt))
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid start_date format. Use YYYY-MM-DD")
 
     if end_date:
         try:
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d").date()
-            query = query.filter(Appointment.end_time <= datetime.combine(end_dt, datetime.max.time()))
-        except ValueError:
+            end_dt = _parse_ymd(end_date)
+            stmt = stmt.where(Appointment.end_time < _midnight(end_dt + _ONE_DAY))
+        except (ValueError, OverflowError):
             raise HTTPException(status_code=400, detail="Invalid end_date format. Use YYYY-MM-DD")
 
     # Datetime range filtering (more precise)
     if start_datetime:
         try:
-            start_dt = datetime.fromisoformat(start_datetime.replace('Z', '+00:00'))
-            query = query.filter(Appointment.start_time >= start_dt)
+            start_dt = datetime.fromisoformat(start_datetime)
+            stmt = stmt.where(Appointment.start_time >= start_dt)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid start_datetime format. Use ISO format")
 
     if end_datetime:
         try:
-            end_dt = datetime.fromisoformat(end_datetime.replace('Z', '+00:00'))
-            query = query.filter(Appointment.end_time <= end_dt)
+            end_dt = datetime.fromisoformat(end_datetime)
+            stmt = stmt.where(Appointment.end_time <= end_dt)
         except ValueError:
             raise HTTPException(status_code=400, detail="Invalid end_datetime format. Use ISO format")
 
     # Filter by specific date
     if date:
         try:
-            from services.tz_utils import to_storage_utc_clinic
-            target_date = datetime.strptime(date, "%Y-%m-%d").date()
+            target_date = _parse_ymd(date)
             # Build the day window in clinic-local wall-clock then convert to the
             # naive-UTC representation the column actually stores, so a late-evening
             # local appointment (stored on the next UTC day) still files on its
             # correct clinic-local day. (2026-06-25 plan, Task 2.3.)
-            start_of_day = to_storage_utc_clinic(
-                datetime.combine(target_date, datetime.min.time()), clinic
-            )
-            end_of_day = to_storage_utc_clinic(
-                datetime.combine(target_date, datetime.max.time()), clinic
-            )
-            query = query.filter(
+            start_of_day, next_day = _clinic_day_bounds(target_date, clinic)
+            stmt = stmt.where(
                 Appointment.start_time >= start_of_day,
-                Appointment.start_time <= end_of_day
+                Appointment.start_time < next_day,
             )
-        except ValueError:
+        except (ValueError, OverflowError):
             raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
 
-    appointments = query.order_by(Appointment.start_time).all()
-    return [_to_appointment_detail(apt, clinic) for apt in appointments]
+    # id breaks start_time ties so consecutive pages never repeat or skip rows.
+    stmt = stmt.order_by(Appointment.start_time, Appointment.id)
+    if _NDJSON in request.headers.get("accept", ""):
+        return StreamingResponse(_ndjson_lines(db, stmt, clinic), media_type=_NDJSON)
+
+    cache_key = (
+        clinic.id, appointment_id, patient_id, provider_id, service_id, status,
+        start_date, end_date, start_datetime, end_datetime, date,
+        provider_name, patient_name, limit, offset,
+    )
+    items, generation = list_cache.get(cache_key)
+    if items is None:
+        rows = db.execute(stmt.limit(limit).offset(offset)).mappings().all()
+        items = [_appointment_list_item(row, clinic) for row in rows]
+        list_cache.put(cache_key, items, generation)
+    return _AppointmentRowsResponse(items)
+
+
+def _delete_appointments(
+    db: Session, appointments: List[Appointment], date: str
+) -> tuple[List[str], List[str]]:
+    """Delete a day's appointments; return (deleted_ids, failed_ids).
+
+    Fast path: one flush + one commit for the whole day. Only if that fails
+    (e.g. a row still referenced elsewhere) fall back to one SAVEPOINT per
+    row inside a single transaction, so the deletable rows still go, the
+    failures are reported individually, and there is still only one commit.
+    Deletes stay ORM-level (not a bulk DELETE) so the PHI audit trail in
+    database.auth.audit records every removed appointment.
+    """
+    appointment_ids = [apt.id for apt in appointments]
+    try:
+        for appointment in appointments:
+            db.delete(appointment)
+        db.commit()
+        return appointment_ids, []
+    except Exception as e:
+        db.rollback()
+        logger.warning("Batch delete for %s failed, retrying per row: %s", date, e)
+
+    deleted_ids = []
+    failed_ids = []
+    for appointment_id in appointment_ids:
+        try:
+            appointment = db.get(Appointment, appointment_id)
+            if appointment is None:
+                continue
+            with db.begin_nested():
+                db.delete(appointment)
+            deleted_ids.append(appointment_id)
+        except Exception as e:
+            failed_ids.append(appointment_id)
+            logger.warning("Failed to delete appointment %s: %s", appointment_id, e)
+    db.commit()
+    return deleted_ids, failed_ids
+
+
+def _bulk_delete_ndjson_lines(
+    db: Session, appointments: List[Appointment], date: str
+) -> Iterator[bytes]:
+    """NDJSON form of the bulk-delete result: a "started" line before any
+    delete runs, one {"id", "ok"} line per appointment once the commit has
+    landed, then a summary line. Clients get a first byte immediately and
+    the body is never assembled as one document.
+
+    The 200 status is already sent when the delete runs, so a failure there
+    (commit error, dropped connection) is reported in-band: the transaction
+    is rolled back and the last line is {"error", "summary"} with nothing
+    deleted, rather than a body that just stops.
+
+    The deletes and the commit run here, inside the streamed body, on the
+    request's get_db session: that relies on FastAPI >= 0.118 (the pinned
+    floor) keeping yield dependencies open until the body is finished."""
+    yield orjson.dumps({"status": "started", "date": date, "appointments_found": len(appointments)}) + b"\n"
+    try:
+        deleted_ids, failed_ids = _delete_appointments(db, appointments, date)
+    except Exception as e:
+        logger.error("Bulk delete for %s failed: %s", date, e, exc_info=True)
+        try:
+            db.rollback()
+        except Exception:
+            pass  # connection already gone; the server aborts the transaction
+        yield orjson.dumps({
+            "error": f"Bulk delete failed, no appointments were deleted: {e}",
+            "summary": {"deleted": 0, "failed": len(appointments)},
+        }) + b"\n"
+        return
+    for appointment_id in deleted_ids:
+        yield orjson.dumps({"id": appointment_id, "ok": True}) + b"\n"
+    for appointment_id in failed_ids:
+        yield orjson.dumps({"id": appointment_id, "ok": False}) + b"\n"
+    yield orjson.dumps({"summary": {"deleted": len(deleted_ids), "failed": len(failed_ids)}}) + b"\n"
 
 
 @router.delete("/bulk/date/{date}")
-async def delete_appointments_by_date_endpoint(
+def delete_appointments_by_date_endpoint(
+    request: Request,
     date: str,
     dry_run: bool = Query(False, description="If true, only preview without deleting"),
     db: Session = Depends(get_db),
@@ -187,9 +405,12 @@ async def delete_appointments_by_date_endpoint(
     Args:
         date: Date in YYYY-MM-DD format (e.g., "2025-12-22")
         dry_run: If true, only return what would be deleted without actually deleting
+
+    With ``Accept: application/x-ndjson`` the delete result is streamed as
+    one JSON object per line (see _bulk_delete_ndjson_lines).
     """
     try:
-        target_date_obj = datetime.strptime(date, "%Y-%m-%d").date()
+        target_date_obj = _parse_ymd(date)
     except ValueError:
         raise HTTPException(
             status_code=400,
@@ -198,18 +419,12 @@ async def delete_appointments_by_date_endpoint(
 
     # Use the same clinic-local -> naive-UTC bounds as the GET day-list so DELETE
     # targets exactly the appointments the day view shows. (2026-06-25 plan, Task 2.3.)
-    from services.tz_utils import to_storage_utc_clinic
-    start_of_day = to_storage_utc_clinic(
-        datetime.combine(target_date_obj, datetime.min.time()), clinic
-    )
-    end_of_day = to_storage_utc_clinic(
-        datetime.combine(target_date_obj, datetime.max.time()), clinic
-    )
+    start_of_day, next_day = _clinic_day_bounds(target_date_obj, clinic)
 
-    appointments = db.query(Appointment).filter(
+    appointments = db.query(Appointment).options(*list_options()).filter(
         Appointment.clinic_id == clinic.id,
         Appointment.start_time >= start_of_day,
-        Appointment.start_time <= end_of_day,
+        Appointment.start_time < next_day,
     ).all()
 
     if not appointments:
@@ -238,50 +453,33 @@ async def delete_appointments_by_date_endpoint(
             "deleted": 0,
         }
 
-    import logging
-    _logger = logging.getLogger("dental-receptionist")
-
-    deleted_count = 0
-    failed_count = 0
-    deleted_ids = []
-    failed_ids = []
-
-    for appointment in appointments:
-        appointment_id = appointment.id
-        try:
-            db.delete(appointment)
-            db.commit()
-            deleted_count += 1
-            deleted_ids.append(appointment_id)
-        except Exception as e:
-            db.rollback()
-            failed_count += 1
-            failed_ids.append(appointment_id)
-            _logger.warning(f"Failed to delete appointment {appointment_id}: {e}")
+    if _NDJSON in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _bulk_delete_ndjson_lines(db, appointments, date), media_type=_NDJSON
+        )
 
+    deleted_ids, failed_ids = _delete_appointments(db, appointments, date)
     return {
-        "message": f"Deleted {deleted_count} appointment(s) for {date}",
+        "message": f"Deleted {len(deleted_ids)} appointment(s) for {date}",
         "date": date,
         "appointments_found": len(appointments),
-        "deleted": deleted_count,
-        "failed": failed_count,
+        "deleted": len(deleted_ids),
+        "failed": len(failed_ids),
         "deleted_ids": deleted_ids,
         "failed_ids": failed_ids,
     }
 
 
 @router.get("/{appointment_id}", response_model=AppointmentDetailResponse)
-async def get_appointment(
+def get_appointment(
     appointment_id: str,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Get appointment by ID."""
-    appointment = (
-        db.query(Appointment)
-        .options(joinedload(Appointment.provider), joinedload(Appointment.service))
-        .filter(Appointment.id == appointment_id, Appointment.clinic_id == clinic.id)
-        .first()
+    appointment = _get_in_clinic(
+        db, Appointment, appointment_id, clinic,
+        options=[joinedload(Appointment.provider), joinedload(Appointment.service)],
     )
     if not appointment:
         raise HTTPException(status_code=404, detail="Appointment not found")
@@ -289,62 +487,74 @@ async def get_appointment(
 
 
 @router.post("", response_model=AppointmentResponse)
-async def create_appointment(
+def create_appointment(
     request: AppointmentCreateRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Create appointment (also creates calendar event)."""
-    # Lazy import: Task 11 will move create_calendar_event into the v1 calendar
-    # router; until then it still lives in api.main. After Task 11 the import
-    # path becomes api.v1.calendar.router.
-    try:
-        from api.v1.calendar.router import create_calendar_event
-    except ImportError:
-        from api.main import create_calendar_event  # type: ignore
-    return await create_calendar_event(request, background_tasks, db, clinic)
+    return create_calendar_event(request, background_tasks, db, clinic)
+
+
+# Keys PUT /api/appointments/{id} may write: mapped columns, minus identity
+# and tenancy. updated_at is stamped by the handler itself.
+_APPOINTMENT_UPDATABLE_FIELDS = frozenset(
+    attr.key for attr in Appointment.__mapper__.column_attrs
+) - {"id", "clinic_id", "created_at", "updated_at"}
 
 
 @router.put("/{appointment_id}", response_model=AppointmentDetailResponse)
-async def update_appointment(
+def update_appointment(
     appointment_id: str,
     updates: dict,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Update appointment in database."""
-    appointment = (
-        db.query(Appointment)
-        .options(joinedload(Appointment.provider), joinedload(Appointment.service))
-        .filter(Appointment.id == appointment_id, Appointment.clinic_id == clinic.id)
-        .first()
+    appointment = _get_in_clinic(
+        db, Appointment, appointment_id, clinic,
+        options=[joinedload(Appointment.provider), joinedload(Appointment.service)],
     )
     if not appointment:
         raise HTTPException(status_code=404, detail="Appointment not found")
 
-    from services.tz_utils import to_storage_utc_clinic
     for key, value in updates.items():
-        if hasattr(appointment, key):
-            if key in ["start_time", "end_time"]:
+        if key in _APPOINTMENT_UPDATABLE_FIELDS:
+            if key in ("start_time", "end_time"):
                 setattr(
                     appointment,
                     key,
                     to_storage_utc_clinic(
-                        datetime.fromisoformat(value.replace("Z", "+00:00")), clinic
+                        datetime.fromisoformat(value), clinic
                     ),
                 )
+            elif key == "status":
+                new_status = APPT_STATUS_MAP.get(str(value).upper())
+                if new_status is None:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid status: {value}. Valid values: {_VALID_STATUSES}",
+                    )
+                appointment.status = new_status
             else:
                 setattr(appointment, key, value)
 
     appointment.updated_at = datetime.utcnow()
+    # Values are set in their column types above, so the instance already
+    # holds what was stored: keep it across the commit instead of refresh()ing.
+    # Still an ORM write (not UPDATE ... RETURNING) so the PHI audit
+    # before_flush hook sees the change.
+    db.expire_on_commit = False
     db.commit()
-    db.refresh(appointment)
+    if updates.keys() & {"provider_id", "service_id"}:
+        # The eager-loaded relationships still point at the old rows.
+        db.expire(appointment, ["provider", "service"])
     return _to_appointment_detail(appointment, clinic)
 
 
 @router.delete("/{appointment_id}")
-async def delete_appointment(
+def delete_appointment(
     appointment_id: str,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
@@ -353,8 +563,8 @@ async def delete_appointment(
     Delete appointment permanently from database.
     Use PUT /api/appointments/{id}/cancel if you want to cancel but keep the record.
     """
-    appointment = db.query(Appointment).filter(Appointment.id == appointment_id, Appointment.clinic_id == clinic.id).first()
-    if not appointment:
+    appointment = db.get(Appointment, appointment_id)
+    if appointment is None or appointment.clinic_id != clinic.id:
         raise HTTPException(status_code=404, detail="Appointment not found")
 
     try:
@@ -374,7 +584,7 @@ async def delete_appointment(
 
 
 @router.put("/{appointment_id}/cancel")
-async def cancel_appointment(
+def cancel_appointment(
     appointment_id: str,
     background_tasks: BackgroundTasks,
     request: AppointmentCancelRequest = Body(default_factory=AppointmentCancelRequest),
@@ -385,11 +595,15 @@ async def cancel_appointment(
     Cancel appointment (marks as CANCELLED but keeps record).
     Use DELETE endpoint if you want to permanently remove the appointment.
     """
-    appointment = (
-        db.query(Appointment)
-        .options(joinedload(Appointment.provider), joinedload(Appointment.service))
-        .filter(Appointment.id == appointment_id, Appointment.clinic_id == clinic.id)
-        .first()
+    # Patient, provider and service all come back with the appointment: the
+    # notification and the response read them without further queries.
+    appointment = _get_in_clinic(
+        db, Appointment, appointment_id, clinic,
+        options=[
+            joinedload(Appointment.patient),
+            joinedload(Appointment.provider),
+            joinedload(Appointment.service),
+        ],
     )
     if not appointment:
         raise HTTPException(status_code=404, detail="Appointment not found")
@@ -399,12 +613,14 @@ async def cancel_appointment(
 
     appointment.status = AppointmentStatus.CANCELLED
     appointment.updated_at = datetime.utcnow()
+    # Every value written above was set here; keep the loaded graph live
+    # across the commit instead of reloading it row by row.
+    db.expire_on_commit = False
     db.commit()
-    db.refresh(appointment)
 
     # Schedule cancellation SMS (best-effort; failures are logged in the service)
-    patient = db.query(Patient).filter(Patient.id == appointment.patient_id, Patient.clinic_id == clinic.id).first()
-    provider = db.query(Provider).filter(Provider.id == appointment.provider_id, Provider.clinic_id == clinic.id).first()
+    patient = _get_in_clinic(db, Patient, appointment.patient_id, clinic)
+    provider = _get_in_clinic(db, Provider, appointment.provider_id, clinic)
     if patient and provider:
         schedule_cancellation_notification(
             background_tasks,
@@ -418,27 +634,23 @@ async def cancel_appointment(
 
 
 @router.put("/{appointment_id}/status", response_model=AppointmentDetailResponse)
-async def update_appointment_status(
+def update_appointment_status(
     appointment_id: str,
     request: AppointmentStatusUpdateRequest,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Update appointment status in database."""
-    try:
-        new_status = AppointmentStatus(request.status.upper())
-    except ValueError:
-        valid_statuses = [s.value for s in AppointmentStatus]
+    new_status = APPT_STATUS_MAP.get(request.status.upper())
+    if new_status is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid status: {request.status}. Valid values: {', '.join(valid_statuses)}",
+            detail=f"Invalid status: {request.status}. Valid values: {_VALID_STATUSES}",
         )
 
-    appointment = (
-        db.query(Appointment)
-        .options(joinedload(Appointment.provider), joinedload(Appointment.service))
-        .filter(Appointment.id == appointment_id, Appointment.clinic_id == clinic.id)
-        .first()
+    appointment = _get_in_clinic(
+        db, Appointment, appointment_id, clinic,
+        options=[joinedload(Appointment.provider), joinedload(Appointment.service)],
     )
     if not appointment:
         raise HTTPException(status_code=404, detail="Appointment not found")
@@ -447,14 +659,14 @@ async def update_appointment_status(
 
     appointment.status = new_status
     appointment.updated_at = datetime.utcnow()
+    db.expire_on_commit = False
     db.commit()
-    db.refresh(appointment)
 
     return _to_appointment_detail(appointment, clinic)
 
 
 @router.put("/{appointment_id}/reschedule")
-async def reschedule_appointment(
+def reschedule_appointment(
     appointment_id: str,
     request: AppointmentCreateRequest,
     background_tasks: BackgroundTasks,
@@ -465,7 +677,17 @@ async def reschedule_appointment(
     Reschedule an existing appointment.
     Creates a new appointment with the new time/date and marks the old one as RESCHEDULED.
     """
-    old_appointment = db.query(Appointment).filter(Appointment.id == appointment_id, Appointment.clinic_id == clinic.id).first()
+    # Reschedules usually keep the patient/provider/service; loading them with
+    # the appointment lets the notification lookups below resolve from the
+    # identity map.
+    old_appointment = _get_in_clinic(
+        db, Appointment, appointment_id, clinic,
+        options=[
+            joinedload(Appointment.patient),
+            joinedload(Appointment.provider),
+            joinedload(Appointment.service),
+        ],
+    )
     if not old_appointment:
         raise HTTPException(status_code=404, detail="Appointment not found")
 
@@ -478,12 +700,11 @@ async def reschedule_appointment(
         )
 
     try:
-        new_start_time = datetime.fromisoformat(request.start_time.replace("Z", "+00:00"))
-        new_end_time = datetime.fromisoformat(request.end_time.replace("Z", "+00:00"))
+        new_start_time = request.start_time
+        new_end_time = request.end_time
 
         # Convert clinic-local input to naive UTC ONCE, then share with both the
         # conflict check and the ORM write (2026-06-25 plan).
-        from services.tz_utils import to_storage_utc_clinic
         new_start_utc = to_storage_utc_clinic(new_start_time, clinic)
         new_end_utc = to_storage_utc_clinic(new_end_time, clinic)
 
@@ -512,14 +733,13 @@ async def reschedule_appointment(
         old_appointment.status = AppointmentStatus.RESCHEDULED
         old_appointment.updated_at = datetime.utcnow()
 
+        db.expire_on_commit = False
         db.commit()
-        db.refresh(new_appointment)
-        db.refresh(old_appointment)
 
         # Schedule reschedule confirmation SMS (best-effort)
-        patient = db.query(Patient).filter(Patient.id == request.patient_id, Patient.clinic_id == clinic.id).first()
-        provider = db.query(Provider).filter(Provider.id == request.provider_id, Provider.clinic_id == clinic.id).first()
-        svc = db.query(Service).filter(Service.id == request.service_id, Service.clinic_id == clinic.id).first() if request.service_id else None
+        patient = _get_in_clinic(db, Patient, request.patient_id, clinic)
+        provider = _get_in_clinic(db, Provider, request.provider_id, clinic)
+        svc = _get_in_clinic(db, Service, request.service_id, clinic) if request.service_id else None
         service_name = (svc.name if svc else None) or request.service_name
         if patient and provider:
             schedule_reschedule_notification(
@@ -540,6 +760,5 @@ async def reschedule_appointment(
         raise
     except Exception as e:
         db.rollback()
-        import logging
-        logging.getLogger("dental-receptionist").error(f"Error rescheduling appointment: {e}", exc_info=True)
+        logger.error("Error rescheduling appointment: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error rescheduling appointment: {str(e)}")
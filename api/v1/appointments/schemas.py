@@ -3,7 +3,9 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from api.responses import ContractDetailError
 
 
 class AppointmentMutationSource(str, Enum):
@@ -22,9 +24,15 @@ class AppointmentMutationSource(str, Enum):
 
 
 class AppointmentCreateRequest(BaseModel):
-    """Request model for creating appointment."""
-    start_time: str = Field(..., description="ISO datetime string")
-    end_time: str = Field(..., description="ISO datetime string")
+    """Request model for creating appointment.
+
+    start_time / end_time are parsed at validation time; naive values are
+    clinic-local wall-clock, offset-bearing values keep their offset.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    start_time: datetime = Field(..., description="ISO datetime string")
+    end_time: datetime = Field(..., description="ISO datetime string")
     patient_id: str
     provider_id: int
     service_id: Optional[int] = None
@@ -36,6 +44,21 @@ class AppointmentCreateRequest(BaseModel):
         description="Origin of the mutation (used by reschedule via this schema).",
     )
 
+    @field_validator("start_time", "end_time", mode="before")
+    @classmethod
+    def _parse_iso_datetime(cls, value, info):
+        # The v1 contract answers a malformed time with a 422 whose detail
+        # is this string, not pydantic's error list (see
+        # api.responses.contract_detail_validation_handler).
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value)
+            except ValueError as e:
+                raise ContractDetailError(
+                    f"Invalid {info.field_name} format: {e}. Expected ISO datetime format."
+                ) from None
+        return value
+
 
 class AppointmentResponse(BaseModel):
     """Response model for appointment."""
@@ -3,14 +3,17 @@
 POST /api/calendar/events is the canonical booking endpoint. POST
 /api/appointments aliases it (see api/v1/appointments/router.py).
 """
+import asyncio
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_authorized_clinic, get_db
+from api.responses import ORJSONResponse
 from database.models import (
     Appointment, AppointmentStatus, Clinic, Patient, Provider, Service,
 )
@@ -21,12 +24,45 @@ from api.v1.appointments.schemas import (
 from services.appointments import check_conflicts_for_create
 from services.notifications import schedule_booking_notifications
 from services.slots import get_available_slots
+from services.tz_utils import format_clinic_local, to_clinic_local_iso, to_storage_utc_clinic
 
 logger = logging.getLogger("dental-receptionist")
 
 router = APIRouter(prefix="/api/calendar", tags=["calendar"])
 
 
+def _load_booking_refs(
+    db: Session, request: AppointmentCreateRequest, clinic: Clinic,
+) -> Tuple[Optional[Patient], Optional[Provider], Optional[Service]]:
+    """Fetch the booking's patient, provider and service in a single query.
+
+    Anchored on the patient row with the provider/service LEFT JOINed on
+    their ids, so a missing provider or service comes back as None instead
+    of dropping the row. Returns (None, None, None) if the patient itself
+    doesn't exist in this clinic.
+    """
+    entities = [Patient, Provider]
+    if request.service_id is not None:
+        entities.append(Service)
+    q = (
+        db.query(*entities)
+        .select_from(Patient)
+        .outerjoin(
+            Provider,
+            and_(Provider.id == request.provider_id, Provider.clinic_id == clinic.id),
+        )
+    )
+    if request.service_id is not None:
+        q = q.outerjoin(
+            Service,
+            and_(Service.id == request.service_id, Service.clinic_id == clinic.id),
+        )
+    row = q.filter(Patient.id == request.patient_id, Patient.clinic_id == clinic.id).first()
+    if row is None:
+        return None, None, None
+    return row[0], row[1], (row[2] if request.service_id is not None else None)
+
+
 @router.get("/slots")
 async def get_calendar_slots(
     start_datetime: str = Query(..., description="ISO datetime string"),
@@ -41,8 +77,12 @@ async def get_calendar_slots(
     Get available appointment slots for a datetime range (computed from database).
     Per-clinic working hours and timezone from X-Clinic-Id.
     """
+    # The slot engine is synchronous (several queries plus per-day interval
+    # math); run it on the worker pool so it doesn't stall the event loop
+    # that also serves SSE streams and webhooks.
     try:
-        slots = get_available_slots(
+        slots = await asyncio.to_thread(
+            get_available_slots,
             db=db,
             start_datetime=start_datetime,
             end_datetime=end_datetime,
@@ -54,14 +94,17 @@ async def get_calendar_slots(
             hour_start=clinic.working_hour_start,
             hour_end=clinic.working_hour_end,
         )
-        return slots
+        # The engine already returns JSON-native values (ISO strings, ints).
+        # Handing back a Response skips FastAPI's jsonable_encoder walk over
+        # every slot before orjson renders it.
+        return ORJSONResponse(slots)
     except Exception as e:
         logger.error(f"Error in get_calendar_slots: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/events")
-async def list_calendar_events(
+def list_calendar_events(
     start: Optional[str] = Query(None, description="ISO start of range (inclusive)"),
     end: Optional[str] = Query(None, description="ISO end of range (exclusive)"),
     db: Session = Depends(get_db),
@@ -71,12 +114,12 @@ async def list_calendar_events(
     q = db.query(Appointment).filter(Appointment.clinic_id == clinic.id)
     if start:
         try:
-            q = q.filter(Appointment.start_time >= datetime.fromisoformat(start.replace("Z", "+00:00")))
+            q = q.filter(Appointment.start_time >= datetime.fromisoformat(start))
         except ValueError:
             raise HTTPException(400, f"Invalid start datetime: {start}")
     if end:
         try:
-            q = q.filter(Appointment.start_time < datetime.fromisoformat(end.replace("Z", "+00:00")))
+            q = q.filter(Appointment.start_time < datetime.fromisoformat(end))
         except ValueError:
             raise HTTPException(400, f"Invalid end datetime: {end}")
     out = []
@@ -94,59 +137,37 @@ async def list_calendar_events(
 
 
 @router.post("/events")
-async def create_calendar_event(
+def create_calendar_event(
     request: AppointmentCreateRequest,
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Create appointment in database (DB is source of truth)."""
-    # 0. Validate datetime formats BEFORE creating appointment
-    try:
-        start_time_dt = datetime.fromisoformat(request.start_time.replace('Z', '+00:00'))
-    except (ValueError, AttributeError) as e:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Invalid start_time format: {str(e)}. Expected ISO datetime format."
-        )
-
-    try:
-        end_time_dt = datetime.fromisoformat(request.end_time.replace('Z', '+00:00'))
-    except (ValueError, AttributeError) as e:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Invalid end_time format: {str(e)}. Expected ISO datetime format."
-        )
-
-    # Validate end_time is after start_time
+    # 0. start_time / end_time arrive parsed (malformed input is a 422 from
+    #    request validation). Validate end_time is after start_time.
+    start_time_dt = request.start_time
+    end_time_dt = request.end_time
     if end_time_dt <= start_time_dt:
         raise HTTPException(
             status_code=400,
             detail="end_time must be after start_time"
         )
 
-    # Validate patient_id exists and belongs to clinic
-    patient = db.query(Patient).filter(Patient.id == request.patient_id, Patient.clinic_id == clinic.id).first()
+    # Validate patient, provider and (optional) service exist and belong to
+    # the clinic in ONE round-trip. 404 precedence matches the old sequential
+    # checks: patient, then provider, then service.
+    patient, provider, service = _load_booking_refs(db, request, clinic)
     if not patient:
         raise HTTPException(status_code=404, detail="Patient not found")
-
-    # Validate provider_id exists and belongs to clinic
-    provider = db.query(Provider).filter(
-        Provider.id == request.provider_id, Provider.clinic_id == clinic.id
-    ).first()
     if not provider:
         raise HTTPException(status_code=404, detail="Provider not found")
-
-    # Validate service_id exists and belongs to clinic (if provided)
-    if request.service_id is not None:
-        service = db.query(Service).filter(Service.id == request.service_id, Service.clinic_id == clinic.id).first()
-        if not service:
-            raise HTTPException(status_code=404, detail="Service not found")
+    if request.service_id is not None and not service:
+        raise HTTPException(status_code=404, detail="Service not found")
 
     # Convert the parsed clinic-local input to naive UTC ONCE at the boundary,
     # then share that representation with both the conflict check and the ORM
     # write so storage and conflict detection never disagree (2026-06-25 plan).
-    from services.tz_utils import to_storage_utc_clinic
     start_utc = to_storage_utc_clinic(start_time_dt, clinic)
     end_utc = to_storage_utc_clinic(end_time_dt, clinic)
 
@@ -174,12 +195,16 @@ async def create_calendar_event(
         status=AppointmentStatus.SCHEDULED,
     )
     db.add(appointment)
+    # Everything read below (response, SSE payload, notification scheduling)
+    # was loaded or set in this request. Keep it live across the commit rather
+    # than paying one serial reload each for appointment, patient, provider
+    # and clinic; Appointment column defaults are Python-side, so the flushed
+    # row already holds what was stored.
+    db.expire_on_commit = False
     db.commit()
-    db.refresh(appointment)
 
     # Resolve service name for notifications + SSE (DB lookup beats request fallback)
-    svc = db.query(Service).filter(Service.id == request.service_id, Service.clinic_id == clinic.id).first() if request.service_id else None
-    service_name = (svc.name if svc else None) or request.service_name
+    service_name = (service.name if service else None) or request.service_name
 
     # Schedule patient SMS + clinic email (best-effort, failures logged in the service)
     schedule_booking_notifications(
@@ -197,7 +222,6 @@ async def create_calendar_event(
     # by this point.
     provider_display_name = " ".join(filter(None, [provider.title, provider.name])).strip() or provider.name
     patient_name = " ".join(filter(None, [patient.first_name, patient.last_name])) or "Patient"
-    from services.tz_utils import format_clinic_local, to_clinic_local_iso
     date_str, time_str = format_clinic_local(appointment.start_time, clinic)
     try:
         from api.v2.events import publish_appointment_created
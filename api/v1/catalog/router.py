@@ -15,34 +15,35 @@ router = APIRouter(prefix="/api/services", tags=["services"])
 
 
 @router.get("")
-async def list_services(
+def list_services(
     name: Optional[str] = Query(None, description="Filter by service name"),
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """List all services."""
-    query = db.query(Service).filter(Service.clinic_id == clinic.id)
+    query = db.query(
+        Service.id, Service.name, Service.description, Service.duration_min, Service.base_price
+    ).filter(Service.clinic_id == clinic.id)
     if name:
         query = query.filter(Service.name.ilike(f"%{name}%"))
-    services = query.all()
     return [{
         "id": s.id,
         "name": s.name,
         "description": s.description,
         "duration_min": s.duration_min,
         "base_price": float(s.base_price) if s.base_price else None
-    } for s in services]
+    } for s in query.all()]
 
 
 @router.get("/{service_id}")
-async def get_service(
+def get_service(
     service_id: int,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Get service by ID."""
-    service = db.query(Service).filter(Service.id == service_id, Service.clinic_id == clinic.id).first()
-    if not service:
+    service = db.get(Service, service_id)
+    if service is None or service.clinic_id != clinic.id:
         raise HTTPException(status_code=404, detail="Service not found")
     return {
         "id": service.id,
@@ -9,6 +9,8 @@ know about inheritance.
 """
 from __future__ import annotations
 
+import re
+import time
 from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
@@ -123,15 +125,51 @@ def _resolve_routing(db: Session, clinic: Clinic) -> Dict[str, Any]:
     }
 
 
+# DID -> clinic_id is looked up on every inbound call but only changes when a
+# clinic edits its routing. Positive hits are kept briefly per process, but a
+# DID can be reassigned through another instance, which only clears its own
+# cache. Routing a call or SMS to the previous clinic would cross tenants, so
+# a hit is trusted only after re-reading the cached clinic's dids by primary
+# key (cheaper than the GIN containment probe); a mismatch falls through to
+# the full lookup. The portal routing PUT still clears the local cache.
+# Misses are never cached so a newly provisioned DID resolves at once.
+_DID_CACHE_TTL_SECONDS = 60
+_did_cache: dict[str, tuple[float, str]] = {}
+
+
+def invalidate_did_cache() -> None:
+    """Drop cached DID -> clinic_id mappings (call after routing DIDs change)."""
+    _did_cache.clear()
+
+
+def _clinic_id_for_did(db: Session, did: str) -> Optional[str]:
+    return db.query(ClinicRouting.clinic_id).filter(
+        ClinicRouting.dids.any(did)
+    ).limit(1).scalar()
+
+
+def _clinic_dids(db: Session, clinic_id: str) -> List[str]:
+    return db.query(ClinicRouting.dids).filter(
+        ClinicRouting.clinic_id == clinic_id
+    ).scalar() or []
+
+
 def resolve_clinic_id_for_did(db: Session, did: str) -> Optional[str]:
     """Reverse-index lookup using the GIN index on clinic_routing.dids."""
     if not did:
         return None
     normalized = _normalize_did(did)
-    row = db.query(ClinicRouting).filter(
-        ClinicRouting.dids.any(normalized)
-    ).first()
-    return row.clinic_id if row else None
+    now = time.monotonic()
+    hit = _did_cache.get(normalized)
+    if hit is not None and (now - hit[0]) < _DID_CACHE_TTL_SECONDS:
+        if normalized in _clinic_dids(db, hit[1]):
+            return hit[1]
+        _did_cache.pop(normalized, None)  # reassigned elsewhere since cached
+    clinic_id = _clinic_id_for_did(db, normalized)
+    if clinic_id is None:
+        return None
+    _did_cache[normalized] = (now, clinic_id)
+    return clinic_id
 
 
 def _isoformat_date(value) -> str:
@@ -144,9 +182,12 @@ def _isoformat_date(value) -> str:
     return str(value)
 
 
+_NON_DIGITS = re.compile(r"\D")
+
+
 def _normalize_did(did: str) -> str:
     """Strip non-digits, keep leading '+'. Mirrors services/routing_webhook/store.py:_normalize_did."""
     s = (did or "").strip()
     plus = "+" if s.startswith("+") else ""
-    digits = "".join(c for c in s if c.isdigit())
+    digits = _NON_DIGITS.sub("", s)
     return f"{plus}{digits}" if (plus or digits) else ""
@@ -1,7 +1,9 @@
 """v1 clinics router — /api/clinics, /api/clinics/me."""
 from datetime import datetime
+from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from api.dependencies import (
@@ -31,9 +33,11 @@ from api.v1.clinics.schemas import (
 
 router = APIRouter(prefix="/api/clinics", tags=["clinics"])
 
+_CLINIC_SUMMARY_LIST_ADAPTER = TypeAdapter(List[ClinicSummary])
+
 
 @router.get("", response_model=ClinicsListResponse)
-async def list_clinics(
+def list_clinics(
     uid: str = Depends(get_current_uid),
     db: Session = Depends(get_db),
 ):
@@ -54,11 +58,11 @@ async def list_clinics(
             .order_by(Clinic.name)
             .all()
         )
-    return {"clinics": [ClinicSummary.model_validate(r) for r in rows]}
+    return {"clinics": _CLINIC_SUMMARY_LIST_ADAPTER.validate_python(rows, from_attributes=True)}
 
 
 @router.post("", response_model=ClinicResponse)
-async def create_clinic(
+def create_clinic(
     request: ClinicCreateRequest,
     db: Session = Depends(get_db),
 ):
@@ -83,13 +87,13 @@ async def create_clinic(
 
 
 @router.get("/me", response_model=ClinicResponse)
-async def get_clinic_me(clinic: Clinic = Depends(get_authorized_clinic)):
+def get_clinic_me(clinic: Clinic = Depends(get_authorized_clinic)):
     """Get current clinic config (from X-Clinic-Id, authorized via uid+membership)."""
     return ClinicResponse.model_validate(clinic)
 
 
 @router.patch("/me", response_model=ClinicResponse)
-async def patch_clinic_me(
+def patch_clinic_me(
     request: ClinicUpdateRequest,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
@@ -110,7 +114,7 @@ async def patch_clinic_me(
     response_model=ClinicByDidResponse,
     dependencies=[Depends(get_internal_caller)],
 )
-async def get_clinic_by_did(did: str, db: Session = Depends(get_db)):
+def get_clinic_by_did(did: str, db: Session = Depends(get_db)):
     """Reverse-index a dialed DID to its owning clinic_id (404 if none)."""
     clinic_id = resolve_clinic_id_for_did(db, did)
     if clinic_id is None:
@@ -123,7 +127,7 @@ async def get_clinic_by_did(did: str, db: Session = Depends(get_db)):
     response_model=ClinicConfigResponse,
     dependencies=[Depends(get_internal_caller)],
 )
-async def get_clinic_config(clinic_id: str, db: Session = Depends(get_db)):
+def get_clinic_config(clinic_id: str, db: Session = Depends(get_db)):
     """Return the fully merged clinic config (practice_type defaults + overrides + routing)."""
     cfg = resolve_clinic_config(db, clinic_id)
     if cfg is None:
@@ -136,7 +140,7 @@ async def get_clinic_config(clinic_id: str, db: Session = Depends(get_db)):
     response_model=ClinicRoutingResponse,
     dependencies=[Depends(get_internal_caller)],
 )
-async def get_clinic_routing_endpoint(clinic_id: str, db: Session = Depends(get_db)):
+def get_clinic_routing_endpoint(clinic_id: str, db: Session = Depends(get_db)):
     """Routing-only payload for the routing_webhook. ~10x smaller than /config."""
     routing = resolve_clinic_routing(db, clinic_id)
     if routing is None:
@@ -1,8 +1,9 @@
 """Staff-facing holds admin routes — list, confirm, and decline pending holds."""
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from api.dependencies import get_authorized_clinic, get_db
+from database.loading import list_options
 from database.models import Clinic, Appointment, AppointmentStatus
 from services.holds import confirm_hold, decline_hold
 
@@ -30,8 +31,11 @@ def list_pending_holds(
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """List all PENDING holds (hold_expiry_at not null) for the clinic, oldest first."""
+    # provider/patient are read for every row below; load them in the same
+    # SELECT rather than one lazy load per hold.
     rows = (
         db.query(Appointment)
+        .options(*list_options(joinedload(Appointment.provider), joinedload(Appointment.patient)))
         .filter(
             Appointment.clinic_id == clinic.id,
             Appointment.status == AppointmentStatus.PENDING,
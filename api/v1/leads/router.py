@@ -4,10 +4,11 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_authorized_clinic, get_db
-from database.models import Clinic, Lead, LeadStatus
+from database.models import LEAD_STATUS_MAP, Clinic, Lead
 
 from api.v1.leads.schemas import (
     LeadCreateRequest,
@@ -20,9 +21,30 @@ logger = logging.getLogger("dental-receptionist")
 
 router = APIRouter(prefix="/api/leads", tags=["leads"])
 
+# The list endpoint selects just the LeadResponse columns as plain rows
+# (no ORM entities) and validates the whole list in one TypeAdapter call, so
+# the per-row loop runs inside pydantic-core rather than in Python.
+_LEAD_RESPONSE_COLUMNS = tuple(getattr(Lead, name) for name in LeadResponse.model_fields)
+_LEAD_LIST_ADAPTER = TypeAdapter(List[LeadResponse])
+
+
+def _commit_and_respond(db: Session, lead: Lead) -> LeadResponse:
+    """Flush, snapshot the response, then commit.
+
+    Every LeadResponse field is already in memory after the flush (Lead's
+    defaults are all client-side and updated_at is set explicitly on
+    updates), so building the response before the commit expires the
+    instance avoids the refresh SELECT. The write stays an ORM flush so
+    the PHI audit listener still records it.
+    """
+    db.flush()
+    response = LeadResponse.model_validate(lead)
+    db.commit()
+    return response
+
 
 @router.post("", response_model=LeadResponse)
-async def create_lead(
+def create_lead(
     lead_data: LeadCreateRequest,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
@@ -32,9 +54,7 @@ async def create_lead(
         lead_dict = lead_data.model_dump(exclude_none=True)
         lead = Lead(clinic_id=clinic.id, **lead_dict)
         db.add(lead)
-        db.commit()
-        db.refresh(lead)
-        return LeadResponse.model_validate(lead)
+        return _commit_and_respond(db, lead)
     except Exception as e:
         db.rollback()
         logger.error(f"Error creating lead: {e}", exc_info=True)
@@ -42,61 +62,59 @@ async def create_lead(
 
 
 @router.get("", response_model=List[LeadResponse])
-async def list_leads(
+def list_leads(
     status: Optional[str] = Query(None, description="Filter by status"),
     source: Optional[str] = Query(None, description="Filter by source"),
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """List leads with optional filters."""
-    query = db.query(Lead).filter(Lead.clinic_id == clinic.id)
+    query = db.query(*_LEAD_RESPONSE_COLUMNS).filter(Lead.clinic_id == clinic.id)
     if status:
-        try:
-            status_enum = LeadStatus(status.upper())
-            query = query.filter(Lead.status == status_enum)
-        except ValueError:
+        status_enum = LEAD_STATUS_MAP.get(status.upper())
+        if status_enum is None:
             raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
+        query = query.filter(Lead.status == status_enum)
     if source:
         query = query.filter(Lead.source == source)
-    leads = query.order_by(Lead.created_at.desc()).all()
-    return [LeadResponse.model_validate(lead) for lead in leads]
+    rows = query.order_by(Lead.created_at.desc()).all()
+    return _LEAD_LIST_ADAPTER.validate_python(rows, from_attributes=True)
 
 
 @router.get("/{lead_id}", response_model=LeadResponse)
-async def get_lead(
+def get_lead(
     lead_id: str,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Get lead by ID."""
-    lead = db.query(Lead).filter(Lead.id == lead_id, Lead.clinic_id == clinic.id).first()
-    if not lead:
+    lead = db.get(Lead, lead_id)
+    if lead is None or lead.clinic_id != clinic.id:
         raise HTTPException(status_code=404, detail="Lead not found")
     return LeadResponse.model_validate(lead)
 
 
 @router.put("/{lead_id}", response_model=LeadResponse)
-async def update_lead(
+def update_lead(
     lead_id: str,
     lead_data: LeadUpdateRequest,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Update lead."""
-    lead = db.query(Lead).filter(Lead.id == lead_id, Lead.clinic_id == clinic.id).first()
-    if not lead:
+    lead = db.get(Lead, lead_id)
+    if lead is None or lead.clinic_id != clinic.id:
         raise HTTPException(status_code=404, detail="Lead not found")
 
     update_data = lead_data.model_dump(exclude_none=True)
 
     # Handle status update
     if "status" in update_data:
-        try:
-            status_enum = LeadStatus(update_data["status"].upper())
-            lead.status = status_enum
-            del update_data["status"]
-        except ValueError:
+        status_enum = LEAD_STATUS_MAP.get(update_data["status"].upper())
+        if status_enum is None:
             raise HTTPException(status_code=400, detail=f"Invalid status: {update_data['status']}")
+        lead.status = status_enum
+        del update_data["status"]
 
     # Update other fields
     for key, value in update_data.items():
@@ -104,34 +122,28 @@ async def update_lead(
             setattr(lead, key, value)
 
     lead.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(lead)
-    return LeadResponse.model_validate(lead)
+    return _commit_and_respond(db, lead)
 
 
 @router.put("/{lead_id}/status", response_model=LeadResponse)
-async def update_lead_status(
+def update_lead_status(
     lead_id: str,
     request: LeadStatusUpdateRequest,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Update lead status."""
-    try:
-        new_status = LeadStatus(request.status.upper())
-    except ValueError:
-        valid_statuses = [s.value for s in LeadStatus]
+    new_status = LEAD_STATUS_MAP.get(request.status.upper())
+    if new_status is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid status: {request.status}. Valid values: {', '.join(valid_statuses)}"
+            detail=f"Invalid status: {request.status}. Valid values: {', '.join(LEAD_STATUS_MAP)}"
         )
 
-    lead = db.query(Lead).filter(Lead.id == lead_id, Lead.clinic_id == clinic.id).first()
-    if not lead:
+    lead = db.get(Lead, lead_id)
+    if lead is None or lead.clinic_id != clinic.id:
         raise HTTPException(status_code=404, detail="Lead not found")
 
     lead.status = new_status
     lead.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(lead)
-    return LeadResponse.model_validate(lead)
+    return _commit_and_respond(db, lead)
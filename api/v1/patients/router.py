@@ -1,18 +1,21 @@
 """v1 patients router — /api/patients CRUD + /api/patients/verify."""
 import logging
-from datetime import datetime
+import re
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_authorized_clinic, get_db
-from database.models import Clinic, Patient
+from database.models import Clinic, Patient, phone_match_key
 
 from api.v1.patients.schemas import (
     PatientCreateRequest,
     PatientResponse,
+    PatientUpdateRequest,
     PatientVerifyRequest,
     PatientVerifyResponse,
 )
@@ -21,6 +24,30 @@ logger = logging.getLogger("dental-receptionist")
 
 router = APIRouter(prefix="/api/patients", tags=["patients"])
 
+# Read endpoints select exactly the PatientResponse columns and build the
+# response with model_construct — no ORM hydration or identity-map work for
+# rows that are only serialized. Keep in step with PatientResponse fields.
+_PATIENT_RESPONSE_COLUMNS = (
+    Patient.id,
+    Patient.first_name,
+    Patient.last_name,
+    Patient.phone,
+    Patient.email,
+    Patient.dob,
+)
+
+
+def _parse_dob(value: str) -> date:
+    """Parse a YYYY-MM-DD date of birth.
+
+    The canonical zero-padded form goes through the C-level
+    ``date.fromisoformat``; anything else falls back to the strptime format
+    this endpoint has always accepted (and its ValueError on bad input).
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return date.fromisoformat(value)
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
 
 def _phone_digits(phone: Optional[str]) -> str:
     """Reduce a phone string to its digits. Used to match patients regardless
@@ -28,28 +55,28 @@ def _phone_digits(phone: Optional[str]) -> str:
     Stored Patient.phone can be any of those forms — historical data is mixed."""
     if not phone:
         return ""
-    return "".join(c for c in phone if c.isdigit())
+    return re.sub(r"\D", "", phone)
 
 
 @router.get("", response_model=List[PatientResponse])
-async def list_patients(
+def list_patients(
     phone: Optional[str] = Query(None),
     email: Optional[str] = Query(None),
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """List patients with optional filters."""
-    query = db.query(Patient).filter(Patient.clinic_id == clinic.id)
+    stmt = select(*_PATIENT_RESPONSE_COLUMNS).where(Patient.clinic_id == clinic.id)
     if phone:
-        query = query.filter(Patient.phone == phone)
+        stmt = stmt.where(Patient.phone == phone)
     if email:
-        query = query.filter(Patient.email == email)
-    patients = query.all()
-    return [PatientResponse.model_validate(p) for p in patients]
+        stmt = stmt.where(Patient.email == email)
+    rows = db.execute(stmt).mappings().all()
+    return [PatientResponse.model_construct(**row) for row in rows]
 
 
 @router.post("/verify", response_model=PatientVerifyResponse)
-async def verify_patient(
+def verify_patient(
     request: PatientVerifyRequest,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
@@ -72,24 +99,29 @@ async def verify_patient(
         phone_digits = _phone_digits(request.phone)
 
         # Parse DOB
-        from datetime import date as date_type
-        dob_date = datetime.strptime(request.dob, '%Y-%m-%d').date()
-
-        # Narrow by suffix (last 10 digits) using an indexable LIKE, then
-        # suffix-compare in Python — stored phones can be E.164
-        # ("+13682990959"), digits-only ("13682990959"), or formatted
-        # ("(403) 555-0199"), and lookup phones may or may not include the
-        # country code. Comparing the last 10 digits collapses all of those
-        # to the same NANP subscriber number.
+        dob_date = _parse_dob(request.dob)
+
+        # Stored phones can be E.164 ("+13682990959"), digits-only
+        # ("13682990959"), or formatted ("(403) 555-0199"), and lookup phones
+        # may or may not include the country code. Comparing the last 10
+        # digits collapses all of those to the same NANP subscriber number,
+        # which Patient.phone_normalized holds precomputed — an indexed
+        # equality. Shorter inputs keep the suffix scan.
         suffix = phone_digits[-10:] if len(phone_digits) >= 10 else phone_digits
-        candidates = db.query(Patient).filter(
-            Patient.clinic_id == clinic.id,
-            Patient.phone.like(f"%{suffix}"),
-        ).all() if suffix else []
-        patient = next(
-            (p for p in candidates if _phone_digits(p.phone).endswith(suffix)),
-            None,
-        )
+        if len(suffix) == 10:
+            patient = db.query(Patient).filter(
+                Patient.clinic_id == clinic.id,
+                Patient.phone_normalized == phone_match_key(suffix),
+            ).first()
+        else:
+            candidates = db.query(Patient).filter(
+                Patient.clinic_id == clinic.id,
+                Patient.phone.like(f"%{suffix}"),
+            ).all() if suffix else []
+            patient = next(
+                (p for p in candidates if _phone_digits(p.phone).endswith(suffix)),
+                None,
+            )
 
         if not patient:
             raise HTTPException(status_code=404, detail="Patient not found")
@@ -101,7 +133,7 @@ async def verify_patient(
         # Compare DOB (handle both date and string formats)
         patient_dob = patient.dob
         if isinstance(patient_dob, str):
-            patient_dob = datetime.strptime(patient_dob, '%Y-%m-%d').date()
+            patient_dob = _parse_dob(patient_dob)
 
         if patient_dob != dob_date:
             raise HTTPException(status_code=404, detail="Patient verification failed")
@@ -119,20 +151,24 @@ async def verify_patient(
 
 
 @router.get("/{patient_id}", response_model=PatientResponse)
-async def get_patient(
+def get_patient(
     patient_id: str,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Get patient by ID."""
-    patient = db.query(Patient).filter(Patient.id == patient_id, Patient.clinic_id == clinic.id).first()
-    if not patient:
+    row = db.execute(
+        select(*_PATIENT_RESPONSE_COLUMNS).where(
+            Patient.id == patient_id, Patient.clinic_id == clinic.id,
+        )
+    ).mappings().first()
+    if not row:
         raise HTTPException(status_code=404, detail="Patient not found")
-    return PatientResponse.model_validate(patient)
+    return PatientResponse.model_construct(**row)
 
 
 @router.post("", response_model=PatientResponse)
-async def create_patient(
+def create_patient(
     patient_data: PatientCreateRequest,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
@@ -144,9 +180,8 @@ async def create_patient(
 
         # Convert dob string to date if provided
         if 'dob' in patient_dict and patient_dict['dob']:
-            from datetime import date as date_type
             if isinstance(patient_dict['dob'], str):
-                patient_dict['dob'] = datetime.strptime(patient_dict['dob'], '%Y-%m-%d').date()
+                patient_dict['dob'] = _parse_dob(patient_dict['dob'])
 
         patient = Patient(clinic_id=clinic.id, **patient_dict)
         db.add(patient)
@@ -155,29 +190,30 @@ async def create_patient(
         return PatientResponse.model_validate(patient)
     except Exception as e:
         db.rollback()
-        import traceback
         error_detail = str(e)
-        print(f"Error creating patient: {error_detail}")
-        traceback.print_exc()
+        logger.error("Error creating patient: %s", error_detail, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to create patient: {error_detail}")
 
 
 @router.put("/{patient_id}", response_model=PatientResponse)
-async def update_patient(
+def update_patient(
     patient_id: str,
-    patient_data: dict,
+    patient_data: PatientUpdateRequest,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """Update patient."""
-    patient = db.query(Patient).filter(Patient.id == patient_id, Patient.clinic_id == clinic.id).first()
-    if not patient:
+    patient = db.get(Patient, patient_id)
+    if patient is None or patient.clinic_id != clinic.id:
         raise HTTPException(status_code=404, detail="Patient not found")
-    for key, value in patient_data.items():
-        if hasattr(patient, key):
-            setattr(patient, key, value)
+    # Written through the ORM (not a Core UPDATE) so the PHI audit
+    # before_flush hook records the change and the phone validator keeps
+    # phone_normalized in sync.
+    for key, value in patient_data.model_dump(exclude_unset=True).items():
+        setattr(patient, key, value)
+    # The response only reads columns set or loaded above; skip the reload.
+    db.expire_on_commit = False
     db.commit()
-    db.refresh(patient)
     return PatientResponse.model_validate(patient)
 
 
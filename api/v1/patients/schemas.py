@@ -19,6 +19,24 @@ class PatientCreateRequest(BaseModel):
     consent_approved: Optional[bool] = False
 
 
+class PatientUpdateRequest(BaseModel):
+    """Request model for updating patient. Only fields sent are written.
+
+    Unknown keys (including id / clinic_id) are ignored rather than rejected;
+    CRM columns go through PUT /api/patients/{id}/crm-rollup.
+    """
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    dob: Optional[date] = None
+    phone: Optional[str] = None
+    email: Optional[str] = None
+    insurance_provider: Optional[str] = None
+    is_minor: Optional[bool] = None
+    guardian_name: Optional[str] = None
+    guardian_contact: Optional[str] = None
+    consent_approved: Optional[bool] = None
+
+
 class PatientResponse(BaseModel):
     """Response model for patient."""
     id: str
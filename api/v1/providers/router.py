@@ -9,45 +9,46 @@ router = APIRouter(prefix="/api", tags=["providers"])
 
 
 @router.get("/doctors")
-async def list_doctors_alias(
+def list_doctors_alias(
     db: Session = Depends(get_db), clinic: Clinic = Depends(get_authorized_clinic)
 ):
     """Legacy alias — frontend code that hasn't migrated to /api/providers."""
-    providers = db.query(Provider).filter(Provider.clinic_id == clinic.id).all()
+    rows = (
+        db.query(Provider.id, Provider.name, Provider.title, Provider.specialty)
+        .filter(Provider.clinic_id == clinic.id)
+        .all()
+    )
     return [
-        {
-            "id": p.id,
-            "name": p.name,
-            "title": p.title,
-            "specialty": getattr(p, "specialty", None),
-        }
-        for p in providers
+        {"id": r.id, "name": r.name, "title": r.title, "specialty": r.specialty}
+        for r in rows
     ]
 
 
 @router.get("/providers")
-async def list_providers(
+def list_providers(
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
 ):
     """List all active providers."""
-    providers = db.query(Provider).filter(
+    rows = db.query(
+        Provider.id, Provider.name, Provider.title, Provider.specialty, Provider.is_active
+    ).filter(
         Provider.clinic_id == clinic.id, Provider.is_active == True
     ).all()
     return [
         {
-            "id": p.id,
-            "name": p.name,
-            "title": p.title,
-            "specialty": p.specialty,
-            "is_active": p.is_active,
+            "id": r.id,
+            "name": r.name,
+            "title": r.title,
+            "specialty": r.specialty,
+            "is_active": r.is_active,
         }
-        for p in providers
+        for r in rows
     ]
 
 
 @router.get("/providers/{provider_id}")
-async def get_provider(
+def get_provider(
     provider_id: int,
     db: Session = Depends(get_db),
     clinic: Clinic = Depends(get_authorized_clinic),
@@ -170,17 +170,13 @@ def promote_patient(
 # Stage machine
 # ---------------------------------------------------------------------------
 STAGE_ORDER = ["consult", "prelim_imp", "final_imp", "bite_reg", "wax_tryin", "insert", "adjust", "complete"]
+_NEXT_STAGE = dict(zip(STAGE_ORDER, STAGE_ORDER[1:]))
 
 
 def _next_stages(current: str) -> List[str]:
     """Return the single valid next stage (no skipping)."""
-    try:
-        idx = STAGE_ORDER.index(current)
-    except ValueError:
-        return []
-    if idx + 1 < len(STAGE_ORDER):
-        return [STAGE_ORDER[idx + 1]]
-    return []
+    nxt = _NEXT_STAGE.get(current)
+    return [nxt] if nxt else []
 
 
 # ---------------------------------------------------------------------------
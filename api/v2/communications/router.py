@@ -112,20 +112,19 @@ def list_communications(
 
 @router.patch("/threads/{thread_key}/read")
 def mark_thread_read(thread_key: str, clinic: Clinic = Depends(get_authorized_clinic), db: Session = Depends(get_db)):
-    now = datetime.utcnow()
-    rows = (
+    # One UPDATE for the whole thread: no SELECT of the unread rows first, and
+    # no window between reading and writing them for a new message to slip in.
+    updated = (
         db.query(Communication)
         .filter(
             Communication.clinic_id == clinic.id,
             Communication.thread_key == thread_key,
             Communication.read_at.is_(None),
         )
-        .all()
+        .update({Communication.read_at: datetime.utcnow()}, synchronize_session=False)
     )
-    for r in rows:
-        r.read_at = now
     db.commit()
-    return {"updated": len(rows)}
+    return {"updated": updated}
 
 
 # ---------------------------------------------------------------------------
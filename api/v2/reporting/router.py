@@ -55,21 +55,15 @@ def get_kpi(clinic: Clinic = Depends(get_authorized_clinic), db: Session = Depen
 
     # No-show rate over last 90 days
     cutoff = now - timedelta(days=90)
-    total_appts = (
-        db.query(func.count(Appointment.id))
-        .filter(Appointment.clinic_id == clinic.id, Appointment.start_time >= cutoff)
-        .scalar()
-        or 0
-    )
-    no_shows = (
-        db.query(func.count(Appointment.id))
-        .filter(
-            Appointment.clinic_id == clinic.id,
-            Appointment.start_time >= cutoff,
-            Appointment.status == AppointmentStatus.NO_SHOW,
+    # Both counts come from one scan: COUNT(*) FILTER (WHERE ...) for the
+    # no-shows alongside the plain total.
+    total_appts, no_shows = (
+        db.query(
+            func.count(Appointment.id),
+            func.count(Appointment.id).filter(Appointment.status == AppointmentStatus.NO_SHOW),
         )
-        .scalar()
-        or 0
+        .filter(Appointment.clinic_id == clinic.id, Appointment.start_time >= cutoff)
+        .one()
     )
     no_show_rate = (no_shows / total_appts) if total_appts else 0.0
 
@@ -24,6 +24,10 @@ logger = logging.getLogger("dental-receptionist")
 
 _scheduler_task = None
 
+# Max reminder sends in flight at once (Twilio/Telnyx accept concurrent
+# requests; this keeps a large batch from opening dozens of connections).
+_SEND_CONCURRENCY = 10
+
 
 @dataclass
 class _DueReminder:
@@ -69,15 +73,16 @@ async def _dispatch_due_reminders(get_db_factory):
     due = _collect_due_reminders(get_db_factory)
     if not due:
         return
-    results = _send_reminders(due)
+    results = await _send_reminders(due)
     _persist_reminder_results(get_db_factory, results)
 
 
 def _collect_due_reminders(get_db_factory) -> list[_DueReminder]:
     """Phase 1 — open a session, read due reminders + the patient/appointment
     data needed to build each message, then close the session. No sends here."""
+    from sqlalchemy.orm import joinedload
     from database.ops.models import AppointmentReminder
-    from database.models import Appointment, Patient, Clinic
+    from database.models import Appointment, Clinic
     from services.tz_utils import to_clinic_local
 
     now = datetime.utcnow()
@@ -92,16 +97,27 @@ def _collect_due_reminders(get_db_factory) -> list[_DueReminder]:
             AppointmentReminder.scheduled_at >= now - timedelta(minutes=5),
         ).all()
 
-        # Cache clinic rows by id so we don't issue an N+1 query per reminder.
-        clinic_cache: dict = {}
-
-        def _clinic_for(apt):
-            if apt.clinic_id not in clinic_cache:
-                clinic_cache[apt.clinic_id] = db.query(Clinic).filter(Clinic.id == apt.clinic_id).first()
-            return clinic_cache[apt.clinic_id]
+        # Prefetch every appointment (with its patient) and clinic the batch
+        # needs in one IN query each, instead of an N+1 lookup per reminder.
+        apts_by_id = {}
+        if reminders:
+            apts_by_id = {
+                apt.id: apt
+                for apt in db.query(Appointment)
+                .options(joinedload(Appointment.patient))
+                .filter(Appointment.id.in_({r.appointment_id for r in reminders}))
+            }
+        clinics_by_id = {}
+        if apts_by_id:
+            clinics_by_id = {
+                clinic.id: clinic
+                for clinic in db.query(Clinic).filter(
+                    Clinic.id.in_({apt.clinic_id for apt in apts_by_id.values()})
+                )
+            }
 
         for reminder in reminders:
-            apt = db.query(Appointment).filter(Appointment.id == reminder.appointment_id).first()
+            apt = apts_by_id.get(reminder.appointment_id)
             if not apt:
                 due.append(_DueReminder(
                     reminder_id=reminder.id, channel=reminder.channel,
@@ -109,14 +125,14 @@ def _collect_due_reminders(get_db_factory) -> list[_DueReminder]:
                 ))
                 continue
 
-            patient = db.query(Patient).filter(Patient.id == apt.patient_id).first()
+            patient = apt.patient
 
             if reminder.channel == "sms" and patient and patient.phone:
                 # apt.start_time is stored as naive UTC (Postgres
                 # `timestamp without time zone`); render the body in the
                 # appointment's clinic-local tz so the patient sees their
                 # wall-clock time, not UTC.
-                local = to_clinic_local(apt.start_time, _clinic_for(apt))
+                local = to_clinic_local(apt.start_time, clinics_by_id.get(apt.clinic_id))
                 body = f"Reminder: appointment on {local.strftime('%Y-%m-%d %H:%M')}"
                 due.append(_DueReminder(
                     reminder_id=reminder.id, channel="sms",
@@ -138,70 +154,94 @@ def _collect_due_reminders(get_db_factory) -> list[_DueReminder]:
     return due
 
 
-def _send_reminders(due: list[_DueReminder]) -> list[_ReminderResult]:
-    """Phase 2 — pure I/O. Call Twilio/email with NO DB session held."""
-    from clients.sms_client import _send_sms_sync
-
-    results: list[_ReminderResult] = []
-    for item in due:
-        if item.precheck_error:
-            results.append(_ReminderResult(
-                reminder_id=item.reminder_id, status="failed",
-                failure_reason=item.precheck_error,
-            ))
-            continue
-
-        try:
-            if item.channel == "sms":
-                ok = _send_sms_sync(item.phone, item.body)
-                if ok:
-                    results.append(_ReminderResult(
-                        reminder_id=item.reminder_id, status="sent",
-                        sent_at=datetime.utcnow(),
-                    ))
-                else:
-                    results.append(_ReminderResult(
-                        reminder_id=item.reminder_id, status="failed",
-                        failure_reason="SMS send failed",
-                    ))
-            elif item.channel == "email":
-                logger.info("Email reminder stub: to=%s", item.email)
-                results.append(_ReminderResult(
+def _send_one(item: _DueReminder, send_sms) -> _ReminderResult:
+    """Send a single reminder (blocking). Never raises; failures become results."""
+    if item.precheck_error:
+        return _ReminderResult(
+            reminder_id=item.reminder_id, status="failed",
+            failure_reason=item.precheck_error,
+        )
+    try:
+        if item.channel == "sms":
+            if send_sms(item.phone, item.body):
+                return _ReminderResult(
                     reminder_id=item.reminder_id, status="sent",
                     sent_at=datetime.utcnow(),
-                ))
-            else:
-                results.append(_ReminderResult(
-                    reminder_id=item.reminder_id, status="failed",
-                    failure_reason="No contact info",
-                ))
-        except Exception as e:
-            results.append(_ReminderResult(
+                )
+            return _ReminderResult(
                 reminder_id=item.reminder_id, status="failed",
-                failure_reason=str(e),
-            ))
+                failure_reason="SMS send failed",
+            )
+        if item.channel == "email":
+            logger.info("Email reminder stub: to=%s", item.email)
+            return _ReminderResult(
+                reminder_id=item.reminder_id, status="sent",
+                sent_at=datetime.utcnow(),
+            )
+        return _ReminderResult(
+            reminder_id=item.reminder_id, status="failed",
+            failure_reason="No contact info",
+        )
+    except Exception as e:
+        return _ReminderResult(
+            reminder_id=item.reminder_id, status="failed",
+            failure_reason=str(e),
+        )
+
+
+async def _send_reminders(due: list[_DueReminder]) -> list[_ReminderResult]:
+    """Phase 2 — pure I/O. Call Twilio/email with NO DB session held.
+
+    Sends are independent, so they run in worker threads up to
+    _SEND_CONCURRENCY at a time: a batch costs about N / _SEND_CONCURRENCY
+    provider round trips instead of N, and the event loop is never blocked.
+    Results keep the order of ``due``."""
+    from clients.sms_client import _send_sms_sync
 
-    return results
+    sem = asyncio.Semaphore(_SEND_CONCURRENCY)
+
+    async def _bounded(item: _DueReminder) -> _ReminderResult:
+        if item.precheck_error:
+            return _send_one(item, _send_sms_sync)
+        async with sem:
+            return await asyncio.to_thread(_send_one, item, _send_sms_sync)
+
+    return list(await asyncio.gather(*(_bounded(item) for item in due)))
 
 
 def _persist_reminder_results(get_db_factory, results: list[_ReminderResult]) -> None:
-    """Phase 3 — open a fresh session, write sent/failed back, commit, close."""
+    """Phase 3 — open a fresh session, write sent/failed back, commit, close.
+
+    One executemany UPDATE keyed by reminder id carries the whole batch, so
+    the write-back is a single round trip however many reminders went out.
+    A reminder deleted in the meantime simply matches no row."""
+    from sqlalchemy import bindparam, update
     from database.ops.models import AppointmentReminder
 
     if not results:
         return
 
+    table = AppointmentReminder.__table__
+    stmt = (
+        update(table)
+        .where(table.c.id == bindparam("b_id"))
+        .values(
+            status=bindparam("b_status"),
+            sent_at=bindparam("b_sent_at"),
+            failure_reason=bindparam("b_failure_reason"),
+        )
+    )
     db = next(get_db_factory())
     try:
-        for result in results:
-            reminder = db.query(AppointmentReminder).filter(
-                AppointmentReminder.id == result.reminder_id
-            ).first()
-            if reminder is None:
-                continue
-            reminder.status = result.status
-            reminder.sent_at = result.sent_at
-            reminder.failure_reason = result.failure_reason
+        db.execute(stmt, [
+            {
+                "b_id": result.reminder_id,
+                "b_status": result.status,
+                "b_sent_at": result.sent_at,
+                "b_failure_reason": result.failure_reason,
+            }
+            for result in results
+        ])
         db.commit()
     finally:
         db.close()
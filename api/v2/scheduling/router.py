@@ -19,18 +19,11 @@ from database.ops.models import (
     AppointmentReminder, WaitlistEntry, RecallRule, Recall,
 )
 from api.dependencies import get_authorized_clinic
+from services.appointments import ACTIVE_STATUSES
 from services.tz_utils import to_clinic_local, to_storage_utc_clinic
 
 router = APIRouter(prefix="/api/v2/scheduling", tags=["v2-scheduling"])
 
-ACTIVE_STATUSES = (
-    AppointmentStatus.SCHEDULED,
-    AppointmentStatus.CONFIRMED,
-    AppointmentStatus.PENDING_SYNC,
-    AppointmentStatus.PENDING,
-)
-
-
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -42,19 +35,28 @@ def _parse_dt(s: str) -> datetime:
     clinic-local wall-clock via ``to_storage_utc_clinic``). Offset-aware input
     is returned **with its offset preserved** — never stripped — so the caller's
     conversion honors the caller's stated zone. ``datetime.fromisoformat`` parses
-    offsets in 3.11+, so we delegate the aware branch to it."""
+    offsets in 3.11+, so we delegate the aware branch to it.
+
+    The C-level ``fromisoformat`` is tried first; it accepts every padded
+    ISO form the strptime formats do, so the (much slower, pure-Python)
+    strptime loop only runs for non-zero-padded input."""
+    try:
+        return datetime.fromisoformat(s)
+    except ValueError:
+        pass
     for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M"):
         try:
             return datetime.strptime(s, fmt)
         except ValueError:
             pass
-    # Fallback: ISO 8601 (incl. offset / 'Z'). Preserves any tzinfo present.
-    return datetime.fromisoformat(s)
+    return datetime.fromisoformat(s)  # re-raise the ISO parse error
 
 
 def _check_provider_conflict(db: Session, clinic_id: str, provider_id: int,
-                              start: datetime, end: datetime, exclude_id: str = None):
-    q = db.query(Appointment).filter(
+                              start: datetime, end: datetime, exclude_id: str = None) -> bool:
+    # Callers only need "is there any overlap": an EXISTS probe lets the DB
+    # stop at the first hit instead of loading an Appointment entity.
+    q = db.query(Appointment.id).filter(
         Appointment.clinic_id == clinic_id,
         Appointment.provider_id == provider_id,
         Appointment.status.in_(ACTIVE_STATUSES),
@@ -63,12 +65,12 @@ def _check_provider_conflict(db: Session, clinic_id: str, provider_id: int,
     )
     if exclude_id:
         q = q.filter(Appointment.id != exclude_id)
-    return q.first()
+    return bool(db.query(q.exists()).scalar())
 
 
 def _check_operatory_conflict(db: Session, operatory_id: str,
-                               start: datetime, end: datetime, exclude_apt_id: str = None):
-    q = db.query(AppointmentResource).join(
+                               start: datetime, end: datetime, exclude_apt_id: str = None) -> bool:
+    q = db.query(AppointmentResource.id).join(
         Appointment, AppointmentResource.appointment_id == Appointment.id
     ).filter(
         AppointmentResource.operatory_id == operatory_id,
@@ -78,7 +80,7 @@ def _check_operatory_conflict(db: Session, operatory_id: str,
     )
     if exclude_apt_id:
         q = q.filter(AppointmentResource.appointment_id != exclude_apt_id)
-    return q.first()
+    return bool(db.query(q.exists()).scalar())
 
 
 # ---------------------------------------------------------------------------
@@ -13,13 +13,13 @@ On match, dispatches an action based on the parsed reply intent:
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
 from datetime import datetime, timedelta, timezone
 
 import httpx
-from fastapi import APIRouter, Depends, Header, HTTPException, Request
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request
 from sqlalchemy.orm import Session
 
 from clients import telnyx_messaging
@@ -47,9 +47,18 @@ def _reschedule_link(token: str | None) -> str:
     return f"{base}/p/reschedule/{token or ''}"
 
 
+def _send_ack_sms(*, to: str, body: str, from_: str | None) -> None:
+    """Best-effort reminder-reply acknowledgement; runs as a background task."""
+    try:
+        sms_service.send_sms_raw(to=to, body=body, from_=from_)
+    except Exception as exc:
+        logger.warning("Failed to send ack SMS to %s: %s", to, exc)
+
+
 @router.post("/sms-inbound")
 async def sms_inbound(
     request: Request,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     signature: str | None = Header(None, alias="Telnyx-Signature-ED25519"),
     timestamp: str | None = Header(None, alias="Telnyx-Timestamp"),
@@ -62,7 +71,15 @@ async def sms_inbound(
     ):
         raise HTTPException(status_code=401, detail="invalid telnyx signature")
 
-    payload = json.loads(raw)
+    # Telnyx always posts a strict-JSON object, so decode the raw bytes with
+    # orjson directly (no str decode, no stdlib fallback). Anything that isn't
+    # a JSON object is rejected up front instead of 500ing on .get() below.
+    if not raw.lstrip().startswith(b"{"):
+        raise HTTPException(status_code=400, detail="invalid telnyx payload")
+    try:
+        payload = orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="invalid telnyx payload")
     data = payload.get("data", {})
     if data.get("event_type") != "message.received":
         return {"routed_to": "ignored_event", "event_type": data.get("event_type")}
@@ -160,18 +177,19 @@ async def sms_inbound(
         if reminder.ambiguous_reply_count < 2:
             ack_body = sms_templates.render("ack_ambiguous", "en")
 
-    if ack_body:
-        try:
-            sms_service.send_sms_raw(
-                to=from_phone,
-                body=ack_body,
-                from_=(clinic.sms_from_number if clinic else None),
-            )
-        except Exception as exc:
-            logger.warning("Failed to send ack SMS to %s: %s", from_phone, exc)
-
     db.commit()
 
+    # The ack is best-effort and the reply is already recorded, so send it
+    # after the response instead of holding Telnyx's webhook (and the event
+    # loop — the provider clients are blocking) on the outbound API call.
+    if ack_body:
+        background_tasks.add_task(
+            _send_ack_sms,
+            to=from_phone,
+            body=ack_body,
+            from_=(clinic.sms_from_number if clinic else None),
+        )
+
     return {
         "routed_to": "reminder_match",
         "intent": intent.value,
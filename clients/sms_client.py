@@ -9,6 +9,7 @@ SMS_DELAY_SECONDS (default 0) delays sending; use with background tasks.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import os
 from typing import Optional
@@ -36,6 +37,24 @@ def _append_clinic_contact_suffix(
     return f"{base} {' '.join(extras)}"
 
 
+@functools.lru_cache(maxsize=2)
+def _twilio_client(account_sid: str, auth_token: str):
+    """Process-wide Twilio client per credential pair.
+
+    The client owns a requests.Session, so reusing it keeps the TLS
+    connection to api.twilio.com alive between sends. Keyed on the
+    credentials so a rotated token gets a fresh client.
+    """
+    from twilio.rest import Client
+    return Client(account_sid, auth_token)
+
+
+def _drop_client_on_auth_error(exc: Exception) -> None:
+    """Forget the cached client if Twilio rejected its credentials."""
+    if getattr(exc, "status", None) in (401, 403):
+        _twilio_client.cache_clear()
+
+
 def _send_via_twilio(*, to: str, body: str, from_: str | None = None) -> str | None:
     """Pure Twilio transport. No body construction, no SEND_BOOKING_SMS toggle.
 
@@ -55,11 +74,11 @@ def _send_via_twilio(*, to: str, body: str, from_: str | None = None) -> str | N
         return None
 
     try:
-        from twilio.rest import Client
-        client = Client(account_sid, auth_token)
+        client = _twilio_client(account_sid, auth_token)
         msg = client.messages.create(body=body, from_=from_phone, to=to)
         return msg.sid
     except Exception as e:
+        _drop_client_on_auth_error(e)
         logger.error("Twilio SMS failed: %s", e, exc_info=True)
         return None
 
@@ -203,11 +222,11 @@ def send_whatsapp(to: str, body: str) -> dict:
     to_wa = to if to.startswith("whatsapp:") else f"whatsapp:{to}"
 
     try:
-        from twilio.rest import Client
-        client = Client(account_sid, auth_token)
+        client = _twilio_client(account_sid, auth_token)
         msg = client.messages.create(body=body, from_=from_wa, to=to_wa)
         return {"sid": msg.sid}
     except Exception as e:
+        _drop_client_on_auth_error(e)
         logger.error("Twilio WhatsApp failed: %s", e, exc_info=True)
         return {"sid": None}
 
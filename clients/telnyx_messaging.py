@@ -6,6 +6,7 @@ services/sms_templates.py; send dispatching happens in services/sms.py.
 from __future__ import annotations
 
 import base64
+import functools
 import logging
 import os
 import time
@@ -20,11 +21,22 @@ TELNYX_API_BASE = "https://api.telnyx.com/v2"
 MAX_SIGNATURE_AGE_SECONDS = 300
 
 
+@functools.lru_cache(maxsize=1)
 def _http_client() -> httpx.Client:
-    """httpx.Client per call. Tests monkeypatch this function."""
+    """Process-wide httpx.Client so sends reuse pooled TLS connections.
+
+    Credentials travel per request in headers, so nothing here goes stale.
+    Tests monkeypatch this function.
+    """
     return httpx.Client(timeout=10.0)
 
 
+@functools.lru_cache(maxsize=4)
+def _verify_key(public_key_b64: str) -> nacl.signing.VerifyKey:
+    """Decode the profile public key once per distinct TELNYX_PUBLIC_KEY value."""
+    return nacl.signing.VerifyKey(base64.b64decode(public_key_b64))
+
+
 def send_message(*, to: str, body: str, from_: str | None = None) -> str | None:
     """Send one SMS via Telnyx. Returns message ID on success, None on failure.
 
@@ -96,7 +108,7 @@ def verify_webhook_signature(payload: bytes, signature_b64: str, timestamp: str)
         return False
 
     try:
-        verify_key = nacl.signing.VerifyKey(base64.b64decode(public_key_b64))
+        verify_key = _verify_key(public_key_b64)
         sig_bytes = base64.b64decode(signature_b64)
         signed_message = timestamp.encode() + b"|" + payload
         verify_key.verify(signed_message, sig_bytes)
@@ -1,60 +1,94 @@
 """Database connection and session management."""
 
 import os
-from pathlib import Path
+import re
+
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.ext.declarative import declarative_base
 
-# Load environment variables from .env files
-# Try multiple locations: project root, current directory
-project_root = Path(__file__).parent.parent
-env_files = [
-    project_root / ".env.local",
-    project_root / ".env",
-    Path.cwd() / ".env.local",
-    Path.cwd() / ".env",
-]
-
-for env_file in env_files:
-    if env_file.exists():
-        load_dotenv(env_file)
+# Database URL variables, in priority order:
+# Vercel Postgres variables → DATABASE_URL → SQLite default (below).
+_DATABASE_URL_VARS = (
+    "POSTGRES_URL",              # Vercel Postgres direct connection
+    "POSTGRES_PRISMA_URL",       # Vercel Postgres Prisma connection
+    "POSTGRES_URL_NON_POOLING",  # Vercel Postgres non-pooling
+    "DATABASE_URL",              # Custom DATABASE_URL (for Supabase, etc.)
+)
+_SQLITE_FALLBACK_URL = "sqlite:////tmp/dental_clinic.db"  # local dev (writable)
+
+
+def _database_url_from_env():
+    """First non-empty _DATABASE_URL_VARS value, or None."""
+    environ = os.environ
+    for name in _DATABASE_URL_VARS:
+        value = environ.get(name)
+        if value:
+            return value
+    return None
+
+
+# Platform markers (Vercel, Cloud Run) — those deployments inject their whole
+# config as environment variables and ship no .env file.
+_PLATFORM_ENV_MARKERS = ("VERCEL", "K_SERVICE")
+
+
+def load_env_files(env_dirs) -> None:
+    """Load the first .env.local / .env found in env_dirs (in order).
+
+    load_dotenv never overrides variables already set, so an exported
+    DATABASE_URL (run_local.sh, the sync_db/migrate_* commands) still wins
+    while the file supplies every other setting. Skipped on hosted platforms,
+    where probing the filesystem only costs cold-start stats.
+    """
+    if any(os.environ.get(name) for name in _PLATFORM_ENV_MARKERS):
+        return
+    # open() doubles as the existence check: one syscall per candidate
+    # instead of a stat() followed by dotenv's own stat() + open().
+    for env_file in [os.path.join(d, name) for d in env_dirs for name in (".env.local", ".env")]:
+        try:
+            with open(env_file, encoding="utf-8") as stream:
+                load_dotenv(stream=stream)
+        except FileNotFoundError:
+            continue
         break
 
-# Get database URL from environment
-# Priority: Vercel Postgres variables → DATABASE_URL → SQLite default
-# Vercel Postgres automatically provides POSTGRES_URL and POSTGRES_PRISMA_URL
-DATABASE_URL = (
-    os.getenv("POSTGRES_URL") or             # Vercel Postgres direct connection
-    os.getenv("POSTGRES_PRISMA_URL") or      # Vercel Postgres Prisma connection
-    os.getenv("POSTGRES_URL_NON_POOLING") or # Vercel Postgres non-pooling
-    os.getenv("DATABASE_URL") or             # Custom DATABASE_URL (for Supabase, etc.)
-    "sqlite:////tmp/dental_clinic.db"        # Fallback to SQLite for local dev (writable)
-)
+
+# Load environment variables from .env files
+# Try multiple locations: project root, current directory.
+_env_dirs = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+_cwd = os.getcwd()
+if _cwd != _env_dirs[0]:  # same two files when started from the project root
+    _env_dirs.append(_cwd)
+load_env_files(_env_dirs)
+DATABASE_URL = _database_url_from_env() or _SQLITE_FALLBACK_URL
 
 # Normalize postgres:// to postgresql:// (SQLAlchemy requires postgresql://)
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-# Remove Supabase-specific parameters that SQLAlchemy doesn't understand
-# Supabase adds parameters like "supa=base-pooler.x" which cause errors
-if "supa=" in DATABASE_URL:
-    from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-    parsed = urlparse(DATABASE_URL)
-    query_params = parse_qs(parsed.query)
-    # Remove Supabase-specific parameters
-    query_params.pop("supa", None)
-    # Rebuild URL without Supabase params
-    new_query = urlencode(query_params, doseq=True)
-    DATABASE_URL = urlunparse((
-        parsed.scheme,
-        parsed.netloc,
-        parsed.path,
-        parsed.params,
-        new_query,
-        parsed.fragment
-    ))
+# Remove pooler-specific URL parameters that libpq/psycopg2 reject as
+# "invalid connection option": Supabase adds "supa=base-pooler.x", and the
+# Vercel/Prisma pooler URL (POSTGRES_PRISMA_URL) carries "pgbouncer=true".
+# Matched with one precompiled regex (other parameters are left byte-for-byte
+# as given) behind a substring check, so the usual URL costs no parsing.
+_NON_LIBPQ_PARAMS = ("supa", "pgbouncer")
+_NON_LIBPQ_PARAM_RE = re.compile(
+    r"(?<=[?&])(?:%s)=[^&#]*&?" % "|".join(_NON_LIBPQ_PARAMS)
+)
+
+
+def strip_non_libpq_params(database_url: str) -> str:
+    """Return database_url without the query parameters in _NON_LIBPQ_PARAMS."""
+    if not any(f"{name}=" in database_url for name in _NON_LIBPQ_PARAMS):
+        return database_url
+    base, sep, query = database_url.partition("?")
+    query = _NON_LIBPQ_PARAM_RE.sub("", sep + query)[1:].rstrip("&")
+    return f"{base}?{query}" if query else base
+
+
+DATABASE_URL = strip_non_libpq_params(DATABASE_URL)
 
 # Create engine.
 #
@@ -76,6 +110,10 @@ if "supa=" in DATABASE_URL:
 # spinner never resolved. A 10s checkout timeout surfaces the failure well
 # under the request timeout instead of hanging. Do NOT switch to NullPool
 # (it would worsen cold-start latency). See 2026-06-25 plan.
+#
+# DB_POOL_SIZE / DB_MAX_OVERFLOW override the 5 + 10 budget per deployment
+# (e.g. a single-revision service in front of a transaction-mode pooler can
+# afford more); keep instances x (size + overflow) under max_connections.
 def build_engine_kwargs(database_url: str) -> dict:
     """Return the create_engine kwargs for a given DATABASE_URL.
 
@@ -84,20 +122,20 @@ def build_engine_kwargs(database_url: str) -> dict:
     edit. SQLite (tests/local) gets only check_same_thread=False.
     """
     kwargs: dict = {}
-    if "sqlite" in database_url:
+    if database_url.startswith("sqlite"):
         kwargs["connect_args"] = {"check_same_thread": False}
     else:
         kwargs.update(
             pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
+            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
             pool_timeout=10,
             pool_recycle=1800,
         )
     return kwargs
 
 
-_is_sqlite = "sqlite" in DATABASE_URL
+_is_sqlite = DATABASE_URL.startswith("sqlite")
 _engine_kwargs = build_engine_kwargs(DATABASE_URL)
 engine = create_engine(DATABASE_URL, **_engine_kwargs)
 
@@ -125,6 +163,14 @@ def get_db() -> Session:
 
 
 def init_db():
-    """Initialize database - create all tables."""
+    """Initialize database - create all tables.
+
+    Warm boots find every table already present: one table-name listing
+    then short-circuits the per-table existence checks create_all would
+    issue. Any missing table falls through to create_all as before.
+    """
     from database.models import Patient, Appointment, Provider, Service, Clinic, Lead
+    existing = set(inspect(engine).get_table_names())
+    if set(Base.metadata.tables) <= existing:
+        return
     Base.metadata.create_all(bind=engine)
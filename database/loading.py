@@ -0,0 +1,24 @@
+"""Loader options that make accidental lazy loads in list queries loud.
+
+Off by default. With `RAISE_ON_LAZY_LOAD=1` (tests/conftest.py sets it) every
+query built with list_options() also carries raiseload("*"), so serializing a
+relationship the query did not eager-load raises instead of silently issuing
+one SELECT per row. Production keeps ordinary lazy loading as the fallback.
+"""
+import os
+
+from sqlalchemy.orm import raiseload
+
+
+def _is_enabled() -> bool:
+    return os.getenv("RAISE_ON_LAZY_LOAD", "").strip() in {"1", "true", "True", "yes"}
+
+
+def list_options(*loaders) -> list:
+    """Return ``loaders`` (eager-load options), plus raiseload("*") when enabled.
+
+    Usage: ``db.query(Appointment).options(*list_options(joinedload(Appointment.patient)))``.
+    """
+    if _is_enabled():
+        return [*loaders, raiseload("*")]
+    return list(loaders)
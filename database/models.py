@@ -1,5 +1,6 @@
 """SQLAlchemy models for the dental clinic database."""
 
+import re
 import uuid
 from datetime import datetime, date
 from enum import Enum as PyEnum
@@ -7,11 +8,24 @@ from typing import Optional
 
 from sqlalchemy import Column, String, Integer, Boolean, DateTime, Date, Text, ForeignKey, Enum as SQLEnum, DECIMAL, Index, JSON, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 
 from database.connection import Base
 
 
+_NON_DIGITS = re.compile(r"\D")
+
+
+def phone_match_key(phone: Optional[str]) -> Optional[str]:
+    """Last 10 digits of a phone string — the NANP subscriber number.
+
+    Stored phones are mixed E.164 / digits-only / formatted, and lookups may
+    or may not carry the country code; all of those collapse to this key.
+    """
+    digits = _NON_DIGITS.sub("", phone or "")
+    return digits[-10:] or None
+
+
 class AppointmentStatus(str, PyEnum):
     """Appointment status enum."""
     SCHEDULED = "SCHEDULED"
@@ -34,6 +48,13 @@ class LeadStatus(str, PyEnum):
     LOST = "LOST"
 
 
+# value -> member lookups for parsing client-supplied status strings: a dict
+# get on the upper-cased value instead of Enum(...) scanning members and
+# raising ValueError on bad input.
+APPT_STATUS_MAP = {s.value: s for s in AppointmentStatus}
+LEAD_STATUS_MAP = {s.value: s for s in LeadStatus}
+
+
 DEFAULT_CLINIC_ID = "default"
 
 
@@ -98,6 +119,7 @@ class Patient(Base):
     last_name = Column(String, nullable=True)
     dob = Column(Date, nullable=True)
     phone = Column(String, nullable=True)
+    phone_normalized = Column(String, nullable=True)  # phone_match_key(phone); kept in sync below
     email = Column(String, nullable=True)
     insurance_provider = Column(String, nullable=True)
     is_minor = Column(Boolean, default=False)
@@ -115,6 +137,11 @@ class Patient(Base):
     clinic = relationship("Clinic", back_populates="patients")
     appointments = relationship("Appointment", back_populates="patient")
 
+    @validates("phone")
+    def _sync_phone_normalized(self, key, value):
+        self.phone_normalized = phone_match_key(value)
+        return value
+
 
 class Provider(Base):
     """Provider model - generic service provider (doctor, assistant, etc.)."""
@@ -215,6 +242,8 @@ class Appointment(Base):
     end_time = Column(DateTime, nullable=False)
     reason_note = Column(Text, nullable=True)
     chief_complaint = Column(Text, nullable=True)
+    # Native Postgres enum type "appointmentstatus" (baseline migration): the
+    # server stores 4-byte enum values, and SQLite falls back to VARCHAR.
     status = Column(SQLEnum(AppointmentStatus), default=AppointmentStatus.SCHEDULED)
     hold_expiry_at = Column(DateTime, nullable=True)  # set for PENDING web/voice holds; naive UTC
     patient_confirmed = Column(Boolean, nullable=False, default=False)  # web self-confirm flag
@@ -240,7 +269,7 @@ class Lead(Base):
     phone = Column(String, nullable=True)
     email = Column(String, nullable=True)
     source = Column(String, nullable=True)  # Ad campaign source
-    status = Column(SQLEnum(LeadStatus), default=LeadStatus.NEW)
+    status = Column(SQLEnum(LeadStatus), default=LeadStatus.NEW)  # native PG enum "leadstatus"
     notes = Column(Text, nullable=True)  # Qualification notes, needs, budget, timeline, etc.
     owner_id = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -251,10 +280,23 @@ class Lead(Base):
 
 # v1.1 performance indexes — additive, never alter existing columns.
 Index("ix_patients_clinic", Patient.clinic_id)
+Index("ix_patients_clinic_phone_normalized", Patient.clinic_id, Patient.phone_normalized)
+# Patient name trigram (GIN) indexes are Postgres-only; see migration n8o9p0q1r2s3.
 Index("ix_appointments_clinic_start", Appointment.clinic_id, Appointment.start_time.desc())
 Index("ix_appointments_clinic_status", Appointment.clinic_id, Appointment.status)
 Index("ix_appointments_patient_start", Appointment.patient_id, Appointment.start_time.desc())
+Index(
+    "ix_appointments_clinic_provider_status_time",
+    Appointment.clinic_id,
+    Appointment.provider_id,
+    Appointment.status,
+    Appointment.start_time,
+    Appointment.end_time,
+)
+# ix_appointments_active_provider_time (partial, active statuses) is Postgres-only;
+# see migration o9p0q1r2s3t4.
 Index("ix_leads_clinic_status", Lead.clinic_id, Lead.status)
+Index("ix_leads_clinic_status_created", Lead.clinic_id, Lead.status, Lead.created_at)
 Index(
     "ix_provider_busy_blocks_provider_weekday",
     ProviderBusyBlock.provider_id,
@@ -24,8 +24,6 @@ except Exception as e:
         return {"status": "ok"}
 
 if __name__ == "__main__":
-    import uvicorn
-
 #    if _full_app_loaded and os.getenv("SMTP_DEPLOY_VERIFY_TO", "").strip():
 #        from clients.email_client import verify_smtp_deploy
 #
@@ -34,5 +32,18 @@ if __name__ == "__main__":
 #            sys.exit(1)
 
     port = int(os.environ.get("PORT", "8000"))
+    from uvicorn import Config, Server
+
     logger.info("Starting uvicorn on 0.0.0.0:%s", port)
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop/httptools come with uvicorn[standard]; naming them skips the
+    # "auto" import probes. The full app logs every request through
+    # ObservabilityMiddleware, so uvicorn's own access log is only kept for
+    # the /health-only fallback.
+    Server(Config(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        access_log=not _full_app_loaded,
+    )).run()
@@ -49,6 +49,10 @@ def run_backfill(db: Session) -> Dict[str, int]:
         "users_without_claim": 0,
     }
 
+    # One read of the existing (uid, clinic_id) pairs up front instead of
+    # an existence query per claim.
+    existing = set(db.query(UserClinicMembership.uid, UserClinicMembership.clinic_id).all())
+
     page = list_users()
     for user in page.iterate_all():
         summary["users_scanned"] += 1
@@ -58,14 +62,10 @@ def run_backfill(db: Session) -> Dict[str, int]:
             summary["users_without_claim"] += 1
             continue
         for cid in clinic_ids:
-            exists = (
-                db.query(UserClinicMembership)
-                .filter_by(uid=user.uid, clinic_id=cid)
-                .first()
-            )
-            if exists:
+            if (user.uid, cid) in existing:
                 summary["rows_skipped_existing"] += 1
                 continue
+            existing.add((user.uid, cid))
             db.add(UserClinicMembership(
                 uid=user.uid,
                 clinic_id=cid,
@@ -10,7 +10,10 @@ Runs after `alembic upgrade head` to populate derived data on existing rows:
   5. Default PatientCommunicationPreference (sms, opted_in=true) for every
      patient with a non-empty phone.
 
-Re-running is safe — every step checks for existing rows first.
+Re-running is safe — every step checks for existing rows first (one
+query per step, not per row). The seeded rows are written with one
+multi-row INSERT per step (per _BATCH_SIZE patients for the patient-derived
+steps) rather than a statement per row.
 
 Usage:
     DATABASE_URL=sqlite:///./dental_clinic.db uv run python scripts/backfill_v1_1.py
@@ -26,6 +29,8 @@ sys.path.insert(0, project_root)
 
 from datetime import datetime
 
+from sqlalchemy import insert, text
+
 from database.connection import SessionLocal
 from database.models import Clinic, Patient
 from database.clinical.models import PatientCommunicationPreference
@@ -34,6 +39,30 @@ from database.v1_1.models import ClinicOperatingHours, HumanIdentifier, PatientL
 from database.v1_1.sequences import mint_mrn, mint_invoice_number, mint_claim_number
 
 
+# Patients are read (and their derived rows written) this many at a time,
+# so a large clinic's patient table is never materialized in one list.
+_BATCH_SIZE = 1000
+
+
+def _batches(query, key_col, size: int = _BATCH_SIZE):
+    """Yield lists of up to ``size`` rows from ``query``, paging by ``key_col``.
+
+    Each page is its own keyset SELECT (``key_col > last seen``) rather than
+    one long-lived cursor, so the caller can safely INSERT between pages on
+    the same connection — including into tables the query joins against.
+    """
+    last = None
+    while True:
+        page = query if last is None else query.filter(key_col > last)
+        rows = page.order_by(key_col).limit(size).all()
+        if not rows:
+            return
+        yield rows
+        if len(rows) < size:
+            return
+        last = getattr(rows[-1], key_col.key)
+
+
 def backfill_mrns(db) -> int:
     """Mint an MRN for every patient that doesn't already have one."""
     patients_without_mrn = (
@@ -96,50 +125,55 @@ def backfill_operating_hours(db) -> int:
     """Seed Mon-Fri rows from each clinic's working_hour_start/end if no
     ClinicOperatingHours rows exist for that clinic."""
     clinics = db.query(Clinic).all()
-    inserted = 0
+    clinics_with_hours = {
+        clinic_id for (clinic_id,) in db.query(ClinicOperatingHours.clinic_id).distinct()
+    }
+    rows = []
     for c in clinics:
-        existing = (
-            db.query(ClinicOperatingHours)
-            .filter_by(clinic_id=c.id)
-            .first()
-        )
-        if existing:
+        if c.id in clinics_with_hours:
             continue
         start = time(c.working_hour_start or 9, 0)
         end = time(c.working_hour_end or 17, 0)
         for dow in range(5):  # Mon-Fri
-            db.add(ClinicOperatingHours(
+            rows.append(dict(
                 clinic_id=c.id,
                 day_of_week=dow,
                 open_at=start,
                 close_at=end,
                 is_closed=False,
             ))
-            inserted += 1
-    return inserted
+    if rows:
+        db.execute(insert(ClinicOperatingHours), rows)
+    return len(rows)
 
 
 def backfill_communication_preferences(db) -> int:
     """For every patient with a phone, ensure a default sms preference row
     exists (opted_in=true). Don't touch existing rows."""
-    patients = db.query(Patient).filter(Patient.phone.isnot(None), Patient.phone != "").all()
+    patients = db.query(Patient.clinic_id, Patient.id).filter(
+        Patient.phone.isnot(None), Patient.phone != ""
+    )
+    existing = set(
+        db.query(PatientCommunicationPreference.clinic_id, PatientCommunicationPreference.patient_id)
+        .filter(PatientCommunicationPreference.channel == "sms")
+        .all()
+    )
     inserted = 0
-    for p in patients:
-        existing = (
-            db.query(PatientCommunicationPreference)
-            .filter_by(clinic_id=p.clinic_id, patient_id=p.id, channel="sms")
-            .first()
-        )
-        if existing:
-            continue
-        db.add(PatientCommunicationPreference(
-            clinic_id=p.clinic_id,
-            patient_id=p.id,
-            channel="sms",
-            opted_in=True,
-            language="en",
-        ))
-        inserted += 1
+    for batch in _batches(patients, Patient.id):
+        rows = [
+            dict(
+                clinic_id=clinic_id,
+                patient_id=patient_id,
+                channel="sms",
+                opted_in=True,
+                language="en",
+            )
+            for clinic_id, patient_id in batch
+            if (clinic_id, patient_id) not in existing
+        ]
+        if rows:
+            db.execute(insert(PatientCommunicationPreference), rows)
+            inserted += len(rows)
     return inserted
 
 
@@ -148,28 +182,37 @@ def backfill_patient_lifecycle(db) -> int:
     doesn't have a lifecycle row yet. Preserves prior behavior — every
     pre-existing patient was effectively active before this table existed."""
     patients_without_row = (
-        db.query(Patient)
+        db.query(Patient.clinic_id, Patient.id, Patient.created_at)
         .outerjoin(PatientLifecycle, PatientLifecycle.patient_id == Patient.id)
         .filter(PatientLifecycle.id.is_(None))
-        .all()
     )
     now = datetime.utcnow()
-    for p in patients_without_row:
-        db.add(PatientLifecycle(
-            clinic_id=p.clinic_id,
-            patient_id=p.id,
-            status="active",
-            registered_at=p.created_at or now,
-            last_status_change_at=now,
-            notes="backfilled — pre-lifecycle patient",
-        ))
-    return len(patients_without_row)
+    inserted = 0
+    for batch in _batches(patients_without_row, Patient.id):
+        db.execute(insert(PatientLifecycle), [
+            dict(
+                clinic_id=p.clinic_id,
+                patient_id=p.id,
+                status="active",
+                registered_at=p.created_at or now,
+                last_status_change_at=now,
+                notes="backfilled — pre-lifecycle patient",
+            )
+            for p in batch
+        ])
+        inserted += len(batch)
+    return inserted
 
 
 def main() -> None:
     db = SessionLocal()
     try:
         print("Running v1.1 backfill...")
+        if db.bind.dialect.name == "postgresql":
+            # Every step runs in this one transaction and the script is
+            # idempotent, so a crash right after COMMIT only means re-running
+            # it; skip waiting on the WAL fsync for that single commit.
+            db.execute(text("SET LOCAL synchronous_commit = OFF"))
         mrn_count = backfill_mrns(db)
         inv_count = backfill_invoice_numbers(db)
         claim_count = backfill_claim_numbers(db)
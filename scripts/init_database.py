@@ -7,12 +7,14 @@ import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+import functools
 from datetime import time as _time
 
+from sqlalchemy import exists, insert
+
 from database.connection import init_db, SessionLocal
 from database.models import Provider, Service, Clinic, ProviderBusyBlock, DEFAULT_CLINIC_ID
 from database.v1_1.models import ClinicOperatingHours
-from scripts.service_descriptions import SERVICE_DESCRIPTIONS
 
 MARKET_MALL_CLINIC_ID = "market-mall-denture"
 
@@ -21,6 +23,7 @@ def seed_market_mall_denture(db):
     """Idempotently seed market-mall-denture clinic if it doesn't exist."""
     if db.query(Clinic).filter(Clinic.id == MARKET_MALL_CLINIC_ID).first():
         return
+    from scripts.service_descriptions import SERVICE_DESCRIPTIONS
     clinic = Clinic(
         id=MARKET_MALL_CLINIC_ID,
         name="Market Mall Denture",
@@ -118,13 +121,136 @@ def seed_market_mall_denture(db):
     print("✓ Seeded market-mall-denture clinic (providers 101, 102, busy blocks, service 700)")
 
 
+# Default service catalog: (id, name, duration_min, base_price). Descriptions
+# come from SERVICE_DESCRIPTIONS by id; see _service_rows.
+_SERVICES: tuple[tuple[int, str, int, float], ...] = (
+    # Preventive Care
+    (1, "Routine Cleaning", 60, 150.00),
+    (2, "Deep Cleaning (Scaling & Root Planing)", 90, 250.00),
+    (3, "Dental Exam", 30, 100.00),
+    (4, "Comprehensive Oral Evaluation", 45, 150.00),
+    (5, "Periodic Oral Evaluation", 20, 75.00),
+    (6, "Fluoride Treatment", 15, 50.00),
+    (7, "Dental Sealants", 30, 80.00),
+
+    # Diagnostic Services
+    (8, "X-Ray (Bitewing)", 15, 75.00),
+    (9, "X-Ray (Full Mouth Series)", 30, 150.00),
+    (10, "X-Ray (Panoramic)", 20, 120.00),
+    (11, "X-Ray (Periapical)", 10, 50.00),
+    (12, "Digital X-Ray", 15, 85.00),
+    (13, "3D Imaging (CBCT)", 30, 300.00),
+
+    # Restorative Services
+    (14, "Filling (Amalgam)", 60, 200.00),
+    (15, "Filling (Composite)", 60, 250.00),
+    (16, "Filling (Ceramic)", 75, 350.00),
+    (17, "Crown (Porcelain)", 90, 1200.00),
+    (18, "Crown (Porcelain Fused to Metal)", 90, 1100.00),
+    (19, "Crown (Zirconia)", 90, 1400.00),
+    (20, "Crown (Gold)", 90, 1300.00),
+    (21, "Bridge (3-unit)", 120, 2500.00),
+    (22, "Inlay", 75, 800.00),
+    (23, "Onlay", 90, 950.00),
+
+    # Endodontic Services
+    (24, "Root Canal (Anterior)", 90, 800.00),
+    (25, "Root Canal (Premolar)", 120, 900.00),
+    (26, "Root Canal (Molar)", 150, 1200.00),
+    (27, "Root Canal Retreatment", 120, 1000.00),
+    (28, "Apicoectomy", 90, 600.00),
+
+    # Oral Surgery
+    (29, "Tooth Extraction (Simple)", 30, 200.00),
+    (30, "Tooth Extraction (Surgical)", 60, 400.00),
+    (31, "Wisdom Tooth Extraction", 90, 500.00),
+    (32, "Impacted Tooth Removal", 120, 800.00),
+    (33, "Bone Grafting", 90, 600.00),
+    (34, "Sinus Lift", 120, 1500.00),
+
+    # Periodontic Services
+    (35, "Gum Disease Treatment", 60, 300.00),
+    (36, "Gingival Grafting", 90, 800.00),
+    (37, "Periodontal Maintenance", 60, 180.00),
+    (38, "Pocket Reduction Surgery", 120, 1000.00),
+
+    # Cosmetic Services
+    (39, "Teeth Whitening (In-Office)", 90, 500.00),
+    (40, "Teeth Whitening (Take-Home Kit)", 30, 300.00),
+    (41, "Veneers (Porcelain)", 120, 1200.00),
+    (42, "Veneers (Composite)", 90, 600.00),
+    (43, "Bonding", 60, 400.00),
+    (44, "Gum Contouring", 60, 500.00),
+
+    # Orthodontic Services
+    (45, "Orthodontic Consultation", 60, 150.00),
+    (46, "Traditional Braces", 90, 5000.00),
+    (47, "Invisalign", 60, 5500.00),
+    (48, "Retainer", 30, 300.00),
+    (49, "Braces Adjustment", 30, 100.00),
+
+    # Prosthodontic Services
+    (50, "Dentures (Full Set)", 180, 2000.00),
+    (51, "Dentures (Partial)", 120, 1500.00),
+    (52, "Denture Reline", 60, 300.00),
+    (53, "Denture Repair", 45, 200.00),
+    (54, "Implant Consultation", 60, 200.00),
+    (55, "Dental Implant (Single)", 120, 3000.00),
+    (56, "Implant Crown", 90, 1500.00),
+
+    # Pediatric Services
+    (57, "Child's Cleaning", 45, 100.00),
+    (58, "Child's Exam", 30, 75.00),
+    (59, "Baby Tooth Extraction", 30, 150.00),
+    (60, "Space Maintainer", 60, 400.00),
+
+    # Emergency Services
+    (61, "Emergency Visit", 60, 200.00),
+    (62, "Toothache Treatment", 45, 150.00),
+    (63, "Broken Tooth Repair", 60, 250.00),
+    (64, "Lost Filling/Crown", 45, 200.00),
+
+    # Specialized Services
+    (65, "TMJ Treatment", 60, 300.00),
+    (66, "Sleep Apnea Consultation", 60, 200.00),
+    (67, "Oral Cancer Screening", 30, 100.00),
+    (68, "Nitrous Oxide (Laughing Gas)", 0, 50.00),
+    (69, "IV Sedation", 0, 400.00),
+
+    # General/Unknown Services
+    (70, "General Consultation", 30, 100.00),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _service_rows() -> tuple:
+    """Insert rows for _SERVICES, built on first use and reused after.
+
+    SERVICE_DESCRIPTIONS is imported here rather than at module top: importers
+    of this module (e.g. the test suite) and already-seeded runs never need it.
+    """
+    from scripts.service_descriptions import SERVICE_DESCRIPTIONS
+
+    return tuple(
+        {
+            "id": service_id,
+            "name": name,
+            "description": SERVICE_DESCRIPTIONS.get(service_id),
+            "duration_min": duration_min,
+            "base_price": base_price,
+        }
+        for service_id, name, duration_min, base_price in _SERVICES
+    )
+
+
 def seed_initial_data():
     """Seed initial data: providers and services."""
     db = SessionLocal()
     try:
-        existing_providers = db.query(Provider).count()
+        # Existence probe, not COUNT(*): the planner can stop at the first row.
+        providers_seeded = db.query(exists().where(Provider.id.isnot(None))).scalar()
 
-        if existing_providers == 0:
+        if not providers_seeded:
             # Ensure default clinic exists (required for clinic_id FK)
             default_clinic = db.query(Clinic).filter(Clinic.id == DEFAULT_CLINIC_ID).first()
             if not default_clinic:
@@ -138,116 +264,19 @@ def seed_initial_data():
                 db.add(default_clinic)
                 db.flush()
 
-            # Seed Providers
+            # Seed Providers and services as plain rows: one executemany INSERT
+            # per table instead of an ORM object (and INSERT) per row.
             providers = [
-                Provider(id=1, name="Johnson", title="Dr", specialty="General", is_active=True),
-                Provider(id=2, name="Smith", title="Dr", specialty="General", is_active=True),
-                Provider(id=3, name="Ahmed", title="Dr", specialty="General", is_active=True),
+                dict(id=1, name="Johnson", title="Dr", specialty="General", is_active=True),
+                dict(id=2, name="Smith", title="Dr", specialty="General", is_active=True),
+                dict(id=3, name="Ahmed", title="Dr", specialty="General", is_active=True),
             ]
-            for provider in providers:
-                db.add(provider)
+            db.execute(insert(Provider), providers)
 
             # Seed Services - Comprehensive dental clinic services
-            services = [
-                # Preventive Care
-                Service(id=1, name="Routine Cleaning", description=SERVICE_DESCRIPTIONS.get(1), duration_min=60, base_price=150.00),
-                Service(id=2, name="Deep Cleaning (Scaling & Root Planing)", description=SERVICE_DESCRIPTIONS.get(2), duration_min=90, base_price=250.00),
-                Service(id=3, name="Dental Exam", description=SERVICE_DESCRIPTIONS.get(3), duration_min=30, base_price=100.00),
-                Service(id=4, name="Comprehensive Oral Evaluation", description=SERVICE_DESCRIPTIONS.get(4), duration_min=45, base_price=150.00),
-                Service(id=5, name="Periodic Oral Evaluation", description=SERVICE_DESCRIPTIONS.get(5), duration_min=20, base_price=75.00),
-                Service(id=6, name="Fluoride Treatment", description=SERVICE_DESCRIPTIONS.get(6), duration_min=15, base_price=50.00),
-                Service(id=7, name="Dental Sealants", description=SERVICE_DESCRIPTIONS.get(7), duration_min=30, base_price=80.00),
-
-                # Diagnostic Services
-                Service(id=8, name="X-Ray (Bitewing)", description=SERVICE_DESCRIPTIONS.get(8), duration_min=15, base_price=75.00),
-                Service(id=9, name="X-Ray (Full Mouth Series)", description=SERVICE_DESCRIPTIONS.get(9), duration_min=30, base_price=150.00),
-                Service(id=10, name="X-Ray (Panoramic)", description=SERVICE_DESCRIPTIONS.get(10), duration_min=20, base_price=120.00),
-                Service(id=11, name="X-Ray (Periapical)", description=SERVICE_DESCRIPTIONS.get(11), duration_min=10, base_price=50.00),
-                Service(id=12, name="Digital X-Ray", description=SERVICE_DESCRIPTIONS.get(12), duration_min=15, base_price=85.00),
-                Service(id=13, name="3D Imaging (CBCT)", description=SERVICE_DESCRIPTIONS.get(13), duration_min=30, base_price=300.00),
-
-                # Restorative Services
-                Service(id=14, name="Filling (Amalgam)", description=SERVICE_DESCRIPTIONS.get(14), duration_min=60, base_price=200.00),
-                Service(id=15, name="Filling (Composite)", description=SERVICE_DESCRIPTIONS.get(15), duration_min=60, base_price=250.00),
-                Service(id=16, name="Filling (Ceramic)", description=SERVICE_DESCRIPTIONS.get(16), duration_min=75, base_price=350.00),
-                Service(id=17, name="Crown (Porcelain)", description=SERVICE_DESCRIPTIONS.get(17), duration_min=90, base_price=1200.00),
-                Service(id=18, name="Crown (Porcelain Fused to Metal)", description=SERVICE_DESCRIPTIONS.get(18), duration_min=90, base_price=1100.00),
-                Service(id=19, name="Crown (Zirconia)", description=SERVICE_DESCRIPTIONS.get(19), duration_min=90, base_price=1400.00),
-                Service(id=20, name="Crown (Gold)", description=SERVICE_DESCRIPTIONS.get(20), duration_min=90, base_price=1300.00),
-                Service(id=21, name="Bridge (3-unit)", description=SERVICE_DESCRIPTIONS.get(21), duration_min=120, base_price=2500.00),
-                Service(id=22, name="Inlay", description=SERVICE_DESCRIPTIONS.get(22), duration_min=75, base_price=800.00),
-                Service(id=23, name="Onlay", description=SERVICE_DESCRIPTIONS.get(23), duration_min=90, base_price=950.00),
-
-                # Endodontic Services
-                Service(id=24, name="Root Canal (Anterior)", description=SERVICE_DESCRIPTIONS.get(24), duration_min=90, base_price=800.00),
-                Service(id=25, name="Root Canal (Premolar)", description=SERVICE_DESCRIPTIONS.get(25), duration_min=120, base_price=900.00),
-                Service(id=26, name="Root Canal (Molar)", description=SERVICE_DESCRIPTIONS.get(26), duration_min=150, base_price=1200.00),
-                Service(id=27, name="Root Canal Retreatment", description=SERVICE_DESCRIPTIONS.get(27), duration_min=120, base_price=1000.00),
-                Service(id=28, name="Apicoectomy", description=SERVICE_DESCRIPTIONS.get(28), duration_min=90, base_price=600.00),
-
-                # Oral Surgery
-                Service(id=29, name="Tooth Extraction (Simple)", description=SERVICE_DESCRIPTIONS.get(29), duration_min=30, base_price=200.00),
-                Service(id=30, name="Tooth Extraction (Surgical)", description=SERVICE_DESCRIPTIONS.get(30), duration_min=60, base_price=400.00),
-                Service(id=31, name="Wisdom Tooth Extraction", description=SERVICE_DESCRIPTIONS.get(31), duration_min=90, base_price=500.00),
-                Service(id=32, name="Impacted Tooth Removal", description=SERVICE_DESCRIPTIONS.get(32), duration_min=120, base_price=800.00),
-                Service(id=33, name="Bone Grafting", description=SERVICE_DESCRIPTIONS.get(33), duration_min=90, base_price=600.00),
-                Service(id=34, name="Sinus Lift", description=SERVICE_DESCRIPTIONS.get(34), duration_min=120, base_price=1500.00),
-
-                # Periodontic Services
-                Service(id=35, name="Gum Disease Treatment", description=SERVICE_DESCRIPTIONS.get(35), duration_min=60, base_price=300.00),
-                Service(id=36, name="Gingival Grafting", description=SERVICE_DESCRIPTIONS.get(36), duration_min=90, base_price=800.00),
-                Service(id=37, name="Periodontal Maintenance", description=SERVICE_DESCRIPTIONS.get(37), duration_min=60, base_price=180.00),
-                Service(id=38, name="Pocket Reduction Surgery", description=SERVICE_DESCRIPTIONS.get(38), duration_min=120, base_price=1000.00),
-
-                # Cosmetic Services
-                Service(id=39, name="Teeth Whitening (In-Office)", description=SERVICE_DESCRIPTIONS.get(39), duration_min=90, base_price=500.00),
-                Service(id=40, name="Teeth Whitening (Take-Home Kit)", description=SERVICE_DESCRIPTIONS.get(40), duration_min=30, base_price=300.00),
-                Service(id=41, name="Veneers (Porcelain)", description=SERVICE_DESCRIPTIONS.get(41), duration_min=120, base_price=1200.00),
-                Service(id=42, name="Veneers (Composite)", description=SERVICE_DESCRIPTIONS.get(42), duration_min=90, base_price=600.00),
-                Service(id=43, name="Bonding", description=SERVICE_DESCRIPTIONS.get(43), duration_min=60, base_price=400.00),
-                Service(id=44, name="Gum Contouring", description=SERVICE_DESCRIPTIONS.get(44), duration_min=60, base_price=500.00),
-
-                # Orthodontic Services
-                Service(id=45, name="Orthodontic Consultation", description=SERVICE_DESCRIPTIONS.get(45), duration_min=60, base_price=150.00),
-                Service(id=46, name="Traditional Braces", description=SERVICE_DESCRIPTIONS.get(46), duration_min=90, base_price=5000.00),
-                Service(id=47, name="Invisalign", description=SERVICE_DESCRIPTIONS.get(47), duration_min=60, base_price=5500.00),
-                Service(id=48, name="Retainer", description=SERVICE_DESCRIPTIONS.get(48), duration_min=30, base_price=300.00),
-                Service(id=49, name="Braces Adjustment", description=SERVICE_DESCRIPTIONS.get(49), duration_min=30, base_price=100.00),
-
-                # Prosthodontic Services
-                Service(id=50, name="Dentures (Full Set)", description=SERVICE_DESCRIPTIONS.get(50), duration_min=180, base_price=2000.00),
-                Service(id=51, name="Dentures (Partial)", description=SERVICE_DESCRIPTIONS.get(51), duration_min=120, base_price=1500.00),
-                Service(id=52, name="Denture Reline", description=SERVICE_DESCRIPTIONS.get(52), duration_min=60, base_price=300.00),
-                Service(id=53, name="Denture Repair", description=SERVICE_DESCRIPTIONS.get(53), duration_min=45, base_price=200.00),
-                Service(id=54, name="Implant Consultation", description=SERVICE_DESCRIPTIONS.get(54), duration_min=60, base_price=200.00),
-                Service(id=55, name="Dental Implant (Single)", description=SERVICE_DESCRIPTIONS.get(55), duration_min=120, base_price=3000.00),
-                Service(id=56, name="Implant Crown", description=SERVICE_DESCRIPTIONS.get(56), duration_min=90, base_price=1500.00),
-
-                # Pediatric Services
-                Service(id=57, name="Child's Cleaning", description=SERVICE_DESCRIPTIONS.get(57), duration_min=45, base_price=100.00),
-                Service(id=58, name="Child's Exam", description=SERVICE_DESCRIPTIONS.get(58), duration_min=30, base_price=75.00),
-                Service(id=59, name="Baby Tooth Extraction", description=SERVICE_DESCRIPTIONS.get(59), duration_min=30, base_price=150.00),
-                Service(id=60, name="Space Maintainer", description=SERVICE_DESCRIPTIONS.get(60), duration_min=60, base_price=400.00),
-
-                # Emergency Services
-                Service(id=61, name="Emergency Visit", description=SERVICE_DESCRIPTIONS.get(61), duration_min=60, base_price=200.00),
-                Service(id=62, name="Toothache Treatment", description=SERVICE_DESCRIPTIONS.get(62), duration_min=45, base_price=150.00),
-                Service(id=63, name="Broken Tooth Repair", description=SERVICE_DESCRIPTIONS.get(63), duration_min=60, base_price=250.00),
-                Service(id=64, name="Lost Filling/Crown", description=SERVICE_DESCRIPTIONS.get(64), duration_min=45, base_price=200.00),
-
-                # Specialized Services
-                Service(id=65, name="TMJ Treatment", description=SERVICE_DESCRIPTIONS.get(65), duration_min=60, base_price=300.00),
-                Service(id=66, name="Sleep Apnea Consultation", description=SERVICE_DESCRIPTIONS.get(66), duration_min=60, base_price=200.00),
-                Service(id=67, name="Oral Cancer Screening", description=SERVICE_DESCRIPTIONS.get(67), duration_min=30, base_price=100.00),
-                Service(id=68, name="Nitrous Oxide (Laughing Gas)", description=SERVICE_DESCRIPTIONS.get(68), duration_min=0, base_price=50.00),
-                Service(id=69, name="IV Sedation", description=SERVICE_DESCRIPTIONS.get(69), duration_min=0, base_price=400.00),
-
-                # General/Unknown Services
-                Service(id=70, name="General Consultation", description=SERVICE_DESCRIPTIONS.get(70), duration_min=30, base_price=100.00),
-            ]
-            for service in services:
-                db.add(service)
-            print(f"✓ Seeded {len(providers)} providers and {len(services)} services")
+            service_rows = _service_rows()
+            db.execute(insert(Service), list(service_rows))
+            print(f"✓ Seeded {len(providers)} providers and {len(service_rows)} services")
 
         seed_market_mall_denture(db)
         db.commit()
@@ -32,21 +32,18 @@ from database.models import Base
 from sqlalchemy import text
 
 
-def column_exists(conn, table: str, column: str, is_sqlite: bool) -> bool:
+def table_columns(conn, table: str, is_sqlite: bool) -> set:
+    """Column names of ``table``, read with one introspection query."""
     if is_sqlite:
-        r = conn.execute(text(f"PRAGMA table_info({table})"))
-        for row in r:
-            if row[1] == column:
-                return True
-        return False
+        return {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
     r = conn.execute(
         text(
-            "SELECT 1 FROM information_schema.columns "
-            "WHERE table_name = :t AND column_name = :c"
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = :t"
         ),
-        {"t": table, "c": column},
+        {"t": table},
     )
-    return r.fetchone() is not None
+    return {row[0] for row in r}
 
 
 def run_migration():
@@ -57,13 +54,14 @@ def run_migration():
     str_type = "VARCHAR"
     date_type = "DATE"
     with engine.connect() as conn:
+        existing = table_columns(conn, "provider_busy_blocks", is_sqlite)
         new_columns = [
             ("weekdays", str_type),
             ("specific_date", date_type),
             ("recurrence_until", date_type),
         ]
         for col, typ in new_columns:
-            if column_exists(conn, "provider_busy_blocks", col, is_sqlite):
+            if col in existing:
                 print(f"  Column provider_busy_blocks.{col} already exists, skip")
             else:
                 conn.execute(text(
@@ -75,7 +73,7 @@ def run_migration():
         # Backfill: every row that has a legacy `weekday` but no `weekdays`
         # gets `weekdays = '[' || weekday || ']'`. The string-cat form works on
         # both SQLite and Postgres.
-        if column_exists(conn, "provider_busy_blocks", "weekday", is_sqlite):
+        if "weekday" in existing:
             result = conn.execute(text(
                 "UPDATE provider_busy_blocks "
                 "SET weekdays = '[' || weekday || ']' "
@@ -16,21 +16,18 @@ from database.models import Base
 from sqlalchemy import text
 
 
-def column_exists(conn, table: str, column: str, is_sqlite: bool) -> bool:
+def table_columns(conn, table: str, is_sqlite: bool) -> set:
+    """Column names of ``table``, read with one introspection query."""
     if is_sqlite:
-        r = conn.execute(text(f"PRAGMA table_info({table})"))
-        for row in r:
-            if row[1] == column:
-                return True
-        return False
+        return {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
     r = conn.execute(
         text(
-            "SELECT 1 FROM information_schema.columns "
-            "WHERE table_name = :t AND column_name = :c"
+            "SELECT column_name FROM information_schema.columns "
+            "WHERE table_name = :t"
         ),
-        {"t": table, "c": column},
+        {"t": table},
     )
-    return r.fetchone() is not None
+    return {row[0] for row in r}
 
 
 def run_migration():
@@ -44,8 +41,9 @@ def run_migration():
     ]
 
     with engine.connect() as conn:
+        existing = table_columns(conn, "clinics", is_sqlite)
         for col_name, col_type in columns:
-            if column_exists(conn, "clinics", col_name, is_sqlite):
+            if col_name in existing:
                 print(f"  Column clinics.{col_name} already exists, skip")
                 continue
             conn.execute(text(f"ALTER TABLE clinics ADD COLUMN {col_name} {col_type}"))
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import sys
 from datetime import date, datetime
 from pathlib import Path
@@ -243,19 +244,25 @@ def seed_from_yaml(db: Session, yaml_dir: Path, clinic_id: Optional[str] = None)
     Returns the number of clinics processed.
     """
     yaml_dir = Path(yaml_dir)
-    if not yaml_dir.exists():
-        raise FileNotFoundError(yaml_dir)
+    # One directory read; entry.is_dir() uses the listing's d_type, and names
+    # are filtered before anything under a clinic dir is stat'ed.
+    try:
+        with os.scandir(yaml_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except FileNotFoundError:
+        raise FileNotFoundError(yaml_dir) from None
 
     processed = 0
-    for clinic_dir in sorted(yaml_dir.iterdir()):
-        if not clinic_dir.is_dir() or clinic_dir.name in {"base", "tmp"}:
+    for entry in entries:
+        if entry.name in {"base", "tmp"} or (clinic_id and entry.name != clinic_id):
             continue
-        if not (clinic_dir / "product.yaml").exists():
+        if not entry.is_dir():
             continue
-        if clinic_id and clinic_dir.name != clinic_id:
+        clinic_dir = Path(entry.path)
+        if not (clinic_dir / "product.yaml").exists():
             continue
 
-        cid = clinic_dir.name
+        cid = entry.name
         data = _load_clinic(clinic_dir)
         base_data = _load_base_for(clinic_dir)
         pt_id = _upsert_practice_type(db, base_data, data)
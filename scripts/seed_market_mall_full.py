@@ -27,10 +27,14 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 _root = Path(__file__).resolve().parent.parent
+# open() doubles as the existence check (one syscall per candidate).
 for env_file in (_root / ".env.local", _root / ".env"):
-    if env_file.exists():
-        load_dotenv(env_file)
-        break
+    try:
+        with open(env_file, encoding="utf-8") as stream:
+            load_dotenv(stream=stream)
+    except FileNotFoundError:
+        continue
+    break
 sys.path.insert(0, str(_root))
 
 from sqlalchemy import create_engine, select, delete
@@ -8,7 +8,9 @@ intentionally changing behavior — the message text is part of the v1
 wire contract for clients that pattern-match on it.
 
 The "active statuses" set MUST stay aligned with the set used in
-tools/slot_utils for slot computation. If you change one, change both.
+tools/slot_utils for slot computation. If you change one, change both. The
+Postgres partial index ix_appointments_active_provider_time (migration
+o9p0q1r2s3t4) hard-codes the same set in its WHERE clause.
 """
 from __future__ import annotations
 
@@ -18,10 +20,13 @@ from typing import List, Optional
 
 import pytz
 from fastapi import HTTPException
+from sqlalchemy import bindparam, exists, select
 from sqlalchemy.orm import Session
 
 from api.serializers import _busy_block_envelope
 from database.models import Appointment, AppointmentStatus, Clinic
+from services.holds import exclude_expired_holds_filter
+from services.tz_utils import to_storage_utc
 
 logger = logging.getLogger("dental-receptionist")
 
@@ -33,22 +38,48 @@ ACTIVE_STATUSES: tuple[AppointmentStatus, ...] = (
 )
 
 
-def _query_overlapping_appointments(
-    db: Session,
+def _overlap_criteria(*, excluding_self: bool) -> list:
+    """WHERE clauses for appointments that overlap [start, end) for this provider+clinic.
+
+    An appointment overlaps if its status is active and time ranges intersect:
+        existing.start_time < end  AND  existing.end_time > start
+    Expired PENDING holds never block. With excluding_self, the appointment
+    being moved (reschedule path) doesn't conflict with itself.
+    """
+    criteria = [
+        Appointment.clinic_id == bindparam("clinic_id"),
+        Appointment.provider_id == bindparam("provider_id"),
+        Appointment.status.in_(ACTIVE_STATUSES),
+        Appointment.start_time < bindparam("end"),
+        Appointment.end_time > bindparam("start"),
+        exclude_expired_holds_filter(bindparam("now")),
+    ]
+    if excluding_self:
+        criteria.append(Appointment.id != bindparam("excluding_appointment_id"))
+    return criteria
+
+
+# Built once at import; each call only binds parameters. The EXISTS probe is
+# served by ix_appointments_clinic_provider_status_time, and the row query
+# only runs when the probe hits (to build the 409 body).
+_OVERLAP_EXISTS = {
+    excluding: select(exists().where(*_overlap_criteria(excluding_self=excluding)))
+    for excluding in (False, True)
+}
+_OVERLAP_ROWS = {
+    excluding: select(Appointment).where(*_overlap_criteria(excluding_self=excluding))
+    for excluding in (False, True)
+}
+
+
+def _overlap_params(
     *,
     clinic_id: str,
     provider_id: int,
     start: datetime,
     end: datetime,
     excluding_appointment_id: Optional[str] = None,
-) -> List[Appointment]:
-    """Return appointments that overlap [start, end) for this provider+clinic.
-
-    An appointment overlaps if its status is active and time ranges intersect:
-        existing.start_time < end  AND  existing.end_time > start
-    Optionally excludes a specific appointment id (used by the reschedule path
-    so the appointment being moved doesn't conflict with itself).
-    """
+) -> dict:
     # Appointment.start_time / end_time are stored naive UTC. Every appointment
     # write boundary now converts clinic-local input to naive UTC (via
     # to_storage_utc_clinic) BEFORE calling the conflict check, so callers pass
@@ -58,29 +89,36 @@ def _query_overlapping_appointments(
     # as clinic-local, which would DOUBLE-SHIFT the already-UTC values the write
     # boundaries pass. Keeping to_storage_utc keeps storage and conflict
     # detection on one shared naive-UTC representation. (2026-06-25 plan, Task 2.3.)
-    from services.tz_utils import to_storage_utc
-    start_utc = to_storage_utc(start)
-    end_utc = to_storage_utc(end)
-    q = db.query(Appointment).filter(
-        Appointment.clinic_id == clinic_id,
-        Appointment.provider_id == provider_id,
-        Appointment.status.in_(ACTIVE_STATUSES),
-        Appointment.start_time < end_utc,
-        Appointment.end_time > start_utc,
-    )
+    params = {
+        "clinic_id": clinic_id,
+        "provider_id": provider_id,
+        "start": to_storage_utc(start),
+        "end": to_storage_utc(end),
+        "now": datetime.utcnow(),
+    }
     if excluding_appointment_id is not None:
-        q = q.filter(Appointment.id != excluding_appointment_id)
-    from services.holds import exclude_expired_holds_filter
-    q = q.filter(exclude_expired_holds_filter(datetime.utcnow()))
-    return q.all()
+        params["excluding_appointment_id"] = excluding_appointment_id
+    return params
+
+
+def _has_overlapping_appointment(db: Session, params: dict) -> bool:
+    excluding = "excluding_appointment_id" in params
+    return bool(db.execute(_OVERLAP_EXISTS[excluding], params).scalar())
+
+
+def _overlapping_appointments(db: Session, params: dict) -> List[Appointment]:
+    excluding = "excluding_appointment_id" in params
+    return list(db.execute(_OVERLAP_ROWS[excluding], params).scalars().all())
 
 
 def _conflict_details(conflicting: List[Appointment]) -> list[dict]:
+    # datetimes are left for orjson to render (api.responses handles
+    # HTTPException bodies); the wire format matches .isoformat().
     return [
         {
             "appointment_id": apt.id,
-            "start_time": apt.start_time.isoformat(),
-            "end_time": apt.end_time.isoformat(),
+            "start_time": apt.start_time,
+            "end_time": apt.end_time,
             "patient_id": apt.patient_id,
             "status": apt.status.value,
         }
@@ -138,10 +176,11 @@ def check_conflicts_for_create(
     Used by POST /api/calendar/events and POST /api/appointments.
     Source: api/main.py POST /api/calendar/events (currently ~line 268).
     """
-    conflicting = _query_overlapping_appointments(
-        db, clinic_id=clinic.id, provider_id=provider_id, start=start, end=end,
+    params = _overlap_params(
+        clinic_id=clinic.id, provider_id=provider_id, start=start, end=end,
     )
-    if conflicting:
+    if _has_overlapping_appointment(db, params):
+        conflicting = _overlapping_appointments(db, params)
         logger.warning(
             f"Appointment conflict detected for provider_id {provider_id} "
             f"at {start.isoformat()} - {end.isoformat()}. "
@@ -183,11 +222,12 @@ def check_conflicts_for_reschedule(
 
     Source: api/main.py PUT /api/appointments/{id}/reschedule (currently ~line 776).
     """
-    conflicting = _query_overlapping_appointments(
-        db, clinic_id=clinic.id, provider_id=provider_id, start=start, end=end,
+    params = _overlap_params(
+        clinic_id=clinic.id, provider_id=provider_id, start=start, end=end,
         excluding_appointment_id=excluding_appointment_id,
     )
-    if conflicting:
+    if _has_overlapping_appointment(db, params):
+        conflicting = _overlapping_appointments(db, params)
         raise HTTPException(
             status_code=409,
             detail={
@@ -36,6 +36,16 @@ _RESCHEDULE_PATTERNS = [
 ]
 
 
+def _combine(patterns: list[re.Pattern]) -> re.Pattern:
+    """Fold a pattern list into one alternation so each category is a single scan."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE)
+
+
+_CONFIRMED_RE = _combine(_CONFIRMED_PATTERNS)
+_CANCELLED_RE = _combine(_CANCELLED_PATTERNS)
+_RESCHEDULE_RE = _combine(_RESCHEDULE_PATTERNS)
+
+
 def _normalize(text: str) -> str:
     return text.strip()
 
@@ -45,15 +55,12 @@ def parse(text: str) -> tuple[ReplyIntent, str]:
     norm = _normalize(text)
     if not norm:
         return ReplyIntent.AMBIGUOUS, "regex"
-    for pat in _CONFIRMED_PATTERNS:
-        if pat.fullmatch(norm) or pat.search(norm):
-            return ReplyIntent.CONFIRMED, "regex"
-    for pat in _CANCELLED_PATTERNS:
-        if pat.fullmatch(norm) or pat.search(norm):
-            return ReplyIntent.CANCELLED, "regex"
-    for pat in _RESCHEDULE_PATTERNS:
-        if pat.search(norm):
-            return ReplyIntent.RESCHEDULE_REQUESTED, "regex"
+    if _CONFIRMED_RE.search(norm):
+        return ReplyIntent.CONFIRMED, "regex"
+    if _CANCELLED_RE.search(norm):
+        return ReplyIntent.CANCELLED, "regex"
+    if _RESCHEDULE_RE.search(norm):
+        return ReplyIntent.RESCHEDULE_REQUESTED, "regex"
     # Stage 2: LLM fallback (opt-in via env flag)
     if os.getenv("SMS_REPLY_LLM_FALLBACK", "false").lower() == "true":
         try:
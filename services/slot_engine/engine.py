@@ -16,6 +16,7 @@ import logging
 import warnings
 from typing import Any, Dict, List, Optional
 
+import orjson
 import pytz
 from sqlalchemy.orm import Session
 
@@ -60,8 +61,8 @@ def resolve_providers(
 
 def _parse_dt(s: str, tz: pytz.tzinfo.BaseTzInfo) -> Optional[_dt.datetime]:
     try:
-        d = _dt.datetime.fromisoformat(s.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
+        d = _dt.datetime.fromisoformat(s)  # 3.11+ parses a trailing "Z" itself
+    except (ValueError, TypeError):
         return None
     return tz.localize(d) if d.tzinfo is None else d.astimezone(tz)
 
@@ -213,9 +214,6 @@ def find_busy_block_overlap(
         if not request.intersect(blocks_intervals).is_empty:
             # Find the row corresponding to the first overlapping interval.
             for r in rows:
-                # Reconstruct the same intervals busy_blocks_for would emit
-                # and check if any overlap the request on this date.
-                day_blocks = busy_blocks_for(provider_id, clinic_id, cursor, tz, db)
                 # If this row's date applies and overlaps, return it.
                 row_applies = (
                     (r.specific_date is not None and r.specific_date == cursor)
@@ -242,13 +240,12 @@ def find_busy_block_overlap(
 
 def _row_weekdays(b: ProviderBusyBlock) -> List[int]:
     """Local copy of subtract._block_weekdays (avoids importing private)."""
-    import json as _json
     if b.weekdays:
         try:
-            parsed = _json.loads(b.weekdays)
+            parsed = orjson.loads(b.weekdays)
             if isinstance(parsed, list):
                 return [int(x) for x in parsed]
-        except (_json.JSONDecodeError, ValueError, TypeError):
+        except (orjson.JSONDecodeError, ValueError, TypeError):
             pass
     if b.weekday is not None and b.specific_date is None:
         return [int(b.weekday)]
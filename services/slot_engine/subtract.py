@@ -2,10 +2,10 @@
 provider_busy_blocks, provider_time_off, and appointments."""
 from __future__ import annotations
 
-import json
 from datetime import date, datetime, time, timedelta
 from typing import List, Tuple
 
+import orjson
 import pytz
 from sqlalchemy.orm import Session
 
@@ -14,12 +14,12 @@ from database.v1_1.models import ProviderTimeOff
 from services.slot_engine.intervals import IntervalSet
 
 
-_ACTIVE_STATUSES = [
+_ACTIVE_STATUSES = (
     AppointmentStatus.SCHEDULED,
     AppointmentStatus.CONFIRMED,
     AppointmentStatus.PENDING_SYNC,
     AppointmentStatus.PENDING,
-]
+)
 
 
 def _combine(d: date, t: time, tz: pytz.tzinfo.BaseTzInfo) -> datetime:
@@ -27,13 +27,17 @@ def _combine(d: date, t: time, tz: pytz.tzinfo.BaseTzInfo) -> datetime:
 
 
 def _block_weekdays(block: ProviderBusyBlock) -> List[int]:
-    """Read weekdays from the JSON column, falling back to legacy `weekday` int."""
+    """Read weekdays from the JSON column, falling back to legacy `weekday` int.
+
+    orjson: this runs per busy block on every slot computation, and the
+    payload is a tiny int list where stdlib json's per-call overhead dominates.
+    """
     if block.weekdays:
         try:
-            parsed = json.loads(block.weekdays)
+            parsed = orjson.loads(block.weekdays)
             if isinstance(parsed, list):
                 return [int(x) for x in parsed]
-        except (json.JSONDecodeError, ValueError, TypeError):
+        except (orjson.JSONDecodeError, ValueError, TypeError):
             pass
     if block.weekday is not None and block.specific_date is None:
         return [int(block.weekday)]
@@ -6,6 +6,7 @@ KeyError so misuse is loud.
 """
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 _TEMPLATE_DIR = Path(__file__).resolve().parents[1] / "templates" / "sms"
@@ -16,14 +17,20 @@ def _path(intent: str, lang: str) -> Path:
     return _TEMPLATE_DIR / f"{intent}.{lang}.txt"
 
 
+@functools.lru_cache(maxsize=64)
+def _load(intent: str, lang: str) -> str:
+    """Read a template once per process; templates ship with the image."""
+    try:
+        text = _path(intent, lang).read_text()
+    except FileNotFoundError:
+        text = _path(intent, "en").read_text()
+    return text.rstrip("\n")
+
+
 def render(intent: str, lang: str, **vars) -> str:
     if intent not in _KNOWN_INTENTS:
         raise KeyError(f"unknown SMS intent: {intent!r}")
-    p = _path(intent, lang)
-    if not p.exists():
-        p = _path(intent, "en")
-    body = p.read_text().rstrip("\n")
-    return body.format_map(_Defaultdict(vars))
+    return _load(intent, lang).format_map(_Defaultdict(vars))
 
 
 class _Defaultdict(dict):
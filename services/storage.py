@@ -82,18 +82,17 @@ class LocalBackend(StorageBackend):
         return f"local://{object_key}"
 
     def stat(self, object_key: str) -> Optional[ObjectStat]:
-        p = self._path(object_key)
-        if not p.exists():
+        try:
+            size = self._path(object_key).stat().st_size
+        except FileNotFoundError:
             return None
-        return ObjectStat(size=p.stat().st_size, content_type=self._ct.get(object_key))
+        return ObjectStat(size=size, content_type=self._ct.get(object_key))
 
     def read_bytes(self, object_key: str) -> bytes:
         return self._path(object_key).read_bytes()
 
     def delete(self, object_key: str) -> None:
-        p = self._path(object_key)
-        if p.exists():
-            p.unlink()
+        self._path(object_key).unlink(missing_ok=True)
         self._ct.pop(object_key, None)
 
     def put(self, object_key: str, data: bytes, content_type: Optional[str] = None) -> None:
@@ -23,6 +23,9 @@ DEFAULT_TZ = "America/Edmonton"
 
 
 def _clinic_tz(clinic: Optional[Clinic]):
+    # pytz, not zoneinfo: the slot engine and holds resolve clinic zones with
+    # pytz too, and zoneinfo reads the OS tz database, which can disagree
+    # with pytz's bundled copy about future rule changes.
     name = (clinic.timezone if clinic else None) or DEFAULT_TZ
     return pytz.timezone(name)
 
@@ -260,3 +260,39 @@ def test_scan_forwards_clinic_sms_from_number_to_send(
     assert resp.json()["sent_count"] == 1
     mock_send.assert_called_once()
     assert mock_send.call_args.kwargs.get("from_") == "+14035550000"
+
+
+def test_scan_loads_each_clinic_and_provider_once(
+    client_market_mall, db_session, monkeypatch
+):
+    from sqlalchemy import event
+
+    import api.cron.reminders as cron_reminders
+
+    monkeypatch.setenv("REMINDER_OFFSET_HOURS", "24")
+    monkeypatch.setenv("SMS_PROVIDER", "telnyx")
+    monkeypatch.setenv("DENTAL_API_INTERNAL_SECRET", "test_secret")
+    monkeypatch.setattr(cron_reminders, "_within_quiet_hours", lambda *a, **k: False)
+    for phone in ("+14035550011", "+14035550012", "+14035550013"):
+        _seed_appointment(client_market_mall, db_session, hours_out=24.0, phone=phone)
+    db_session.expire_all()
+
+    lookups = []
+
+    def _count(conn, cursor, statement, *args):
+        head = statement.split("WHERE")[0]
+        if "FROM clinics" in head or "FROM providers" in head:
+            lookups.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        with patch("clients.telnyx_messaging.send_message", return_value="msg"):
+            resp = client_market_mall.post(
+                "/cron/reminders/scan", headers=_internal_secret_headers()
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert resp.json()["sent_count"] == 3
+    assert len(lookups) == 2, lookups
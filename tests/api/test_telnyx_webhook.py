@@ -197,6 +197,28 @@ def test_webhook_ignores_non_message_received_events(client, monkeypatch):
     assert resp.json()["routed_to"] == "ignored_event"
 
 
+def test_webhook_rejects_signed_non_object_body(client, monkeypatch):
+    """A correctly signed body that isn't a JSON object -> 400, not 500."""
+    signing_key = nacl.signing.SigningKey.generate()
+    monkeypatch.setenv(
+        "TELNYX_PUBLIC_KEY",
+        base64.b64encode(bytes(signing_key.verify_key)).decode(),
+    )
+    for body in (b"[1, 2]", b"{not json"):
+        ts = str(int(time.time()))
+        sig = _sign(signing_key, body, ts)
+        resp = client.post(
+            "/webhooks/telnyx/sms-inbound",
+            content=body,
+            headers={
+                "Content-Type": "application/json",
+                "Telnyx-Signature-ED25519": sig,
+                "Telnyx-Timestamp": ts,
+            },
+        )
+        assert resp.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # Task B8: action dispatch on reminder match
 # ---------------------------------------------------------------------------
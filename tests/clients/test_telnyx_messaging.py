@@ -165,3 +165,14 @@ def test_verify_webhook_signature_returns_false_when_public_key_missing(monkeypa
     monkeypatch.delenv("TELNYX_PUBLIC_KEY", raising=False)
     from clients import telnyx_messaging
     assert telnyx_messaging.verify_webhook_signature(b"x", "sig", "1") is False
+
+
+def test_verify_webhook_signature_tracks_rotated_public_key(monkeypatch):
+    """The decoded key is cached per TELNYX_PUBLIC_KEY value, so rotation takes effect."""
+    from clients import telnyx_messaging
+    ts = str(int(time.time()))
+    for _ in range(2):
+        signing_key = nacl.signing.SigningKey.generate()
+        monkeypatch.setenv("TELNYX_PUBLIC_KEY", base64.b64encode(bytes(signing_key.verify_key)).decode())
+        body, sig, ts = _make_signed_payload(signing_key, b'{"event":"x"}', ts)
+        assert telnyx_messaging.verify_webhook_signature(body, sig, ts) is True
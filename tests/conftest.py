@@ -22,6 +22,10 @@ os.environ["SEND_CLINIC_BOOKING_EMAIL"] = "false"
 # token or mock verify_id_token.
 os.environ["ADMIN_AUTH_BYPASS"] = "true"
 
+# List queries built with database.loading.list_options raise on any lazy
+# relationship load, so an N+1 introduced by a schema change fails a test.
+os.environ["RAISE_ON_LAZY_LOAD"] = "1"
+
 import sqlalchemy as _sa
 import pytest
 from fastapi.testclient import TestClient
@@ -72,6 +76,15 @@ def _isolate_notification_env(monkeypatch):
     monkeypatch.setattr("api.dependencies.auth.ADMIN_AUTH_BYPASS", True)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_appointments_list_cache():
+    # Every test gets a fresh database; cached list pages from a previous
+    # test's database must not answer this one.
+    from api.v1.appointments import list_cache
+    list_cache.clear()
+    yield
+
+
 # Tables whose column types (e.g. pgvector.Vector, PG JSONB) cannot compile on
 # SQLite. RAG features are exercised by the `pg_engine`/`pg_db_session`/`pg_client`
 # fixtures, which run against the real Postgres + pgvector. Keep this set tight.
@@ -5,6 +5,8 @@ Run from dental-api project root:
   .venv/bin/python -m pytest tests/ -v
   # or: pip install -r requirements-dev.txt && pytest tests/ -v
 """
+import json
+
 import pytest
 
 import api.main as api_main
@@ -380,6 +382,11 @@ def test_appointment_create_list_get_update_cancel_status_delete(client, db_sess
     assert list_resp.status_code == 200
     assert len(list_resp.json()) == 1
 
+    by_names = client.get("/api/appointments", params={"provider_name": "john", "patient_name": "exam"})
+    assert [a["id"] for a in by_names.json()] == [appointment_id]
+    assert client.get("/api/appointments", params={"provider_name": "smith"}).json() == []
+    assert client.get("/api/appointments", params={"patient_name": "nobody"}).json() == []
+
     get_resp = client.get(f"/api/appointments/{appointment_id}")
     assert get_resp.status_code == 200
     apt = get_resp.json()
@@ -425,8 +432,45 @@ def test_appointment_create_list_get_update_cancel_status_delete(client, db_sess
     assert after_delete.status_code == 404
 
 
-def test_appointment_response_includes_provider_name_and_service_name(client, db_session):
+def test_update_appointment_reflects_new_provider_and_status(client, db_session):
+    p1, p2, s1 = seed_providers_and_services(db_session)
+    patient_id = create_patient_without_phone(client)
+    appointment_id = client.post(
+        "/api/appointments",
+        json={
+            "start_time": "2026-03-10T13:00:00-06:00",
+            "end_time": "2026-03-10T13:30:00-06:00",
+            "patient_id": patient_id,
+            "provider_id": p1.id,
+            "service_id": s1.id,
+            "patient_name": "Alice Example",
+            "service_name": s1.name,
+            "reason": "Checkup",
+        },
+    ).json()["appointment_id"]
+
+    resp = client.put(
+        f"/api/appointments/{appointment_id}",
+        json={"provider_id": p2.id, "status": "confirmed"},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["provider_id"] == p2.id
+    assert resp.json()["provider_name"] == "Mr Smith"
+    assert resp.json()["status"] == "CONFIRMED"
+
+    bad = client.put(f"/api/appointments/{appointment_id}", json={"status": "bogus"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.parametrize("clinic_tz", ["America/Edmonton", "Europe/London", "UTC"])
+def test_appointment_response_includes_provider_name_and_service_name(client, db_session, clinic_tz):
     """GET /api/appointments and GET /api/appointments/{id} return provider_name and service_name."""
+    from database.models import Clinic
+
+    # Europe/London in March and UTC are zero-offset: times must still render
+    # as the detail endpoint's "Z", not "+00:00".
+    db_session.get(Clinic, "default").timezone = clinic_tz
+    db_session.commit()
     p1, _, s1 = seed_providers_and_services(db_session)
     patient_id = create_patient_without_phone(client)
 
@@ -458,6 +502,203 @@ def test_appointment_response_includes_provider_name_and_service_name(client, db
     apt = get_resp.json()
     assert apt["provider_name"] is not None
     assert apt["service_name"] == s1.name
+    # The list endpoint builds its rows without the Pydantic model; it must
+    # still emit exactly the detail shape, in both JSON and NDJSON form.
+    assert apts[0] == apt
+    export = client.get(
+        "/api/appointments",
+        params={"patient_id": patient_id},
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert [json.loads(line) for line in export.text.splitlines()] == [apt]
+
+
+def test_list_appointments_pages_in_start_time_order(client, db_session):
+    p1, _, s1 = seed_providers_and_services(db_session)
+    patient_id = create_patient_without_phone(client)
+    for hour in (9, 11, 13):
+        resp = client.post(
+            "/api/appointments",
+            json={
+                "start_time": f"2026-03-11T{hour:02d}:00:00-06:00",
+                "end_time": f"2026-03-11T{hour:02d}:30:00-06:00",
+                "patient_id": patient_id,
+                "provider_id": p1.id,
+                "service_id": s1.id,
+                "patient_name": "Alice Example",
+                "service_name": s1.name,
+                "reason": "Checkup",
+            },
+        )
+        assert resp.status_code == 200, resp.text
+
+    first = client.get("/api/appointments", params={"limit": 2}).json()
+    rest = client.get("/api/appointments", params={"limit": 2, "offset": 2}).json()
+    assert [a["start_time"][11:16] for a in first + rest] == ["09:00", "11:00", "13:00"]
+    assert client.get("/api/appointments", params={"limit": 0}).status_code == 422
+
+    export = client.get(
+        "/api/appointments", params={"limit": 1}, headers={"Accept": "application/x-ndjson"}
+    )
+    assert export.headers["content-type"].startswith("application/x-ndjson")
+    assert [json.loads(line) for line in export.text.splitlines()] == first + rest
+
+
+def test_appointment_list_cache_invalidated_by_any_appointment_write(client, db_session):
+    from database.models import Appointment
+
+    p1, _, s1 = seed_providers_and_services(db_session)
+    patient_id = create_patient_without_phone(client)
+    assert client.get("/api/appointments").json() == []
+
+    resp = client.post(
+        "/api/appointments",
+        json={
+            "start_time": "2026-03-11T09:00:00-06:00",
+            "end_time": "2026-03-11T09:30:00-06:00",
+            "patient_id": patient_id,
+            "provider_id": p1.id,
+            "service_id": s1.id,
+            "patient_name": "Alice Example",
+            "service_name": s1.name,
+            "reason": "Checkup",
+        },
+    )
+    assert resp.status_code == 200, resp.text
+    listed = client.get("/api/appointments").json()
+    assert [a["reason_note"] for a in listed] == ["Checkup"]
+
+    # A bulk UPDATE outside the v1 handlers still drops the cached page.
+    db_session.query(Appointment).update({Appointment.reason_note: "Edited"})
+    db_session.commit()
+    assert [a["reason_note"] for a in client.get("/api/appointments").json()] == ["Edited"]
+
+
+def test_appointment_list_cache_invalidated_by_joined_row_writes(client, db_session):
+    from database.models import Clinic, Patient, Provider
+
+    p1, _, s1 = seed_providers_and_services(db_session)
+    patient_id = create_patient_without_phone(client)
+    resp = client.post(
+        "/api/appointments",
+        json={
+            "start_time": "2026-03-11T09:00:00-06:00",
+            "end_time": "2026-03-11T09:30:00-06:00",
+            "patient_id": patient_id,
+            "provider_id": p1.id,
+            "service_id": s1.id,
+            "patient_name": "Alice Example",
+            "service_name": s1.name,
+            "reason": "Checkup",
+        },
+    )
+    assert resp.status_code == 200, resp.text
+    assert len(client.get("/api/appointments", params={"patient_name": "Renamed"}).json()) == 0
+    first = client.get("/api/appointments").json()[0]
+
+    # Renaming the patient or provider, or moving the clinic's timezone,
+    # must not leave the previous page cached.
+    db_session.query(Patient).filter(Patient.id == patient_id).update({Patient.first_name: "Renamed"})
+    db_session.commit()
+    assert len(client.get("/api/appointments", params={"patient_name": "Renamed"}).json()) == 1
+
+    provider = db_session.get(Provider, p1.id)
+    provider.name = "Renamed"
+    db_session.commit()
+    assert client.get("/api/appointments").json()[0]["provider_name"].endswith("Renamed")
+
+    clinic = db_session.get(Clinic, "default")
+    clinic.timezone = "America/Vancouver"
+    db_session.commit()
+    assert client.get("/api/appointments").json()[0]["start_time"] != first["start_time"]
+
+
+def test_appointment_list_cache_drops_reads_that_raced_a_commit():
+    from api.v1.appointments import list_cache
+
+    items, generation = list_cache.get("race-key")
+    assert items is None
+    list_cache.clear()  # a writer commits while the reader's SELECT runs
+    list_cache.put("race-key", [{"id": "stale"}], generation)
+    assert list_cache.get("race-key")[0] is None
+
+    _, generation = list_cache.get("race-key")
+    list_cache.put("race-key", [{"id": "fresh"}], generation)
+    assert list_cache.get("race-key")[0] == [{"id": "fresh"}]
+
+
+def test_appointment_list_cache_waits_for_the_root_commit(client, db_session):
+    """The bulk-delete fallback releases one SAVEPOINT per deletable row and
+    rolls back one per failing row; neither may clear or un-mark the cache
+    before the outer transaction commits."""
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session as SASession
+
+    from api.v1.appointments import list_cache
+    from api.v1.appointments.router import _delete_appointments
+    from database.models import Appointment
+
+    p1, _, s1 = seed_providers_and_services(db_session)
+    patient_id = create_patient_without_phone(client)
+    ids = []
+    for hour in (10, 14):
+        resp = client.post(
+            "/api/appointments",
+            json={
+                "start_time": f"2026-03-12T{hour}:00:00-06:00",
+                "end_time": f"2026-03-12T{hour}:30:00-06:00",
+                "patient_id": patient_id,
+                "provider_id": p1.id,
+                "service_id": s1.id,
+                "patient_name": "Alice Example",
+                "service_name": s1.name,
+                "reason": "bulk",
+            },
+        )
+        ids.append(resp.json()["appointment_id"])
+    free_id, locked_id = ids  # the deletable row goes first
+    _, generation = list_cache.get("page")
+    list_cache.put("page", [{"id": free_id}], generation)
+
+    seen_before_commit = []
+
+    def _refuse_locked(session, flush_context, instances):
+        if any(getattr(obj, "id", None) == locked_id for obj in session.deleted):
+            raise RuntimeError("still referenced")
+
+    def _before_root_commit(session):
+        if not session.in_nested_transaction():
+            seen_before_commit.append(list_cache.get("page")[0])
+
+    event.listen(SASession, "before_flush", _refuse_locked)
+    event.listen(SASession, "before_commit", _before_root_commit)
+    try:
+        appointments = [db_session.get(Appointment, i) for i in ids]
+        deleted, failed = _delete_appointments(db_session, appointments, "2026-03-12")
+    finally:
+        event.remove(SASession, "before_flush", _refuse_locked)
+        event.remove(SASession, "before_commit", _before_root_commit)
+
+    assert (deleted, failed) == ([free_id], [locked_id])
+    # Fast-path attempt, then the fallback's single root commit: the cached
+    # page survives every savepoint and is dropped only by that commit.
+    assert seen_before_commit[-1] == [{"id": free_id}]
+    assert list_cache.get("page")[0] is None
+
+
+def test_list_appointments_date_filter_parsing(client):
+    assert client.get("/api/appointments", params={"start_datetime": "2026-03-10T00:00:00Z"}).status_code == 200
+    assert client.get("/api/appointments", params={"date": "2026-03-10"}).status_code == 200
+    for bad in ("2026-3-10", "20260310", "not-a-date"):
+        assert client.get("/api/appointments", params={"date": bad}).status_code == 400, bad
+        assert client.get("/api/appointments", params={"start_date": bad}).status_code == 400, bad
+
+
+def test_list_appointments_status_filter_is_case_insensitive(client):
+    assert client.get("/api/appointments", params={"status": "scheduled"}).status_code == 200
+    resp = client.get("/api/appointments", params={"status": "booked"})
+    assert resp.status_code == 400
+    assert "Invalid status: booked" in resp.json()["detail"]
 
 
 def test_reschedule_appointment(client, db_session):
@@ -548,6 +789,132 @@ def test_bulk_delete_by_date(client, db_session):
     assert data["deleted"] == 2
 
 
+def test_bulk_delete_by_date_streams_ndjson(client, db_session):
+    p1, _, s1 = seed_providers_and_services(db_session)
+    patient_id = create_patient_without_phone(client)
+    ids = []
+    for hour in (10, 14):
+        resp = client.post(
+            "/api/appointments",
+            json={
+                "start_time": f"2026-03-12T{hour}:00:00-06:00",
+                "end_time": f"2026-03-12T{hour}:30:00-06:00",
+                "patient_id": patient_id,
+                "provider_id": p1.id,
+                "service_id": s1.id,
+                "patient_name": "Alice Example",
+                "service_name": s1.name,
+                "reason": "bulk",
+            },
+        )
+        ids.append(resp.json()["appointment_id"])
+
+    resp = client.delete(
+        "/api/appointments/bulk/date/2026-03-12",
+        headers={"Accept": "application/x-ndjson"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines[0] == {"status": "started", "date": "2026-03-12", "appointments_found": 2}
+    assert sorted(line["id"] for line in lines[1:-1]) == sorted(ids)
+    assert all(line["ok"] for line in lines[1:-1])
+    assert lines[-1] == {"summary": {"deleted": 2, "failed": 0}}
+    # The deletes committed inside the streamed body, on the request session.
+    from database.models import Appointment
+
+    db_session.expire_all()
+    assert all(db_session.get(Appointment, i) is None for i in ids)
+
+
+def test_bulk_delete_ndjson_reports_a_failed_commit(client, db_session):
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session as SASession
+
+    from database.models import Appointment
+
+    p1, _, s1 = seed_providers_and_services(db_session)
+    patient_id = create_patient_without_phone(client)
+    resp = client.post(
+        "/api/appointments",
+        json={
+            "start_time": "2026-03-12T10:00:00-06:00",
+            "end_time": "2026-03-12T10:30:00-06:00",
+            "patient_id": patient_id,
+            "provider_id": p1.id,
+            "service_id": s1.id,
+            "patient_name": "Alice Example",
+            "service_name": s1.name,
+            "reason": "bulk",
+        },
+    )
+    appointment_id = resp.json()["appointment_id"]
+
+    def _refuse_commit(session):
+        raise RuntimeError("connection lost")
+
+    event.listen(SASession, "before_commit", _refuse_commit)
+    try:
+        resp = client.delete(
+            "/api/appointments/bulk/date/2026-03-12",
+            headers={"Accept": "application/x-ndjson"},
+        )
+    finally:
+        event.remove(SASession, "before_commit", _refuse_commit)
+
+    assert resp.status_code == 200
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines[0]["status"] == "started"
+    assert "connection lost" in lines[-1]["error"]
+    assert lines[-1]["summary"] == {"deleted": 0, "failed": 1}
+    db_session.expire_all()
+    assert db_session.get(Appointment, appointment_id) is not None
+
+
+def test_bulk_delete_by_date_isolates_a_failing_row(client, db_session):
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session as SASession
+
+    from database.models import Appointment
+
+    p1, _, s1 = seed_providers_and_services(db_session)
+    patient_id = create_patient_without_phone(client)
+    ids = []
+    for hour, reason in ((10, "keep"), (14, "drop")):
+        resp = client.post(
+            "/api/appointments",
+            json={
+                "start_time": f"2026-03-12T{hour}:00:00-06:00",
+                "end_time": f"2026-03-12T{hour}:30:00-06:00",
+                "patient_id": patient_id,
+                "provider_id": p1.id,
+                "service_id": s1.id,
+                "patient_name": "Alice Example",
+                "service_name": s1.name,
+                "reason": reason,
+            },
+        )
+        ids.append(resp.json()["appointment_id"])
+    locked_id, free_id = ids
+
+    def _refuse_locked(session, flush_context, instances):
+        if any(getattr(obj, "id", None) == locked_id for obj in session.deleted):
+            raise RuntimeError("still referenced")
+
+    event.listen(SASession, "before_flush", _refuse_locked)
+    try:
+        data = client.delete("/api/appointments/bulk/date/2026-03-12").json()
+    finally:
+        event.remove(SASession, "before_flush", _refuse_locked)
+
+    assert (data["deleted"], data["failed"]) == (1, 1)
+    assert data["deleted_ids"] == [free_id]
+    assert data["failed_ids"] == [locked_id]
+    db_session.expire_all()
+    assert db_session.get(Appointment, free_id) is None
+    assert db_session.get(Appointment, locked_id) is not None
+
+
 # ---------------------------------------------------------------------------
 # Patient verify
 # ---------------------------------------------------------------------------
@@ -629,6 +996,40 @@ def test_verify_patient_normalizes_mixed_phone_formats(client):
     assert verify_resp2.json()["patient_id"] == patient_id
 
 
+def test_verify_patient_after_phone_update(client):
+    """Updating the phone re-keys phone_normalized; the old number stops matching."""
+    create_resp = client.post("/api/patients", json={
+        "first_name": "Eve", "last_name": "Mover",
+        "phone": "4035550001", "dob": "1980-02-02",
+    })
+    patient_id = create_resp.json()["id"]
+    client.put(f"/api/patients/{patient_id}", json={"phone": "+1 (587) 555-0002"})
+
+    new_resp = client.post("/api/patients/verify", json={"phone": "5875550002", "dob": "1980-02-02"})
+    assert new_resp.status_code == 200, new_resp.text
+    assert new_resp.json()["patient_id"] == patient_id
+    old_resp = client.post("/api/patients/verify", json={"phone": "4035550001", "dob": "1980-02-02"})
+    assert old_resp.status_code == 404
+
+
+def test_update_patient_ignores_identity_and_tenancy_keys(client):
+    pid = client.post("/api/patients", json={"first_name": "Ida", "last_name": "Keep", "phone": "4035550003"}).json()["id"]
+    resp = client.put(f"/api/patients/{pid}", json={"id": "hijack", "clinic_id": "other", "email": "ida@example.com"})
+    assert resp.status_code == 200
+    assert resp.json()["id"] == pid
+    assert resp.json()["email"] == "ida@example.com"
+    assert client.get(f"/api/patients/{pid}").status_code == 200
+
+
+def test_update_patient_parses_dob_and_keeps_unsent_fields(client):
+    pid = client.post("/api/patients", json={"first_name": "Jo", "email": "jo@example.com"}).json()["id"]
+    resp = client.put(f"/api/patients/{pid}", json={"dob": "1990-05-06"})
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["dob"] == "1990-05-06"
+    assert resp.json()["email"] == "jo@example.com"
+    assert client.put(f"/api/patients/{pid}", json={"dob": "not-a-date"}).status_code == 422
+
+
 def test_create_patient_response_includes_dob(client):
     """PatientResponse should surface the persisted dob so callers can verify
     round-trip and surface "DOB on file" in the CRM UI. Currently the field
@@ -685,6 +1086,50 @@ def test_leads_crud_flow(client):
     assert status_resp.json()["status"] == "CONVERTED"
 
 
+def test_create_lead_does_not_read_the_row_back(client, db_engine):
+    from sqlalchemy import event
+
+    lead_selects = []
+
+    def _count(conn, cursor, statement, *args):
+        if statement.lstrip().startswith("SELECT leads."):
+            lead_selects.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _count)
+    try:
+        resp = client.post("/api/leads", json={"name": "Lead1", "source": "fb"})
+    finally:
+        event.remove(db_engine, "before_cursor_execute", _count)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert (body["status"], body["source"]) == ("NEW", "fb")
+    assert body["id"] and body["created_at"]
+    assert lead_selects == []
+
+
+def test_lead_status_update_reads_the_lead_once(client, db_engine):
+    from sqlalchemy import event
+
+    lead_id = client.post("/api/leads", json={"name": "Lead1"}).json()["id"]
+    lead_selects = []
+
+    def _count(conn, cursor, statement, *args):
+        # ORM loads only; the PHI audit listener reads the prior row itself.
+        if statement.lstrip().startswith("SELECT leads."):
+            lead_selects.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _count)
+    try:
+        resp = client.put(f"/api/leads/{lead_id}/status", json={"status": "contacted"})
+    finally:
+        event.remove(db_engine, "before_cursor_execute", _count)
+
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "CONTACTED"
+    assert len(lead_selects) == 1, lead_selects
+
+
 # ---------------------------------------------------------------------------
 # Clinics
 # ---------------------------------------------------------------------------
@@ -62,3 +62,20 @@ def test_by_did_normalizes_input(pg_client, seeded_routing):
 def test_by_did_404_for_unknown(pg_client, seeded_routing):
     resp = pg_client.get("/api/clinics/by-did/+19999999999")
     assert resp.status_code == 404
+
+
+def test_by_did_cache_rechecks_hits_against_routing(seeded_routing):
+    from database.models import ClinicRouting
+    from api.v1.clinics.resolver import invalidate_did_cache, resolve_clinic_id_for_did
+
+    invalidate_did_cache()
+    assert resolve_clinic_id_for_did(seeded_routing, "+15871234567") == "clinic-x"
+
+    # Reassigned without clearing this process's cache (as on another
+    # instance): the stale hit must not be served.
+    routing = seeded_routing.query(ClinicRouting).filter_by(clinic_id="clinic-x").one()
+    routing.dids = ["+15870001111"]
+    seeded_routing.flush()
+    assert resolve_clinic_id_for_did(seeded_routing, "+15871234567") is None
+    assert resolve_clinic_id_for_did(seeded_routing, "+15870001111") == "clinic-x"
+    invalidate_did_cache()
@@ -292,6 +292,57 @@ def test_v1_create_appointment_response_shape(client, db_session):
     assert_shape(r.json(), APPOINTMENT_RESPONSE_KEYS)
 
 
+def test_v1_create_appointment_unknown_refs_404(client, db_session):
+    provider, service = seed_basic(db_session)
+    pat = client.post("/api/patients", json={"first_name": "X", "last_name": "Y", "phone": "5551113333"}).json()
+    body = {
+        "start_time": "2026-03-10T10:00:00-06:00",
+        "end_time": "2026-03-10T10:30:00-06:00",
+        "patient_id": pat["id"], "provider_id": provider.id, "service_id": service.id,
+        "patient_name": "X Y", "service_name": service.name, "reason": "Test",
+    }
+    for field, missing, detail in (("patient_id", "no-such-patient", "Patient not found"),
+                                   ("provider_id", 999999, "Provider not found"),
+                                   ("service_id", 999999, "Service not found")):
+        r = client.post("/api/calendar/events", json={**body, field: missing})
+        assert r.status_code == 404, field
+        assert r.json()["detail"] == detail
+
+
+def test_v1_create_appointment_malformed_time_422(client, db_session):
+    provider, service = seed_basic(db_session)
+    r = client.post("/api/calendar/events", json={
+        "start_time": "next tuesday", "end_time": "2026-03-10T10:30:00-06:00",
+        "patient_id": "p", "provider_id": provider.id, "service_id": service.id,
+        "patient_name": "X Y", "service_name": service.name, "reason": "Test",
+    })
+    assert r.status_code == 422
+    assert r.json()["detail"] == (
+        "Invalid start_time format: Invalid isoformat string: 'next tuesday'. "
+        "Expected ISO datetime format."
+    )
+
+
+def test_appointment_create_request_raises_validation_error_outside_http():
+    import pydantic
+    from api.v1.appointments.schemas import AppointmentCreateRequest
+
+    with pytest.raises(pydantic.ValidationError):
+        AppointmentCreateRequest.model_validate({
+            "start_time": "next tuesday", "end_time": "2026-03-10T10:30:00-06:00",
+            "patient_id": "p", "provider_id": 1, "patient_name": "X Y",
+            "service_name": "S", "reason": "Test",
+        })
+
+
+def test_v1_create_appointment_other_validation_errors_keep_list_shape(client, db_session):
+    r = client.post("/api/calendar/events", json={
+        "start_time": "2026-03-10T10:00:00-06:00", "end_time": "2026-03-10T10:30:00-06:00",
+    })
+    assert r.status_code == 422
+    assert isinstance(r.json()["detail"], list)
+
+
 def test_v1_appointments_list_and_get(client, booked):
     r = client.get("/api/appointments")
     assert r.status_code == 200
@@ -384,6 +435,11 @@ def test_v1_appointment_conflict_409(client, booked):
     assert isinstance(detail, dict)
     assert "conflicting_appointments" in detail
     assert "requested_time" in detail
+    assert_shape(detail["conflicting_appointments"][0], {
+        "appointment_id": str, "start_time": str, "end_time": str,
+        "patient_id": str, "status": str,
+    })
+    assert detail["conflicting_appointments"][0]["start_time"] == "2026-03-09T16:00:00"
 
 
 def test_v1_appointment_bulk_delete_dry_run(client, booked):
@@ -5,7 +5,9 @@ stalled checkout fails fast (well under the ~120s request timeout that produced
 the silent CRM spinner) instead of hanging on the 30s SQLAlchemy default.
 """
 
-from database.connection import build_engine_kwargs
+import os
+
+from database.connection import build_engine_kwargs, load_env_files
 
 
 def test_postgres_engine_sets_pool_timeout_10():
@@ -23,3 +25,52 @@ def test_sqlite_engine_has_no_pool_timeout():
     kwargs = build_engine_kwargs("sqlite:////tmp/dental_clinic.db")
     assert "pool_timeout" not in kwargs
     assert kwargs["connect_args"] == {"check_same_thread": False}
+
+
+def test_postgres_url_mentioning_sqlite_still_gets_the_pool():
+    kwargs = build_engine_kwargs("postgresql://u:p@host/sqlite_migration")
+    assert kwargs["pool_timeout"] == 10
+
+
+def test_pool_budget_overridable_per_deployment(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "8")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "4")
+    kwargs = build_engine_kwargs("postgresql://u:p@host/db")
+    assert (kwargs["pool_size"], kwargs["max_overflow"]) == (8, 4)
+    assert kwargs["pool_timeout"] == 10
+
+
+def test_pooler_only_url_params_are_stripped():
+    from database.connection import strip_non_libpq_params
+
+    url = "postgresql://u:p@host:6543/db?pgbouncer=true&connect_timeout=15&supa=base-pooler.x"
+    assert strip_non_libpq_params(url) == "postgresql://u:p@host:6543/db?connect_timeout=15"
+    plain = "postgresql://u:p@host/db?sslmode=require"
+    assert strip_non_libpq_params(plain) == plain
+    only_pooler = "postgresql://u:p@host/db?supa=base-pooler.x"
+    assert strip_non_libpq_params(only_pooler) == "postgresql://u:p@host/db"
+    lookalike = "postgresql://u:p@host/db?application_name=nosupa=1&a=2"
+    assert strip_non_libpq_params(lookalike) == lookalike
+
+
+def test_env_file_still_loaded_when_database_url_exported(monkeypatch, tmp_path):
+    # run_local.sh exports DATABASE_URL; the .env must still supply the rest.
+    for name in ("VERCEL", "K_SERVICE", "DENTAL_TEST_ENV_KEY"):
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///./exported.db")
+    (tmp_path / ".env").write_text(
+        "DATABASE_URL=postgresql://from-file/db\nDENTAL_TEST_ENV_KEY=loaded\n"
+    )
+    load_env_files([str(tmp_path)])
+    assert os.environ["DENTAL_TEST_ENV_KEY"] == "loaded"
+    assert os.environ["DATABASE_URL"] == "sqlite:///./exported.db"
+
+
+def test_env_files_skipped_on_hosted_platform(monkeypatch, tmp_path):
+    monkeypatch.setenv("DENTAL_TEST_ENV_KEY", "")
+    monkeypatch.delenv("DENTAL_TEST_ENV_KEY")
+    monkeypatch.setenv("K_SERVICE", "dental-api")
+    (tmp_path / ".env").write_text("DENTAL_TEST_ENV_KEY=loaded\n")
+    load_env_files([str(tmp_path)])
+    assert "DENTAL_TEST_ENV_KEY" not in os.environ
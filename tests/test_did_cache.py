@@ -0,0 +1,59 @@
+"""DID -> clinic_id cache in api.v1.clinics.resolver.
+
+clinic_routing.dids is a Postgres TEXT[] (not creatable on SQLite), so the two
+DB reads are stubbed here; tests/test_clinic_routing_endpoint.py covers them
+against Postgres.
+"""
+from __future__ import annotations
+
+import pytest
+
+from api.v1.clinics import resolver
+
+
+@pytest.fixture
+def routing(monkeypatch):
+    """clinic_id -> dids, plus a log of which lookup ran."""
+    table = {"clinic-a": ["+15871234567"], "clinic-b": []}
+    calls = []
+
+    def clinic_id_for_did(db, did):
+        calls.append("scan")
+        return next((cid for cid, dids in table.items() if did in dids), None)
+
+    def clinic_dids(db, clinic_id):
+        calls.append("recheck")
+        return table.get(clinic_id, [])
+
+    monkeypatch.setattr(resolver, "_clinic_id_for_did", clinic_id_for_did)
+    monkeypatch.setattr(resolver, "_clinic_dids", clinic_dids)
+    resolver.invalidate_did_cache()
+    yield table, calls
+    resolver.invalidate_did_cache()
+
+
+def test_hit_is_served_after_recheck(routing):
+    _, calls = routing
+    assert resolver.resolve_clinic_id_for_did(None, "+1 (587) 123-4567") == "clinic-a"
+    assert resolver.resolve_clinic_id_for_did(None, "+15871234567") == "clinic-a"
+    assert calls == ["scan", "recheck"]
+
+
+def test_did_reassigned_on_another_instance_is_not_served_stale(routing):
+    table, _ = routing
+    assert resolver.resolve_clinic_id_for_did(None, "+15871234567") == "clinic-a"
+
+    # Moved to clinic-b by a PUT handled elsewhere: no local invalidation.
+    table["clinic-a"], table["clinic-b"] = [], ["+15871234567"]
+    assert resolver.resolve_clinic_id_for_did(None, "+15871234567") == "clinic-b"
+
+    table["clinic-b"] = []
+    assert resolver.resolve_clinic_id_for_did(None, "+15871234567") is None
+
+
+def test_misses_are_not_cached(routing):
+    table, calls = routing
+    assert resolver.resolve_clinic_id_for_did(None, "+15875550000") is None
+    table["clinic-b"] = ["+15875550000"]
+    assert resolver.resolve_clinic_id_for_did(None, "+15875550000") == "clinic-b"
+    assert calls == ["scan", "scan"]
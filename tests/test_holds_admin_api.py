@@ -33,6 +33,8 @@ def test_list_pending_holds(client, seed_clinic_via_session):
     assert resp.status_code == 200
     assert len(resp.json()) == 1
     assert resp.json()[0]["source"] == "booking-web-hold"
+    assert resp.json()[0]["provider_name"] == "Soheil"
+    assert resp.json()[0]["patient_phone"]
 
 
 def test_confirm_hold_endpoint(client, seed_clinic_via_session):
@@ -0,0 +1,35 @@
+"""database.loading.list_options: raiseload("*") only when RAISE_ON_LAZY_LOAD is on."""
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import joinedload
+
+from database.loading import list_options
+from database.models import Appointment, Patient, Provider
+
+
+def test_list_options_passthrough_when_disabled(monkeypatch):
+    monkeypatch.delenv("RAISE_ON_LAZY_LOAD", raising=False)
+    loader = joinedload(Appointment.patient)
+    assert list_options(loader) == [loader]
+    assert list_options() == []
+
+
+def test_list_options_raise_on_lazy_relationship_access(monkeypatch, db_session):
+    monkeypatch.setenv("RAISE_ON_LAZY_LOAD", "1")
+    provider = Provider(clinic_id="default", name="Soheil", is_active=True)
+    patient = Patient(clinic_id="default", first_name="Jane", last_name="Doe")
+    db_session.add_all([provider, patient])
+    db_session.flush()
+    db_session.add(Appointment(
+        clinic_id="default", patient_id=patient.id, provider_id=provider.id,
+        start_time=datetime(2026, 3, 11, 16), end_time=datetime(2026, 3, 11, 17),
+    ))
+    db_session.commit()
+    db_session.expunge_all()
+
+    apt = db_session.query(Appointment).options(*list_options(joinedload(Appointment.patient))).one()
+    assert apt.patient.first_name == "Jane"
+    with pytest.raises(InvalidRequestError):
+        apt.provider
@@ -201,3 +201,65 @@ def test_dispatch_releases_session_before_blocking_send(db_session, db_engine, m
     row = db_session.query(AppointmentReminder).filter_by(id=reminder_id).one()
     assert row.status == "sent"
     assert row.sent_at is not None
+
+
+def test_collect_due_reminders_query_count_is_independent_of_batch_size(db_session, db_engine):
+    """Appointments, patients and clinics are prefetched per batch, not
+    looked up once per reminder."""
+    for _ in range(3):
+        _seed_due_sms_reminder(db_session)
+
+    statements = []
+
+    def _count(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _count)
+    try:
+        due = reminder_scheduler._collect_due_reminders(_tracking_factory(db_engine, checked_out=None))
+    finally:
+        event.remove(db_engine, "before_cursor_execute", _count)
+
+    assert len([d for d in due if d.body]) == 3
+    # reminders, appointments+patients (joined), clinics
+    assert len(statements) == 3, statements
+
+
+def test_send_phase_runs_reminder_sends_concurrently(monkeypatch):
+    """Independent sends overlap: three sends that each wait for the other two
+    only all succeed if they are in flight at the same time."""
+    import threading
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    def send_waits_for_peers(to_phone, body):
+        barrier.wait()
+        return True
+
+    monkeypatch.setattr(_sms_client, "_send_sms_sync", send_waits_for_peers)
+    due = [
+        reminder_scheduler._DueReminder(reminder_id=str(i), channel="sms", phone="+14035551234", body="hi")
+        for i in range(3)
+    ]
+
+    results = asyncio.run(reminder_scheduler._send_reminders(due))
+
+    assert [r.reminder_id for r in results] == ["0", "1", "2"]
+    assert [r.status for r in results] == ["sent", "sent", "sent"]
+
+
+def test_persist_writes_batch_and_skips_vanished_reminders(db_session, db_engine):
+    reminder_id = _seed_due_sms_reminder(db_session)
+    results = [
+        reminder_scheduler._ReminderResult(
+            reminder_id=reminder_id, status="failed", failure_reason="SMS send failed",
+        ),
+        reminder_scheduler._ReminderResult(reminder_id="deleted-meanwhile", status="sent"),
+    ]
+
+    reminder_scheduler._persist_reminder_results(_tracking_factory(db_engine, checked_out=None), results)
+
+    db_session.expire_all()
+    row = db_session.query(AppointmentReminder).filter_by(id=reminder_id).one()
+    assert (row.status, row.failure_reason, row.sent_at) == ("failed", "SMS send failed", None)
@@ -10,7 +10,11 @@ from sqlalchemy.pool import StaticPool
 
 from database.connection import Base
 from database.models import (
+    Appointment,
+    AppointmentStatus,
     Clinic,
+    Lead,
+    LeadStatus,
     Provider,
     ProviderBusyBlock,
     Service,
@@ -101,3 +105,18 @@ def test_seed_market_mall_denture_creates_expected_data(db_session):
         ProviderBusyBlock.clinic_id == MARKET_MALL_CLINIC_ID
     ).all()
     assert len(blocks) == 22
+
+
+@pytest.mark.parametrize(
+    "column, enum_cls, type_name",
+    [
+        (Appointment.__table__.c.status, AppointmentStatus, "appointmentstatus"),
+        (Lead.__table__.c.status, LeadStatus, "leadstatus"),
+    ],
+)
+def test_status_columns_map_to_native_postgres_enums(column, enum_cls, type_name):
+    """Status columns stay native Postgres enums whose type name and labels
+    match the ones the baseline migration created."""
+    assert column.type.native_enum
+    assert column.type.name == type_name
+    assert column.type.enums == [s.value for s in enum_cls]
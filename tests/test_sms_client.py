@@ -151,3 +151,43 @@ def test_reschedule_sms_appends_contact_like_booking():
     assert "rescheduled to" in b
     assert "Address: 9 Oak Ave" in b
     assert "Feel free to call us at 111-222-3333." in b
+
+
+def test_twilio_client_reused_across_sends_and_dropped_on_auth_error(monkeypatch):
+    import twilio.rest
+    import clients.sms_client as sms
+
+    built = []
+
+    class FakeMessages:
+        def __init__(self):
+            self.fail_with = None
+
+        def create(self, **kwargs):
+            if self.fail_with:
+                raise self.fail_with
+            return type("Msg", (), {"sid": "SM1"})()
+
+    class FakeClient:
+        def __init__(self, sid, token):
+            built.append((sid, token))
+            self.messages = FakeMessages()
+
+    class AuthError(Exception):
+        status = 401
+
+    monkeypatch.setenv("TWILIO_ACCOUNT_SID", "ACreuse")
+    monkeypatch.setenv("TWILIO_AUTH_TOKEN", "tok")
+    monkeypatch.setenv("TWILIO_PHONE_NUMBER", "+15550000000")
+    monkeypatch.setattr(twilio.rest, "Client", FakeClient)
+    sms._twilio_client.cache_clear()
+
+    assert sms._send_via_twilio(to="+15551230000", body="a") == "SM1"
+    assert sms._send_via_twilio(to="+15551230000", body="b") == "SM1"
+    assert len(built) == 1
+
+    sms._twilio_client("ACreuse", "tok").messages.fail_with = AuthError("bad creds")
+    assert sms._send_via_twilio(to="+15551230000", body="c") is None
+    assert sms._send_via_twilio(to="+15551230000", body="d") == "SM1"
+    assert len(built) == 2
+    sms._twilio_client.cache_clear()
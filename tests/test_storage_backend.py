@@ -22,6 +22,7 @@ def test_local_backend_put_stat_read_delete(tmp_path):
 
     be.delete(key)
     assert be.stat(key) is None  # gone
+    be.delete(key)  # deleting a missing key is a no-op
 
 
 def test_local_backend_signed_urls_are_sentinels(tmp_path):
@@ -84,6 +84,17 @@ def test_delete_by_date_targets_clinic_local_day(client, seed_clinic_via_session
     assert resp2.json()["appointments_found"] == 0
 
 
+def test_clinic_day_bounds_follow_dst_transitions():
+    """Day windows end at the next local midnight, so DST days are 23h/25h."""
+    from api.v1.appointments.router import _clinic_day_bounds
+
+    clinic = Clinic(id=CID, name="TZ Query Clinic", timezone="America/Edmonton")
+    start, next_day = _clinic_day_bounds(datetime(2026, 3, 8).date(), clinic)
+    assert (start, next_day) == (datetime(2026, 3, 8, 7), datetime(2026, 3, 9, 6))
+    start, next_day = _clinic_day_bounds(datetime(2025, 11, 2).date(), clinic)
+    assert (start, next_day) == (datetime(2025, 11, 2, 6), datetime(2025, 11, 3, 7))
+
+
 def _book(client, start_local, end_local):
     return client.post("/api/calendar/events", headers=_headers(), json={
         "start_time": start_local, "end_time": end_local,
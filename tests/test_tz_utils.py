@@ -98,8 +98,8 @@ def test_storage_utc_clinic_summer_localizes_to_mdt(edmonton_clinic):
 
 def test_storage_utc_clinic_winter_localizes_to_mst(edmonton_clinic):
     """Naive 09:00 clinic-local in winter (MST, -07:00) → 16:00 naive UTC."""
-    result = to_storage_utc_clinic(datetime(2026, 12, 25, 9, 0), edmonton_clinic)
-    assert result == datetime(2026, 12, 25, 16, 0)
+    result = to_storage_utc_clinic(datetime(2025, 12, 25, 9, 0), edmonton_clinic)
+    assert result == datetime(2025, 12, 25, 16, 0)
     assert result.tzinfo is None
 
 
@@ -134,3 +134,19 @@ def test_storage_utc_clinic_is_inverse_of_to_clinic_local(edmonton_clinic):
     assert (back.year, back.month, back.day, back.hour, back.minute) == (
         2026, 6, 25, 14, 0,
     )
+
+
+def test_storage_utc_clinic_ambiguous_fall_back_hour_resolves_to_standard(edmonton_clinic):
+    """01:30 on the fall-back day occurs twice; pick MST (-07:00) like pytz is_dst=False."""
+    result = to_storage_utc_clinic(datetime(2025, 11, 2, 1, 30), edmonton_clinic)
+    assert result == datetime(2025, 11, 2, 8, 30)
+
+
+def test_storage_utc_clinic_uses_the_slot_engine_tz_database(edmonton_clinic):
+    """Writes resolve offsets from the same pytz data the slot engine uses."""
+    import pytz
+
+    tz = pytz.timezone("America/Edmonton")
+    for wall in (datetime(2026, 11, 1, 9, 0), datetime(2027, 1, 15, 9, 0)):
+        expected = tz.localize(wall).astimezone(timezone.utc).replace(tzinfo=None)
+        assert to_storage_utc_clinic(wall, edmonton_clinic) == expected
@@ -74,6 +74,19 @@ def test_calendar_create_localizes_naive_input(client, seed_clinic_via_session,
     assert row.end_time == EXPECTED_UTC_END
 
 
+def test_calendar_create_accepts_zulu_suffix(client, seed_clinic_via_session, db_session):
+    seed_clinic_via_session(_seed_clinic_provider_patient)
+    resp = client.post("/api/calendar/events", headers=_headers(), json={
+        "start_time": "2026-06-25T20:00:00Z", "end_time": "2026-06-25T21:00:00Z",
+        "patient_id": "pat-1", "provider_id": 201, "service_id": None,
+        "patient_name": "Jane Doe", "service_name": "Consultation", "reason": "x",
+    })
+    assert resp.status_code == 200, resp.text
+    row = db_session.query(Appointment).filter_by(id=resp.json()["appointment_id"]).one()
+    assert row.start_time == EXPECTED_UTC_START
+    assert row.end_time == EXPECTED_UTC_END
+
+
 def test_appointment_update_localizes_naive_input(client, seed_clinic_via_session, db_session):
     seed_clinic_via_session(_seed_clinic_provider_patient)
     # Create with an aware time first (unaffected by the fix), then update with naive.
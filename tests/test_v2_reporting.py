@@ -1,6 +1,10 @@
 """Tests for v2 reporting endpoints."""
+from datetime import datetime, timedelta
+
 import pytest
 
+from database.models import Appointment, AppointmentStatus, Patient, Provider
+
 
 def test_kpi_endpoint(client):
     """GET /api/v2/reporting/kpi returns KPI data."""
@@ -13,6 +17,37 @@ def test_kpi_endpoint(client):
     assert "lab_cost_per_case" in data
 
 
+def test_kpi_no_show_rate(client, db_session):
+    """no_show_rate = no-shows / appointments started in the last 90 days."""
+    provider = Provider(clinic_id="default", name="Dr. Rate", is_active=True)
+    patient = Patient(clinic_id="default", first_name="Nora", last_name="Show")
+    db_session.add_all([provider, patient])
+    db_session.flush()
+    recent = datetime.utcnow() - timedelta(days=3)
+    for i, status in enumerate([
+        AppointmentStatus.NO_SHOW,
+        AppointmentStatus.COMPLETED,
+        AppointmentStatus.COMPLETED,
+        AppointmentStatus.SCHEDULED,
+    ]):
+        start = recent + timedelta(hours=i)
+        db_session.add(Appointment(
+            clinic_id="default", patient_id=patient.id, provider_id=provider.id,
+            start_time=start, end_time=start + timedelta(minutes=30), status=status,
+        ))
+    # Outside the 90-day window: counted in neither total nor no-shows.
+    old = datetime.utcnow() - timedelta(days=120)
+    db_session.add(Appointment(
+        clinic_id="default", patient_id=patient.id, provider_id=provider.id,
+        start_time=old, end_time=old + timedelta(minutes=30), status=AppointmentStatus.NO_SHOW,
+    ))
+    db_session.commit()
+
+    resp = client.get("/api/v2/reporting/kpi", headers={"X-Clinic-Id": "default"})
+    assert resp.status_code == 200
+    assert resp.json()["no_show_rate"] == 0.25
+
+
 def test_production_by_provider(client):
     """GET /api/v2/reporting/production-by-provider returns provider production."""
     resp = client.get("/api/v2/reporting/production-by-provider", headers={"X-Clinic-Id": "default"})
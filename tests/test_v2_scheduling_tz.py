@@ -168,7 +168,7 @@ def test_v2_recurrence_cross_zone_aware_input_keeps_clinic_local_wall_clock(clie
 
 
 def test_v2_recurrence_keeps_wall_clock_across_dst_fall_back(client, db_session):
-    """Weekly recurrence spanning the Nov 1, 2026 fall-back (MDT -6 -> MST -7)
+    """Weekly recurrence spanning the Nov 2, 2025 fall-back (MDT -6 -> MST -7)
     must keep a CONSTANT clinic-local wall time (09:00 Edmonton) while the stored
     naive-UTC shifts at the boundary (15:00 UTC before, 16:00 UTC after).
 
@@ -182,8 +182,8 @@ def test_v2_recurrence_keeps_wall_clock_across_dst_fall_back(client, db_session)
     clinic = db_session.query(Clinic).filter(Clinic.id == _CID).first()
 
     resp = client.post("/api/v2/scheduling/appointments", json={
-        "start_time": "2026-10-26T09:00:00",
-        "end_time": "2026-10-26T10:00:00",
+        "start_time": "2025-10-27T09:00:00",
+        "end_time": "2025-10-27T10:00:00",
         "patient_id": patient.id,
         "provider_id": provider.id,
         "patient_name": "T",
@@ -204,13 +204,13 @@ def test_v2_recurrence_keeps_wall_clock_across_dst_fall_back(client, db_session)
         assert to_clinic_local(r.start_time, clinic).hour == 9, r.start_time
 
     # Stored naive-UTC shifts at the DST boundary:
-    # 2026-10-26 09:00 MDT (-6) == 15:00 UTC
-    # 2026-11-02 09:00 MST (-7) == 16:00 UTC
-    # 2026-11-09 09:00 MST (-7) == 16:00 UTC
+    # 2025-10-27 09:00 MDT (-6) == 15:00 UTC
+    # 2025-11-03 09:00 MST (-7) == 16:00 UTC
+    # 2025-11-10 09:00 MST (-7) == 16:00 UTC
     expected = [
-        datetime(2026, 10, 26, 15, 0, 0),
-        datetime(2026, 11, 2, 16, 0, 0),
-        datetime(2026, 11, 9, 16, 0, 0),
+        datetime(2025, 10, 27, 15, 0, 0),
+        datetime(2025, 11, 3, 16, 0, 0),
+        datetime(2025, 11, 10, 16, 0, 0),
     ]
     assert [r.start_time for r in rows] == expected, [r.start_time for r in rows]
 
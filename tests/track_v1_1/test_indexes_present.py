@@ -3,13 +3,14 @@ from sqlalchemy import inspect
 
 
 REQUIRED_INDEXES = {
-    "patients": {"ix_patients_clinic"},
+    "patients": {"ix_patients_clinic", "ix_patients_clinic_phone_normalized"},
     "appointments": {
         "ix_appointments_clinic_start",
         "ix_appointments_clinic_status",
         "ix_appointments_patient_start",
+        "ix_appointments_clinic_provider_status_time",
     },
-    "leads": {"ix_leads_clinic_status"},
+    "leads": {"ix_leads_clinic_status", "ix_leads_clinic_status_created"},
     "invoices": {"ix_invoices_clinic_status"},
     "insurance_claims": {"ix_claims_clinic_status"},
     "appointment_reminders": {"ix_appt_reminders_status_due"},
@@ -29,3 +30,35 @@ def test_required_indexes_exist(db_engine):
         actual = {idx["name"] for idx in insp.get_indexes(table)}
         missing = expected - actual
         assert not missing, f"Missing indexes on {table}: {missing}. Got {actual}"
+
+
+def test_reschedule_conflict_probe_searches_provider_time_index(db_engine):
+    """The reschedule overlap probe must range-scan the composite index, not
+    walk every appointment for the provider."""
+    from datetime import datetime
+
+    from services.appointments import _OVERLAP_EXISTS, _overlap_params
+
+    params = _overlap_params(
+        clinic_id="default", provider_id=1,
+        start=datetime(2026, 3, 10, 16), end=datetime(2026, 3, 10, 17),
+        excluding_appointment_id="appt-1",
+    )
+    sql = str(_OVERLAP_EXISTS[True].params(**params).compile(
+        db_engine, compile_kwargs={"literal_binds": True},
+    ))
+    with db_engine.connect() as conn:
+        plan = " ".join(row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+    assert "USING INDEX ix_appointments_clinic_provider_status_time" in plan, plan
+
+
+def test_day_range_delete_scan_uses_clinic_start_index(db_engine):
+    """DELETE /api/appointments/bulk/date/{date} selects one clinic's day by
+    start_time range; that must be an index range scan."""
+    with db_engine.connect() as conn:
+        plan = " ".join(row[-1] for row in conn.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT id FROM appointments "
+            "WHERE clinic_id = 'default' "
+            "AND start_time >= '2026-03-10 06:00:00' AND start_time < '2026-03-11 06:00:00'"
+        ))
+    assert "ix_appointments_clinic_start" in plan, plan